@@ -0,0 +1,53 @@
+"""
+EAGLE-I EJ Analyzer data engines.
+
+Streamlit-free building blocks used by the app (eaglei.ui, run by
+eagle_i_ej_analyzer_v3_complete.py) and by headless jobs such as eaglei.batch.
+
+Importing the package loads nothing else: the public functions below are
+resolved from their submodule on first access (PEP 562), so
+`from eaglei import query_data` pulls in eaglei.query and pandas only, never
+Streamlit, Plotly or SciPy.
+"""
+
+from importlib import import_module
+
+_EXPORTS = {
+    'eaglei.batch': ['run_batch'],
+    'eaglei.crosswalk': ['allocate_customers', 'build_crosswalk', 'utility_customers'],
+    'eaglei.cube': ['build_cube', 'rollup'],
+    'eaglei.datasets': ['county_table', 'eaglei_aggregates', 'eia861_crosswalk', 'eia861_sector_mix', 'ej_table', 'outage_base', 'outage_cube', 'snapshot_episodes', 'source_path'],
+    'eaglei.doe417': ['doe417_overlaps', 'doe417_timeline', 'outage_intervals'],
+    'eaglei.ej': ['composite_ej', 'synthetic_indicators'],
+    'eaglei.embedded': ['county_attributes', 'embedded_outages', 'embedded_yearly'],
+    'eaglei.events': ['build_event_store', 'event_plan', 'query_events'],
+    'eaglei.exports': ['export_bytes', 'iter_export', 'write_export'],
+    'eaglei.forecast': ['cached_forecasts', 'fit_forecasts', 'forecast'],
+    'eaglei.intervals': ['interval_index', 'overlap_join'],
+    'eaglei.live': ['append_batch', 'apply_batch', 'open_live'],
+    'eaglei.quality': ['analyze_missingness', 'merge_profiles', 'profile_csv', 'profile_frame', 'profile_report', 'profile_source'],
+    'eaglei.query': ['query_data', 'query_ej_data', 'query_plan', 'run_query'],
+    'eaglei.reliability': ['by_period', 'county_reliability', 'rolling', 'utility_reliability', 'window'],
+    'eaglei.report': ['report_table', 'report_text', 'write_report'],
+    'eaglei.scenarios': ['fit_rates', 'impact_summary', 'scenario', 'simulate', 'stress_cases'],
+    'eaglei.spatial': ['getis_ord_star', 'knn_weights', 'moran_global', 'moran_local'],
+    'eaglei.stats': ['correlation_tests'],
+    'eaglei.tiles': ['build_pyramid', 'view_cells'],
+}
+
+# Public name -> defining submodule
+_LAZY = {name: module for module, names in _EXPORTS.items() for name in names}
+
+__all__ = sorted(_LAZY)
+
+
+def __getattr__(name):
+    if name not in _LAZY:
+        raise AttributeError(f"module 'eaglei' has no attribute {name!r}")
+    value = getattr(import_module(_LAZY[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,120 @@
+"""
+Headless report generation for every region, county and year.
+
+    python -m eaglei.batch --out reports [--workers N] [--charts html|svg|png|none]
+
+The parent process loads the data exactly as the app does (no Streamlit) and
+builds the outage cube, its forecast models and the reliability prefix arrays
+once. The cube arrays are saved as .npy files that every worker memory-maps
+read-only, so the pool shares one copy of the data through the page cache
+instead of rebuilding or pickling it per worker; the small forecast and
+reliability arrays are passed to each worker as it starts.
+Scopes are dealt round-robin to the workers, and each writes the text, CSV
+and chart files of its reports.
+"""
+
+import argparse
+import os
+import shutil
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+
+import numpy as np
+from plotly.offline import get_plotlyjs
+
+from eaglei.cache import CACHE_DIR
+from eaglei.cube import Cube
+from eaglei.crosswalk import allocate_customers
+from eaglei.datasets import DATA_DIR, county_table, eaglei_aggregates, eia861_crosswalk, eia861_sector_mix, outage_base, outage_cube
+from eaglei.forecast import cached_forecasts
+from eaglei.live import open_live
+from eaglei.reliability import county_reliability
+from eaglei.report import CHART_FORMATS, report_scopes, write_report
+
+# Worker-process state set by _init_worker: the memory-mapped cube and the report options
+_WORKER = {}
+
+
+def load_report_cube(data_dir=None):
+    """Outage cube over the live aggregates (source data plus appended batches), built as the app builds it."""
+    agg = open_live(outage_base(eaglei_aggregates(data_dir))).tables['agg']
+    mix = eia861_sector_mix(data_dir)
+    return outage_cube(county_table(agg, mix), agg, mix)
+
+
+def load_report_reliability(cube, data_dir=None):
+    """County reliability prefix arrays over `cube`, with EIA-861 customers allocated as the app allocates them."""
+    return county_reliability(cube, allocate_customers(eia861_crosswalk(data_dir)))
+
+
+def share_cube(cube, directory):
+    """Save the cube arrays as .npy files in `directory`; returns what open_shared_cube needs besides it."""
+    for name, arr in {**cube.measures, 'split': cube.split}.items():
+        np.save(os.path.join(directory, f'{name}.npy'), arr)
+    return cube.dims, cube.groups, list(cube.measures)
+
+
+def open_shared_cube(directory, dims, groups, measures):
+    """Cube whose arrays are read-only memory maps of the files written by share_cube."""
+    load = lambda name: np.load(os.path.join(directory, f'{name}.npy'), mmap_mode='r')
+    return Cube(dims, {m: load(m) for m in measures}, groups, load('split'))
+
+
+def _init_worker(directory, shared, out_dir, charts, generated, forecasts, reliability):
+    _WORKER.update(cube=open_shared_cube(directory, *shared), out_dir=out_dir, charts=charts, generated=generated, forecasts=forecasts, reliability=reliability)
+
+
+def _render(scopes):
+    # Worker entry point: write every report of a batch of scopes
+    w = _WORKER
+    return [p for scope in scopes for p in write_report(w['cube'], scope, w['out_dir'], w['charts'], w['generated'], forecasts=w['forecasts'], reliability=w['reliability'])]
+
+
+def run_batch(out_dir, data_dir=None, workers=None, charts='html', by_year=True, generated=None):
+    """
+    Write the reports of every report_scopes scope under `out_dir`; returns the written paths.
+
+    `workers` sizes the process pool (None = all cores, 1 = in-process). With html charts
+    plotly.js is written once to out_dir/plotly.min.js and shared by every chart file.
+    """
+    cube = load_report_cube(data_dir)
+    forecasts = cached_forecasts(cube)
+    reliability = load_report_reliability(cube, data_dir)
+    scopes = report_scopes(cube, by_year)
+    os.makedirs(out_dir, exist_ok=True)
+    generated = generated or datetime.now()
+    if charts == 'html':
+        with open(os.path.join(out_dir, 'plotly.min.js'), 'w') as f:
+            f.write(get_plotlyjs())
+
+    workers = min(workers or os.cpu_count() or 1, len(scopes))
+    if workers == 1:
+        _WORKER.update(cube=cube, out_dir=out_dir, charts=charts, generated=generated, forecasts=forecasts, reliability=reliability)
+        return _render(scopes)
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    directory = tempfile.mkdtemp(prefix='report-cube-', dir=CACHE_DIR)
+    try:
+        shared = share_cube(cube, directory)
+        with ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(directory, shared, out_dir, charts, generated, forecasts, reliability)) as pool:
+            return [p for batch in pool.map(_render, [scopes[i::workers] for i in range(workers)]) for p in batch]
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m eaglei.batch', description='Write EAGLE-I outage reports for every region, county and year.')
+    parser.add_argument('--out', default='reports', help='output directory (default: reports)')
+    parser.add_argument('--data-dir', default=DATA_DIR, help='directory holding the source CSV files')
+    parser.add_argument('--workers', type=int, default=None, help='process pool size (default: all cores)')
+    parser.add_argument('--charts', choices=CHART_FORMATS + ('none',), default='html', help='chart format; svg/png need kaleido')
+    parser.add_argument('--no-years', action='store_true', help='only all-years reports, no per-year breakdown')
+    args = parser.parse_args(argv)
+    t0 = time.perf_counter()
+    paths = run_batch(args.out, args.data_dir, args.workers, None if args.charts == 'none' else args.charts, not args.no_years)
+    print(f'{len(paths):,} files written to {args.out} in {time.perf_counter() - t0:.1f}s')
+
+
+if __name__ == '__main__':
+    main()
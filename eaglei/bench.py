@@ -0,0 +1,194 @@
+"""
+Benchmarks of the hot paths on seeded synthetic data at multiples of today's data volume.
+
+    python -m eaglei.bench [--scales 1 10 100] [--repeat 3] [--out FILE] [--compare OLD.json]
+
+For each scale, eaglei.synthetic writes the EAGLE-I, DOE-417 and EIA-861 files
+to a scratch directory. The cases are then timed in a fresh subprocess whose
+columnar cache (EAGLEI_CACHE_DIR) points into that directory, so a run never
+touches the app's .eaglei_cache and every scale starts cold. Each case is
+timed `repeat` times and then run once more under tracemalloc for its peak
+Python/NumPy allocation; the subprocess's peak RSS is recorded as well.
+
+Results go to a JSON file tagged with the commit they were measured on, and
+--compare prints the ratio of each case to an earlier file. Everything runs
+offline: map cases build the Plotly figures without fetching tiles.
+"""
+
+import argparse
+import json
+import os
+import platform
+import resource
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+
+import pandas as pd
+
+from eaglei.datasets import DATA_DIR, county_table, ej_table, eaglei_aggregates, eia861_sector_mix, outage_base, source_path
+from eaglei.crosswalk import allocate_customers, build_crosswalk
+from eaglei.doe417 import doe417_events, read_doe417
+from eaglei.eia import read_eia861, sector_mix
+from eaglei.embedded import county_attributes
+from eaglei.events import build_event_store, encode_events, query_events
+from eaglei.ingest import aggregate_eaglei, read_eaglei_chunks
+from eaglei.quality import analyze_missingness
+from eaglei.query import query_data
+from eaglei.synthetic import write_synthetic
+from eaglei.tiles import build_pyramid, read_point_cells
+from eaglei.ui.maps import create_binned_map, create_map_with_legend
+
+DEFAULT_SCALES = (1, 10, 100)
+
+# Cases that hold every event in memory at once are skipped above this many events
+IN_MEMORY_EVENTS = 50_000_000
+
+QUERIES = ['top 10 by events', 'Bay Area with more than 2000 events', 'top 10 PSPS', 'high industrial', 'summary']
+EVENT_QUERIES = ['PSPS events in Butte longer than 12 hours in 2019', 'top 20 weather events by customers since 2018', 'weather events in Fresno in 2020']
+
+
+def measure(fn, repeat=3, warmup=True):
+    """
+    Wall times of `repeat` calls of fn() plus the tracemalloc peak of one more call.
+
+    With `warmup` an untimed first call absorbs one-off costs (lazy imports, Plotly
+    templates, compiled-query caches) so they do not skew small cases.
+    """
+    if warmup:
+        fn()
+    seconds = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        seconds.append(time.perf_counter() - t0)
+    tracemalloc.start()
+    try:
+        fn()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return {'seconds': seconds, 'best': min(seconds), 'median': statistics.median(seconds), 'peak_bytes': peak}
+
+
+def run_cases(data_dir, repeat=3):
+    """Time every hot path over the source files in `data_dir`; returns case name -> measure() result or {'skipped': reason}."""
+    eaglei_csv, doe417_csv, eia861_csv = (source_path(name, data_dir) for name in ('eaglei', 'doe417', 'eia861'))
+    attrs = county_attributes()
+    results = {}
+    # load_data: a cold parse of the sources, then the same tables served from the columnar cache
+    results['load_data (parse)'] = measure(lambda: county_table(outage_base(aggregate_eaglei(eaglei_csv)), sector_mix(allocate_customers(build_crosswalk(read_eia861(eia861_csv), attrs['population'])))), repeat, warmup=False)
+    df = county_table(outage_base(eaglei_aggregates(data_dir)), eia861_sector_mix(data_dir))
+    results['load_data (cached)'] = measure(lambda: county_table(outage_base(eaglei_aggregates(data_dir)), eia861_sector_mix(data_dir)), repeat)
+    results['load_ej'] = measure(lambda: ej_table(attrs, df), repeat)
+    results['query_data'] = measure(lambda: [query_data(df, q) for q in QUERIES], repeat)
+    results['analyze_missingness (counties)'] = measure(lambda: analyze_missingness(df), repeat)
+    results['create_map_with_legend'] = measure(lambda: create_map_with_legend(df, 'event_count', 'Event Count'), repeat)
+    results['load_point_tiles'] = measure(lambda: build_pyramid(read_point_cells(eaglei_csv)), repeat, warmup=False)
+    pyramid = build_pyramid(read_point_cells(eaglei_csv))
+    results['create_binned_map'] = measure(lambda: create_binned_map(pyramid, 'events', 'Events per map cell', 5, {'lat': 37.5, 'lon': -119.5}), repeat)
+
+    n = int(df['event_count'].sum())
+    if n > IN_MEMORY_EVENTS:
+        skipped = {'skipped': f'{n:,} events exceed IN_MEMORY_EVENTS ({IN_MEMORY_EVENTS:,})'}
+        return {**results, **{name: skipped for name in ('analyze_missingness (events)', 'load_event_store', 'query_events')}}
+    events = pd.concat(read_eaglei_chunks(eaglei_csv), ignore_index=True)
+    results['analyze_missingness (events)'] = measure(lambda: analyze_missingness(events), repeat)
+    counties = list(attrs.index)
+    parts = [encode_events(events, counties, source=0), encode_events(doe417_events(read_doe417(doe417_csv), counties), counties, source=1)]
+    del events
+    results['load_event_store'] = measure(lambda: build_event_store(parts, attrs), repeat)
+    store = build_event_store(parts, attrs)
+    results['query_events'] = measure(lambda: [query_events(store, q) for q in EVENT_QUERIES], repeat)
+    return results
+
+
+def _commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=DATA_DIR, capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_bench(scales=DEFAULT_SCALES, repeat=3, seed=0, work_dir=None, keep=False, log=print):
+    """
+    Benchmark every scale in its own subprocess over freshly generated data; returns the result document.
+
+    Data is written under `work_dir` (default: a temporary directory) and removed
+    afterwards unless `keep` is set.
+    """
+    root = work_dir or tempfile.mkdtemp(prefix='eaglei-bench-')
+    doc = {'commit': _commit(), 'created': datetime.now().isoformat(timespec='seconds'), 'python': platform.python_version(),
+           'pandas': pd.__version__, 'platform': platform.platform(), 'cpus': os.cpu_count(), 'seed': seed, 'repeat': repeat, 'scales': []}
+    try:
+        for scale in scales:
+            data_dir = os.path.join(root, f'scale-{scale:g}')
+            t0 = time.perf_counter()
+            rows = write_synthetic(data_dir, scale, seed)
+            log(f'scale {scale:g}: {rows["eaglei"]:,} events written in {time.perf_counter() - t0:.1f}s')
+            out = os.path.join(data_dir, 'results.json')
+            env = {**os.environ, 'EAGLEI_CACHE_DIR': os.path.join(data_dir, 'cache')}
+            subprocess.run([sys.executable, '-m', 'eaglei.bench', '--cases', data_dir, '--repeat', str(repeat), '--out', out], env=env, cwd=DATA_DIR, check=True)
+            with open(out) as f:
+                doc['scales'].append({'scale': scale, 'rows': rows, **json.load(f)})
+            for name, r in doc['scales'][-1]['cases'].items():
+                log(f'  {name:32s} ' + (r['skipped'] if 'skipped' in r else f"{r['best'] * 1e3:10.1f} ms  {r['peak_bytes'] / 2 ** 20:8.1f} MB"))
+            if not keep:
+                shutil.rmtree(data_dir, ignore_errors=True)
+    finally:
+        if not keep and not work_dir:
+            shutil.rmtree(root, ignore_errors=True)
+    return doc
+
+
+def compare(new, old):
+    """Rows of (scale, case, best-time ratio, peak-memory ratio) of `new` over `old` for cases measured in both."""
+    previous = {(s['scale'], name): r for s in old['scales'] for name, r in s['cases'].items()}
+    rows = []
+    for s in new['scales']:
+        for name, r in s['cases'].items():
+            before = previous.get((s['scale'], name))
+            if before and 'best' in r and 'best' in before:
+                rows.append((s['scale'], name, r['best'] / before['best'], r['peak_bytes'] / max(before['peak_bytes'], 1)))
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m eaglei.bench', description='Benchmark the EAGLE-I hot paths on synthetic data.')
+    parser.add_argument('--scales', type=float, nargs='+', default=DEFAULT_SCALES, help='multiples of the current data volume (default: 1 10 100)')
+    parser.add_argument('--repeat', type=int, default=3, help='timed calls per case (default: 3)')
+    parser.add_argument('--seed', type=int, default=0, help='synthetic data seed (default: 0)')
+    parser.add_argument('--out', help='result file (default: benchmarks/bench-<commit>-<time>.json)')
+    parser.add_argument('--compare', metavar='OLD', help='earlier result file to print ratios against')
+    parser.add_argument('--work-dir', help='where to write the synthetic data (kept afterwards)')
+    # Internal: run the cases over one data directory and write them to --out
+    parser.add_argument('--cases', metavar='DATA_DIR', help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.cases:
+        cases = run_cases(args.cases, args.repeat)
+        with open(args.out, 'w') as f:
+            json.dump({'peak_rss_bytes': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024, 'cases': cases}, f)
+        return
+
+    doc = run_bench(args.scales, args.repeat, args.seed, args.work_dir, keep=bool(args.work_dir))
+    out = args.out or os.path.join('benchmarks', f"bench-{doc['commit'] or 'local'}-{datetime.now():%Y%m%d-%H%M%S}.json")
+    os.makedirs(os.path.dirname(out) or '.', exist_ok=True)
+    with open(out, 'w') as f:
+        json.dump(doc, f, indent=1)
+    print(f'results written to {out}')
+    if args.compare:
+        with open(args.compare) as f:
+            old = json.load(f)
+        print(f"\nvs {args.compare} ({old.get('commit')}): time and peak-memory ratios, new / old")
+        for scale, name, t, m in compare(doc, old):
+            print(f'  {scale:>6g}x  {name:32s} {t:6.2f}x time  {m:6.2f}x memory')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,104 @@
+"""
+Persistent columnar cache for the source datasets.
+
+Each source is parsed once into a typed, uncompressed Arrow IPC (Feather v2) file
+that later processes memory-map instead of re-running the CSV parser. Columns are
+written as one chunk, so numeric columns without nulls come back as read-only
+NumPy views of the mapped file; string, categorical and nullable columns are
+still converted into pandas memory. Entries are keyed by the source's size,
+mtime and content hash: the hash is only recomputed when size or mtime change,
+so a warm lookup costs one stat() and one mmap.
+"""
+
+import hashlib
+import json
+import os
+import re
+
+import pandas as pd
+import pyarrow.feather as feather
+
+CACHE_DIR = os.environ.get('EAGLEI_CACHE_DIR') or os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), '.eaglei_cache')
+
+
+def content_hash(path, block=1 << 20):
+    """BLAKE2b digest of a file, read in 1 MB blocks."""
+    h = hashlib.blake2b(digest_size=16)
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(block), b''):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def fingerprint(path, known=None):
+    """Size, mtime and content hash of `path`; reuses the hash in `known` if size and mtime still match."""
+    st = os.stat(path)
+    if known and known.get('size') == st.st_size and known.get('mtime_ns') == st.st_mtime_ns:
+        return dict(known)
+    return {'size': st.st_size, 'mtime_ns': st.st_mtime_ns, 'hash': content_hash(path)}
+
+
+def frame_fingerprint(df):
+    """Content digest of a DataFrame's values (index ignored), for caching results derived from in-memory tables."""
+    rows = pd.util.hash_pandas_object(df, index=False).to_numpy()
+    return hashlib.blake2b(rows.tobytes(), digest_size=16).hexdigest()
+
+
+def _read_manifest(path):
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _write_manifest(path, entry):
+    tmp = f'{path}.{os.getpid()}.tmp'
+    with open(tmp, 'w') as f:
+        json.dump(entry, f)
+    os.replace(tmp, path)
+
+
+def cached_table(path, reader, name=None, version=1, cache_dir=None):
+    """
+    Return reader(path) as a DataFrame, served from the on-disk columnar cache when fresh.
+
+    `name` identifies the cache entry (defaults to the source file stem) and `version`
+    must be bumped whenever `reader` changes its output schema. A read-only or full
+    disk only disables the cache; the parsed frame is still returned.
+    """
+    cache_dir = cache_dir or CACHE_DIR
+    name = name or os.path.splitext(os.path.basename(path))[0]
+    manifest_path = os.path.join(cache_dir, f'{name}.json')
+    manifest = _read_manifest(manifest_path)
+    fp = fingerprint(path, manifest.get('source') if manifest.get('version') == version else None)
+    data_file = f"{name}-{fp['hash']}-v{version}.arrow"
+    data_path = os.path.join(cache_dir, data_file)
+    entry = {'version': version, 'source': fp, 'data': data_file}
+
+    if os.path.exists(data_path):
+        if manifest != entry:
+            # Touched but unchanged source: refresh stat fields so the next lookup skips hashing
+            try:
+                _write_manifest(manifest_path, entry)
+            except OSError:
+                pass
+        # One chunk per column and split blocks: numeric columns without nulls stay views of the mapped file
+        # (read-only); strings, categoricals and nullable columns are converted
+        return feather.read_table(data_path, memory_map=True).to_pandas(split_blocks=True, self_destruct=True)
+
+    df = reader(path)
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        tmp = f'{data_path}.{os.getpid()}.tmp'
+        feather.write_feather(df, tmp, compression='uncompressed', chunksize=max(len(df), 1))
+        os.replace(tmp, data_path)
+        _write_manifest(manifest_path, entry)
+        # Only this entry's own files: a plain f'{name}-' prefix would also match entries named f'{name}-...'
+        entry_file = re.compile(rf'{re.escape(name)}-[0-9a-f]{{32}}-v\d+\.arrow')
+        for stale in os.listdir(cache_dir):
+            if entry_file.fullmatch(stale) and stale != data_file:
+                os.remove(os.path.join(cache_dir, stale))
+    except OSError:
+        pass
+    return df
@@ -0,0 +1,91 @@
+"""
+Utility x county customer crosswalk for EIA-861 (EIA861_CA_Combined_Data.csv).
+
+The file has one row per county a utility serves. Each row repeats the
+utility-wide customer totals, so grouping by county counts PG&E's 5M customers
+once in every county it serves. For each year the crosswalk is a sparse
+utility x county matrix of allocation weights, and each utility's row sums to
+1. The weights are either population shares of the counties the utility serves
+or a supplied share table (Utility_Number, county, share, optionally Year).
+County customers by sector are then one sparse mat-mul per year:
+W.T @ (utilities x sectors).
+
+scipy.sparse is imported here only, so the app loads it when the crosswalk is
+first built.
+"""
+
+from collections import namedtuple
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+from eaglei.eia import SECTOR_COLUMNS
+
+# Allocated measure -> EIA-861 count column
+CUSTOMER_COUNTS = {**SECTOR_COLUMNS, 'customers': 'Total_Customer_Count'}
+
+# counties: column order of every matrix; matrices / utilities / customers: Year -> csr weights (utilities x counties),
+# Utility_Number per matrix row, utility customer counts (utilities x CUSTOMER_COUNTS)
+Crosswalk = namedtuple('Crosswalk', ['counties', 'years', 'utilities', 'matrices', 'customers'])
+
+
+def utility_customers(eia):
+    """Customer counts per (Year, Utility_Number), each utility counted once rather than once per county it serves."""
+    cols = list(CUSTOMER_COUNTS.values())
+    keys = ['Year', 'Utility_Number', 'county']
+    # Distinct rows within one county (e.g. bundled and delivery-only service) add up; every county repeats that sum
+    per_county = eia.drop_duplicates(keys + cols).groupby(keys, observed=True)[cols].sum()
+    return per_county.groupby(level=['Year', 'Utility_Number']).max().fillna(0).astype('int64').rename(columns={v: k for k, v in CUSTOMER_COUNTS.items()})
+
+
+def allocation_weights(served, population, shares=None):
+    """
+    `served` (Year, Utility_Number, county) rows with a `weight` summing to 1 per utility and year.
+
+    Utilities in `shares` use its share column (per Year when it has one; missing pairs get 0);
+    the rest split by county population. A utility with no weight at all splits evenly.
+    """
+    served = served[['Year', 'Utility_Number', 'county']].drop_duplicates(ignore_index=True)
+    weight = population.reindex(served['county'].astype(str)).to_numpy(dtype='float64')
+    if shares is not None:
+        on = [c for c in ('Year', 'Utility_Number', 'county') if c in shares.columns]
+        given = served[on].astype({'county': str}).merge(shares[on + ['share']].astype({'county': str}), on=on, how='left')['share'].to_numpy(dtype='float64')
+        listed = served['Utility_Number'].isin(shares['Utility_Number']).to_numpy()
+        weight = np.where(listed, np.nan_to_num(given), weight)
+    weight = np.nan_to_num(weight)
+    group = served.groupby(['Year', 'Utility_Number'], observed=True).ngroup().to_numpy()
+    total = np.bincount(group, weight)[group]
+    size = np.bincount(group)[group]
+    return served.assign(weight=np.where(total > 0, weight / np.where(total > 0, total, 1), 1 / size))
+
+
+def build_crosswalk(eia, population, shares=None):
+    """Crosswalk over the counties of `population` (county-indexed Series); counties outside it receive nothing."""
+    counties = list(population.index)
+    weights = allocation_weights(eia, population, shares)
+    weights = weights[weights['county'].astype(str).isin(counties)]
+    customers = utility_customers(eia)
+    utilities, matrices, counts = {}, {}, {}
+    for year, part in weights.groupby('Year', observed=True):
+        util = customers.loc[year]
+        rows = util.index.get_indexer(part['Utility_Number'])
+        cols = pd.Categorical(part['county'].astype(str), categories=counties).codes
+        year = int(year)
+        utilities[year] = util.index.to_numpy()
+        matrices[year] = sparse.csr_matrix((part['weight'].to_numpy(), (rows, cols)), shape=(len(util), len(counties)))
+        counts[year] = util.to_numpy(dtype='float64')
+    return Crosswalk(counties, sorted(matrices), utilities, matrices, counts)
+
+
+def allocate_customers(crosswalk, years=None):
+    """Long (county, Year, residential, commercial, industrial, customers) table of allocated customers for `years` (default all)."""
+    frames = []
+    for year in crosswalk.years if years is None else years:
+        allocated = crosswalk.matrices[year].T @ crosswalk.customers[year]
+        frame = pd.DataFrame(allocated.round().astype('int64'), columns=list(CUSTOMER_COUNTS))
+        frame.insert(0, 'Year', year)
+        frame.insert(0, 'county', crosswalk.counties)
+        frames.append(frame)
+    columns = ['county', 'Year'] + list(CUSTOMER_COUNTS)
+    return pd.concat(frames, ignore_index=True) if frames else pd.DataFrame(columns=columns)
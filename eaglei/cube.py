@@ -0,0 +1,187 @@
+"""
+Pre-aggregated outage cube behind the Outages, Sector & Events and Report pages.
+
+Outage aggregates are scattered once into dense NumPy arrays over
+county x year x month x event type (x sector for customers). Any marginal
+(events by region and year, PSPS events by month, customers by county and
+sector, ...) is then a slice and sum over the cube, independent of how many
+raw events were ingested.
+"""
+
+from collections import namedtuple
+
+import numpy as np
+import pandas as pd
+
+from eaglei.eia import SECTOR_COLUMNS
+from eaglei.ingest import EVENT_TYPES
+
+SECTORS = list(SECTOR_COLUMNS)
+
+# Month 0 holds events whose source only records the year
+MONTHS = list(range(13))
+
+MEASURE_AXES = {
+    'events': ('county', 'year', 'month', 'event_type'),
+    'customers': ('county', 'year', 'month', 'event_type', 'sector'),
+    'duration_sum': ('county', 'year', 'month', 'event_type'),
+    'duration_n': ('county', 'year', 'month', 'event_type'),
+}
+
+# dims: name -> label array; measures: name -> ndarray over MEASURE_AXES[name];
+# groups: name -> (dim, label array of the group each dim position belongs to), e.g. region over county;
+# split: county x year x sector customer shares used to spread customers over sectors
+Cube = namedtuple('Cube', ['dims', 'measures', 'groups', 'split'])
+
+
+def apportion_by_year(summary, yearly):
+    """
+    Aggregate table (ingest.aggregate_eaglei layout) from county totals and a statewide yearly profile.
+
+    `summary` is county-indexed with the EVENT_TYPES event counts, total_customers and
+    avg_duration; `yearly` has year, events and customers. The embedded summary has no
+    county x year detail, so each county's totals are spread over the years in proportion
+    to the statewide profile and customers over event types in proportion to events;
+    every event lands in month 0.
+    """
+    by_type = summary[EVENT_TYPES].to_numpy(dtype='float64')
+    events = by_type.sum(axis=1, keepdims=True)
+    type_share = np.divide(by_type, events, out=np.zeros_like(by_type), where=events > 0)
+    ev_share = yearly['events'].to_numpy(dtype='float64') / yearly['events'].sum()
+    cust_share = yearly['customers'].to_numpy(dtype='float64') / yearly['customers'].sum()
+    customers = summary['total_customers'].to_numpy(dtype='float64')[:, None] * type_share
+
+    # county x year x event type, flattened in that order
+    ev = (by_type[:, None, :] * ev_share[None, :, None]).ravel()
+    shape = (len(summary), len(yearly), len(EVENT_TYPES))
+    c, y, t = (a.ravel() for a in np.indices(shape))
+    return pd.DataFrame({
+        'county': summary.index.to_numpy()[c],
+        'year': yearly['year'].to_numpy()[y].astype('int16'),
+        'month': np.zeros(len(c), dtype='int8'),
+        'event_type': np.asarray(EVENT_TYPES)[t],
+        'events': ev,
+        'customers': (customers[:, None, :] * cust_share[None, :, None]).ravel(),
+        'duration_sum': ev * summary['avg_duration'].to_numpy(dtype='float64')[c],
+        'duration_n': ev,
+    })
+
+
+def build_cube(agg, shares, year_shares=None, groups=None):
+    """
+    Scatter an aggregate table into a Cube.
+
+    `shares` is a county-indexed frame of residential/commercial/industrial customer
+    shares; its index defines the county dimension. `year_shares` (eia.sector_mix
+    output) overrides them for the county-years EIA-861 covers. `groups` maps a group
+    name to a county -> label Series (e.g. region) usable in rollup's `by`/`where`.
+    """
+    counties = shares.index.to_numpy()
+    known = agg[agg['county'].isin(counties)]
+    years = np.arange(known['year'].min(), known['year'].max() + 1) if len(known) else np.empty(0, dtype='int64')
+    dims = {'county': counties, 'year': years, 'month': np.asarray(MONTHS), 'event_type': np.asarray(EVENT_TYPES, dtype=object), 'sector': np.asarray(SECTORS, dtype=object)}
+    cells, agg = _cells(dims, agg)
+    shape = tuple(len(dims[d]) for d in MEASURE_AXES['events'])
+
+    # One bincount per measure over the flattened cell index
+    cell = np.ravel_multi_index(cells, shape)
+    scatter = lambda col: np.bincount(cell, weights=agg[col].to_numpy(dtype='float64'), minlength=int(np.prod(shape))).reshape(shape)
+    measures = {m: scatter(m) for m in ('events', 'customers', 'duration_sum', 'duration_n')}
+
+    split = np.broadcast_to(shares[SECTORS].to_numpy(dtype='float64')[:, None, :], (len(counties), len(years), len(SECTORS))).copy()
+    if year_shares is not None and len(years):
+        mix = year_shares[year_shares['Year'].between(years[0], years[-1])]
+        c = pd.Categorical(mix['county'], categories=counties).codes
+        mix, c = mix[c >= 0], c[c >= 0]
+        split[c, mix['Year'].to_numpy() - years[0]] = mix[SECTORS].to_numpy(dtype='float64')
+    measures['customers'] = measures['customers'][..., None] * split[:, :, None, None, :]
+
+    groups = {name: ('county', labels.reindex(counties).to_numpy()) for name, labels in (groups or {}).items()}
+    return Cube(dims, measures, groups, split)
+
+
+def _cells(dims, agg):
+    # (county, year, month, event_type) positions of the aggregate rows on known counties and in the year range
+    county = pd.Categorical(agg['county'], categories=dims['county']).codes.astype('int64')
+    year = agg['year'].to_numpy(dtype='int64') - (dims['year'][0] if len(dims['year']) else 0)
+    keep = (county >= 0) & (year >= 0) & (year < len(dims['year']))
+    agg = agg[keep]
+    event_type = pd.Categorical(agg['event_type'], categories=EVENT_TYPES).codes.astype('int64')
+    return (county[keep], year[keep], agg['month'].to_numpy(dtype='int64'), event_type), agg
+
+
+def add_to_cube(cube, delta):
+    """
+    Add an aggregate delta (ingest.aggregate_eaglei layout) to the cube arrays in place.
+
+    Returns False, leaving the cube untouched, when the delta has a year outside the
+    cube's year dimension; the caller then rebuilds the cube.
+    """
+    years = cube.dims['year']
+    known = delta[delta['county'].isin(cube.dims['county'])]
+    if len(known) and (not len(years) or known['year'].min() < years[0] or known['year'].max() > years[-1]):
+        return False
+    cells, delta = _cells(cube.dims, delta)
+    for m in ('events', 'duration_sum', 'duration_n'):
+        np.add.at(cube.measures[m], cells, delta[m].to_numpy(dtype='float64'))
+    customers = delta['customers'].to_numpy(dtype='float64')[:, None] * cube.split[cells[0], cells[1]]
+    np.add.at(cube.measures['customers'], cells, customers)
+    return True
+
+
+def cube_with_delta(cube, delta):
+    """A copy of `cube` with an aggregate delta added (add_to_cube), or None when the delta needs a rebuild."""
+    new = cube._replace(measures={m: a.copy() for m, a in cube.measures.items()})
+    return new if add_to_cube(new, delta) else None
+
+
+def _keys(cube, name):
+    # (cube dimension, label of every position along it) for a dimension or a group
+    return (name, cube.dims[name]) if name in cube.dims else cube.groups[name]
+
+
+def rollup(cube, measure, by=(), where=None):
+    """
+    Marginal of `measure` over the dimensions or groups in `by`, restricted by `where`.
+
+    `where` maps a dimension or group to the label(s) to keep, e.g.
+    rollup(cube, 'events', ('region', 'year'), {'event_type': 'psps'}). Returns a scalar
+    for no `by`, a Series for one, a DataFrame (rows = first) for two and a MultiIndex
+    Series beyond. 'avg_duration' is derived as duration_sum / duration_n.
+    """
+    if measure == 'avg_duration':
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return rollup(cube, 'duration_sum', by, where) / rollup(cube, 'duration_n', by, where)
+    by = (by,) if isinstance(by, str) else tuple(by)
+    axes = MEASURE_AXES[measure]
+    pos = {d: np.arange(len(cube.dims[d])) for d in axes}
+    for name, values in (where or {}).items():
+        dim, keys = _keys(cube, name)
+        pos[dim] = pos[dim][np.isin(keys[pos[dim]], np.atleast_1d(values))]
+
+    arr = cube.measures[measure]
+    for ax, d in enumerate(axes):
+        if len(pos[d]) < arr.shape[ax]:
+            arr = arr.take(pos[d], axis=ax)
+    by_dims = [_keys(cube, b)[0] for b in by]
+    arr = arr.sum(axis=tuple(ax for ax, d in enumerate(axes) if d not in by_dims))
+    kept = [d for d in axes if d in by_dims]
+    arr = arr.transpose([kept.index(d) for d in by_dims])
+
+    index = []
+    for ax, name in enumerate(by):
+        dim, keys = _keys(cube, name)
+        labels = keys[pos[dim]]
+        if name != dim:
+            # Fold the dimension onto its group labels with a one-hot matrix product
+            labels, codes = np.unique(labels, return_inverse=True)
+            onehot = (codes[None, :] == np.arange(len(labels))[:, None]).astype('float64')
+            arr = np.moveaxis(np.tensordot(onehot, np.moveaxis(arr, ax, 0), axes=1), 0, ax)
+        index.append(pd.Index(labels, name=name))
+    if not by:
+        return arr[()]
+    if len(by) == 1:
+        return pd.Series(arr, index=index[0], name=measure)
+    if len(by) == 2:
+        return pd.DataFrame(arr, index=index[0], columns=index[1])
+    return pd.Series(arr.ravel(), index=pd.MultiIndex.from_product(index), name=measure)
@@ -0,0 +1,123 @@
+"""
+Streamlit-free loading of the source datasets into the app's working tables.
+
+Every function takes the data directory explicitly and reads through the
+columnar cache, so the Streamlit app (which wraps these in st.cache_*) and
+headless batch jobs build exactly the same county table, aggregates and cube.
+"""
+
+import glob
+import os
+
+import numpy as np
+import pandas as pd
+
+from eaglei.cache import cached_table
+from eaglei.cube import SECTORS, apportion_by_year, build_cube
+from eaglei.eia import read_eia861, sector_mix
+from eaglei.ej import EJ_ROUNDING, composite_ej, synthetic_indicators
+from eaglei.embedded import CA_COUNTIES, county_attributes, embedded_outages, embedded_yearly
+from eaglei.episodes import detect_episodes, episode_events, read_snapshots
+from eaglei.ingest import aggregate_eaglei, combine_partials, county_summary, fold_chunk
+from eaglei.tracts import county_indicators
+
+DATA_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SOURCE_FILES = {
+    'eaglei': 'eaglei_transformed.csv',
+    'snapshots': 'eaglei_outages_*.csv',
+    'doe417': 'DOE_standardized_power_outages.csv',
+    'eia861': 'EIA861_CA_Combined_Data.csv',
+    'shares': 'utility_county_shares.csv',
+    'ces4': 'calenviroscreen40_results.csv',
+    'svi': 'SVI_2020_California_tract.csv',
+    'tracts': 'ca_census_tracts.geojson',
+}
+
+
+def source_path(name, data_dir=None):
+    """Path of source `name` (a SOURCE_FILES key) in `data_dir` (default: the repository root)."""
+    return os.path.join(data_dir or DATA_DIR, SOURCE_FILES[name])
+
+
+def snapshot_episodes(data_dir=None):
+    """Outage episodes from the raw EAGLE-I snapshot files (eaglei_outages_<year>.csv), or None if absent."""
+    paths = sorted(glob.glob(source_path('snapshots', data_dir)))
+    if not paths:
+        return None
+    snap = pd.concat([cached_table(p, read_snapshots) for p in paths], ignore_index=True)
+    snap['county'] = snap['county'].astype(str).astype('category')
+    return detect_episodes(snap)
+
+
+def eaglei_aggregates(data_dir=None, episodes=None):
+    """County x year x month x event-type aggregates from snapshot episodes or eaglei_transformed.csv, or None if neither exists."""
+    if episodes is None:
+        episodes = snapshot_episodes(data_dir)
+    if episodes is not None:
+        return combine_partials([fold_chunk(episode_events(episodes))])
+    path = source_path('eaglei', data_dir)
+    return cached_table(path, aggregate_eaglei, name='eaglei_aggregates', version=2) if os.path.exists(path) else None
+
+
+def outage_base(agg):
+    """`agg`, or the embedded summary spread over the statewide yearly profile when there is no event data."""
+    return agg if agg is not None else apportion_by_year(embedded_outages(), embedded_yearly())
+
+
+def eia861_crosswalk(data_dir=None):
+    """Utility x county EIA-861 crosswalk (utility_county_shares.csv shares if present, else population)."""
+    from eaglei.crosswalk import build_crosswalk
+    shares = source_path('shares', data_dir)
+    return build_crosswalk(cached_table(source_path('eia861', data_dir), read_eia861, version=2), county_attributes()['population'],
+                           pd.read_csv(shares) if os.path.exists(shares) else None)
+
+
+def eia861_sector_mix(data_dir=None):
+    """Residential/commercial/industrial customer shares per county and Year from the EIA-861 customers allocated to counties."""
+    from eaglei.crosswalk import allocate_customers
+    return sector_mix(allocate_customers(eia861_crosswalk(data_dir)))
+
+
+def apply_sector_mix(df, mix, year):
+    """Replace the embedded sector shares with `mix` shares for `year` wherever the county is covered."""
+    shares = mix[mix['Year'] == year].set_index('county').reindex(df['county'])
+    return df.assign(**{s: np.where(shares[s].notna(), shares[s], df[s]) for s in SECTORS})
+
+
+def county_table(agg, mix):
+    """
+    One row per county: attributes, embedded sector shares (latest EIA-861 year where
+    covered) and outage columns (event counts by type, customers, avg_duration) from `agg`.
+    """
+    outage = embedded_outages()
+    df = county_attributes().join(outage, how='inner').loc[outage.index.intersection(CA_COUNTIES.keys(), sort=False)].rename_axis('county').reset_index()
+    df = apply_sector_mix(df, mix, mix['Year'].max())
+    summary = county_summary(agg).reindex(df['county'], fill_value=0)
+    for col in summary.columns:
+        df[col] = summary[col].to_numpy()
+    return df
+
+
+def outage_cube(counties, agg, mix):
+    """Outage cube over the counties of `counties` (county_table output) with a region group."""
+    df = counties.set_index('county')
+    return build_cube(agg, df[SECTORS], mix, groups={'region': df['region']})
+
+
+def ej_table(attrs, counties, tracts=None):
+    """
+    One row per county of `attrs`: attributes, EJ indicators, composite_ej and the outage
+    columns of `counties` (county_table output). CES/SVI/poverty/PM2.5 are population-weighted
+    means of `tracts` where available; everything else is synthetic.
+    """
+    ej = synthetic_indicators(attrs.index, seed=42)
+    if tracts is not None:
+        # Real CES/SVI/poverty/PM2.5 as population-weighted tract means; fire risk stays synthetic
+        real = county_indicators(tracts).reindex(attrs.index)
+        for col in real.columns:
+            ej[col] = np.where(real[col].notna(), real[col], ej[col])
+    ej['composite_ej'] = composite_ej(ej)
+    outage = counties.set_index('county')[['event_count', 'total_customers', 'avg_duration']]
+    outage = outage.reindex(attrs.index).fillna({'event_count': 0, 'total_customers': 0, 'avg_duration': 3.0}).astype({'event_count': 'int64', 'total_customers': 'int64'})
+    return pd.concat([attrs.reset_index(), ej.round(EJ_ROUNDING), outage.reset_index(drop=True)], axis=1)
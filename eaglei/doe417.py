@@ -0,0 +1,142 @@
+"""
+DOE-417 major electric disturbance reports (DOE_standardized_power_outages.csv).
+
+Each report splits its timestamps into date and time columns. doe417_timeline()
+parses each pair in one fixed-format pass and derives the restoration time:
+- A Date_of_Restoration with its time is used as reported.
+- A time without a date is taken as the first such clock time after the start.
+  That is the same day, or the next day when the clock time is earlier than
+  the start.
+- A report with neither is open-ended. Its duration stays missing, and
+  overlap joins extend it by OPEN_EVENT_HOURS.
+"""
+
+import re
+
+import numpy as np
+import pandas as pd
+
+from eaglei.ingest import normalize_event_types
+from eaglei.intervals import interval_index, overlap_join
+
+DATE_FORMAT = '%m/%d/%Y'
+TIME_FORMAT = '%H:%M:%S'
+
+# How long an open-ended report (no restoration time) is assumed to last in overlap joins
+OPEN_EVENT_HOURS = 72
+
+# Restoration provenance codes of doe417_timeline()
+RESTORATION = ['reported', 'inferred', 'open']
+
+
+def read_doe417(path):
+    """Typed DOE-417 table with categorical labels and nullable numeric impacts."""
+    return pd.read_csv(path, dtype={'Event_ID': 'int32', 'NERC_Region': 'category', 'Event_Type': 'category', 'Category': 'category',
+                                    'Demand_Loss_MW': 'float32', 'Number_of_Customers_Affected': 'Int64',
+                                    'Date_Event_Began': 'string', 'Time_Event_Began': 'string', 'Date_of_Restoration': 'string', 'Time_of_Restoration': 'string'})
+
+
+def affected_counties(area, counties):
+    """
+    Long (row, county) table of the known counties named in Area_Affected.
+
+    A name counts when written as "<X> County", "<X> and ... Counties", "City of <X>"
+    or "<X>, California"; one regex pass over the column via str.extractall.
+    """
+    names = '|'.join(re.escape(c) for c in sorted(counties, key=len, reverse=True))
+    pattern = rf"(?<!Salt )\b({names})(?= Count| and [A-Z][A-Za-z ]+ Counties|, California)"
+    found = area.str.extractall(pattern)[0].droplevel('match')
+    return pd.DataFrame({'row': found.index.to_numpy(), 'county': found.to_numpy()}).drop_duplicates(ignore_index=True)
+
+
+def parse_stamps(date, time, date_format=DATE_FORMAT):
+    """Timestamps from split date and time text columns in one fixed-format pass (NaT where either is missing or malformed)."""
+    return pd.to_datetime(date + ' ' + time, format=f'{date_format} {TIME_FORMAT}', errors='coerce')
+
+
+def doe417_timeline(doe):
+    """
+    One row per report: Event_ID, start, end, duration_hours, restoration (RESTORATION
+    category), event_type (the dashboard's five types) and the raw labels and impacts.
+    """
+    doe = doe.reset_index(drop=True)
+    start = parse_stamps(doe['Date_Event_Began'], doe['Time_Event_Began'])
+    reported = parse_stamps(doe['Date_of_Restoration'], doe['Time_of_Restoration'].fillna('00:00:00'))
+    # Restoration clock time without a date: the first occurrence of that time after the start
+    clock = pd.to_timedelta(doe['Time_of_Restoration'], errors='coerce')
+    inferred = start.dt.normalize() + clock
+    inferred = inferred.where(inferred >= start, inferred + pd.Timedelta(days=1))
+    end = reported.fillna(inferred)
+    code = np.where(reported.notna(), 0, np.where(inferred.notna(), 1, 2))
+    return pd.DataFrame({
+        'Event_ID': doe['Event_ID'],
+        'start': start,
+        'end': end,
+        'duration_hours': ((end - start).dt.total_seconds() / 3600).astype('float32'),
+        'restoration': pd.Categorical.from_codes(code, categories=RESTORATION),
+        'event_type': normalize_event_types(doe['Category'].astype('category')),
+        'Event_Type': doe['Event_Type'],
+        'Area_Affected': doe['Area_Affected'],
+        'NERC_Region': doe['NERC_Region'],
+        'Demand_Loss_MW': doe['Demand_Loss_MW'],
+        'customers': doe['Number_of_Customers_Affected'],
+    })
+
+
+def doe417_events(doe, counties):
+    """
+    DOE-417 reports as event-store rows (one per affected county) with start timestamps and restoration durations.
+
+    A report's customers are split evenly over the counties it names (the remainder to
+    the first ones), so per-county sums add up to the report. Reports whose start did
+    not parse are left out.
+    """
+    timeline = doe417_timeline(doe)
+    hits = affected_counties(doe['Area_Affected'].reset_index(drop=True), counties)
+    start = timeline['start'].to_numpy(dtype='datetime64[ns]')[hits['row'].to_numpy()]
+    hits, start = hits[~np.isnat(start)], start[~np.isnat(start)]
+    rows = hits['row'].to_numpy()
+    total = timeline['customers'].fillna(0).to_numpy().astype('int64')[rows]
+    named = np.bincount(rows)[rows]
+    nth = hits.groupby('row').cumcount().to_numpy()
+    return pd.DataFrame({
+        'county': hits['county'].to_numpy(),
+        'start': start,
+        'event_type': timeline['event_type'].take(rows),
+        'customers': (total // named + (nth < total % named)).astype('int32'),
+        'duration': timeline['duration_hours'].to_numpy()[rows],
+    })
+
+
+def outage_intervals(store, source=0):
+    """IntervalIndex over the events of `source` in an EventStore, grouped by county code; events without a duration are instants."""
+    rows = np.flatnonzero(store.source == source)
+    start = store.start[rows]
+    end = start + np.nan_to_num(store.duration[rows].astype('float64') * 3.6e12).astype('int64')
+    return interval_index(store.county[rows], start, end, rows)
+
+
+def doe417_overlaps(timeline, area, index, counties, open_hours=OPEN_EVENT_HOURS):
+    """
+    (report row, county, store row) of every outage in `index` (from outage_intervals()) that
+    overlaps a DOE-417 report in one of the counties named in its `area`.
+
+    Open-ended reports last `open_hours`; reports whose start did not parse match nothing.
+    """
+    hits = affected_counties(area.reset_index(drop=True), counties)
+    rows = hits['row'].to_numpy()
+    start = timeline['start'].to_numpy(dtype='datetime64[ns]')[rows]
+    end = timeline['end'].to_numpy(dtype='datetime64[ns]')[rows]
+    end = np.where(np.isnat(end), start + np.timedelta64(int(open_hours * 3600), 's'), end)
+    ok = ~np.isnat(start)
+    code = pd.Categorical(hits['county'], categories=counties).codes[ok]
+    query, matched = overlap_join(index, code, start[ok].view('int64'), end[ok].view('int64'))
+    return pd.DataFrame({'row': rows[ok][query], 'county': hits['county'].to_numpy()[ok][query], 'event': matched})
+
+
+def overlap_summary(timeline, pairs, store):
+    """Per report: affected counties with overlapping outages, the outage count and their customers."""
+    customers = store.customers[pairs['event'].to_numpy()].astype('int64')
+    stats = pd.DataFrame({'row': pairs['row'], 'county': pairs['county'], 'customers': customers}).groupby('row').agg(
+        counties=('county', 'nunique'), outages=('customers', 'size'), outage_customers=('customers', 'sum'))
+    return timeline.join(stats).fillna({'counties': 0, 'outages': 0, 'outage_customers': 0}).astype({'counties': 'int64', 'outages': 'int64', 'outage_customers': 'int64'})
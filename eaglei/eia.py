@@ -0,0 +1,61 @@
+"""
+EIA-861 utility customer counts (EIA861_CA_Combined_Data.csv).
+
+Customer counts ship as quoted strings with comma thousands ("32,803") and "." for
+missing values. They are parsed with Arrow compute kernels in one vectorized pass
+into nullable Int64 columns. Every row repeats its utility's statewide totals, so
+county sector mixes come from the customers eaglei.crosswalk allocates to counties.
+"""
+
+import csv
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pacsv
+
+# Header "Total_Customer_ Count" has a stray space; names are normalized by dropping spaces
+COUNT_COLUMNS = ['Residential_Customer_Count', 'Commercial_Customer_Count', 'Industrial_Customer_Count', 'Transportation_Customer_Count', 'Total_Customer_Count']
+SECTOR_COLUMNS = {'residential': 'Residential_Customer_Count', 'commercial': 'Commercial_Customer_Count', 'industrial': 'Industrial_Customer_Count'}
+MISSING = ['.', '']
+
+
+def parse_counts(values):
+    """Vectorized "32,803" / "." -> nullable Int64 for an Arrow or pandas string column."""
+    arr = values if isinstance(values, (pa.Array, pa.ChunkedArray)) else pa.array(values, type=pa.string(), from_pandas=True)
+    arr = pc.replace_substring(pc.utf8_trim_whitespace(arr), ',', '')
+    arr = pc.if_else(pc.is_in(arr, value_set=pa.array(MISSING)), pa.scalar(None, pa.string()), arr)
+    return pc.cast(arr, pa.int64())
+
+
+def read_eia861(path):
+    """Typed EIA-861 table: nullable Int64 counts, int16 Year, categorical State/county."""
+    with open(path, newline='') as f:
+        raw_names = next(csv.reader(f))
+    string_cols = {name: pa.string() for name in raw_names if name.replace(' ', '') in COUNT_COLUMNS}
+    table = pacsv.read_csv(path, convert_options=pacsv.ConvertOptions(column_types=string_cols, strings_can_be_null=False))
+    columns = {}
+    for name, col in zip(table.column_names, table.columns):
+        clean = name.replace(' ', '')
+        columns[clean] = parse_counts(col) if clean in COUNT_COLUMNS else col
+    df = pa.table(columns).to_pandas(types_mapper={pa.int64(): pd.Int64Dtype()}.get)
+    df['Year'] = df['Year'].astype('int16')
+    df['Utility_Number'] = df['Utility_Number'].astype('int32')
+    for col in ['State', 'county']:
+        df[col] = df[col].astype('category')
+    return df
+
+
+def sector_mix(counts):
+    """
+    Residential/commercial/industrial customer shares per county and Year.
+
+    `counts` has residential/commercial/industrial customers per county and Year with
+    each utility counted once (crosswalk.allocate_customers output); county-years
+    without sector customers are dropped.
+    """
+    sums = counts.groupby(['county', 'Year'], observed=True)[list(SECTOR_COLUMNS)].sum()
+    total = sums.sum(axis=1).astype('float64').replace(0, float('nan'))
+    shares = sums.astype('float64').div(total, axis=0).round(3)
+    shares['customers'] = sums.sum(axis=1).astype('int64')
+    return shares.dropna(subset=list(SECTOR_COLUMNS)).reset_index().astype({'county': str, 'Year': int})
@@ -0,0 +1,52 @@
+"""
+Environmental-justice indicator tables for the EJ pages.
+
+Indicators are built column-wise: one RNG call draws every synthetic indicator
+for every row (county or tract), ranges are picked per row with array masks and
+clamped with np.clip, and composite_ej is a single weighted matrix product.
+"""
+
+import numpy as np
+import pandas as pd
+
+# Indicator -> (elevated range, baseline range, counties drawn from the elevated range)
+SYNTHETIC_RANGES = {
+    'pollution': ((60, 90), (25, 55), ['Los Angeles', 'Fresno', 'Kern', 'San Bernardino']),
+    'ces_noise': ((-10, 20), (-10, 20), []),
+    'poverty_rate': ((18, 28), (8, 18), ['Imperial', 'Tulare', 'Fresno', 'Kern']),
+    'svi_noise': ((0.1, 0.4), (0.1, 0.4), []),
+    'fire_risk': ((65, 95), (15, 45), ['Butte', 'Shasta', 'Lake', 'Sonoma', 'Napa']),
+    'pm25': ((12, 22), (6, 14), ['Los Angeles', 'Fresno', 'Kern']),
+}
+
+# composite_ej = sum(weight * indicator / scale)
+EJ_WEIGHTS = {'ces_score': (0.30, 100), 'svi_score': (0.30, 1), 'fire_risk': (0.20, 100), 'pm25': (0.20, 25)}
+
+EJ_ROUNDING = {'ces_score': 2, 'svi_score': 3, 'poverty_rate': 2, 'fire_risk': 2, 'pm25': 1, 'composite_ej': 3}
+
+
+def synthetic_indicators(county, seed=42):
+    """
+    Placeholder CES/SVI/poverty/fire/PM2.5 indicators for rows located in `county` (array of names).
+
+    Returns unrounded float columns ces_score, svi_score, poverty_rate, fire_risk and pm25.
+    """
+    county = np.asarray(county)
+    u = np.random.default_rng(seed).random((len(county), len(SYNTHETIC_RANGES)))
+    draws = {}
+    for j, (name, (high, base, hot)) in enumerate(SYNTHETIC_RANGES.items()):
+        lo, hi = np.where(np.isin(county, hot)[:, None], high, base).T
+        draws[name] = lo + (hi - lo) * u[:, j]
+    return pd.DataFrame({
+        'ces_score': np.clip(draws['pollution'] * 0.7 + draws['ces_noise'], 0, 100),
+        'svi_score': np.clip(draws['poverty_rate'] / 100 * 0.5 + draws['svi_noise'], 0, 1),
+        'poverty_rate': draws['poverty_rate'],
+        'fire_risk': draws['fire_risk'],
+        'pm25': draws['pm25'],
+    })
+
+
+def composite_ej(ej):
+    """Weighted CES/SVI/fire/PM2.5 composite (0-1) as one matrix-vector product."""
+    weights = np.array([w / scale for w, scale in EJ_WEIGHTS.values()])
+    return ej[list(EJ_WEIGHTS)].to_numpy(dtype='float64') @ weights
@@ -0,0 +1,148 @@
+"""
+Embedded California outage summary (EAGLE-I 2014-2023) used when no source files are present.
+
+CA_COUNTIES holds county centroids, population and region; EAGLE_I_DATA the
+per-county event totals by type and sector shares; YEARLY_DATA the statewide
+yearly profile.
+"""
+
+import pandas as pd
+
+CA_COUNTIES = {
+    'Alameda': {'lat': 37.6017, 'lon': -121.7195, 'pop': 1682353, 'region': 'Bay Area'},
+    'Alpine': {'lat': 38.5941, 'lon': -119.8815, 'pop': 1204, 'region': 'Sierra'},
+    'Amador': {'lat': 38.4463, 'lon': -120.6540, 'pop': 40474, 'region': 'Sierra'},
+    'Butte': {'lat': 39.6670, 'lon': -121.6008, 'pop': 211632, 'region': 'North'},
+    'Calaveras': {'lat': 38.1963, 'lon': -120.5544, 'pop': 46221, 'region': 'Sierra'},
+    'Colusa': {'lat': 39.1776, 'lon': -122.2375, 'pop': 22046, 'region': 'Central Valley'},
+    'Contra Costa': {'lat': 37.9161, 'lon': -121.9018, 'pop': 1161413, 'region': 'Bay Area'},
+    'Del Norte': {'lat': 41.7428, 'lon': -123.8642, 'pop': 27812, 'region': 'North Coast'},
+    'El Dorado': {'lat': 38.7783, 'lon': -120.5238, 'pop': 193098, 'region': 'Sierra'},
+    'Fresno': {'lat': 36.7378, 'lon': -119.7871, 'pop': 1008654, 'region': 'Central Valley'},
+    'Glenn': {'lat': 39.5983, 'lon': -122.3922, 'pop': 28750, 'region': 'Central Valley'},
+    'Humboldt': {'lat': 40.7450, 'lon': -123.8695, 'pop': 135558, 'region': 'North Coast'},
+    'Imperial': {'lat': 33.0394, 'lon': -115.3500, 'pop': 179702, 'region': 'South'},
+    'Inyo': {'lat': 36.5115, 'lon': -117.4109, 'pop': 19016, 'region': 'Sierra'},
+    'Kern': {'lat': 35.3733, 'lon': -118.9614, 'pop': 917673, 'region': 'Central Valley'},
+    'Kings': {'lat': 36.0988, 'lon': -119.8155, 'pop': 153443, 'region': 'Central Valley'},
+    'Lake': {'lat': 39.0995, 'lon': -122.7533, 'pop': 68766, 'region': 'North Coast'},
+    'Lassen': {'lat': 40.6739, 'lon': -120.5916, 'pop': 30573, 'region': 'North'},
+    'Los Angeles': {'lat': 34.0522, 'lon': -118.2437, 'pop': 9829544, 'region': 'South'},
+    'Madera': {'lat': 37.2183, 'lon': -119.7627, 'pop': 159410, 'region': 'Central Valley'},
+    'Marin': {'lat': 38.0834, 'lon': -122.7633, 'pop': 262321, 'region': 'Bay Area'},
+    'Mariposa': {'lat': 37.4829, 'lon': -119.9663, 'pop': 17131, 'region': 'Sierra'},
+    'Mendocino': {'lat': 39.4378, 'lon': -123.3916, 'pop': 91601, 'region': 'North Coast'},
+    'Merced': {'lat': 37.1948, 'lon': -120.7217, 'pop': 286461, 'region': 'Central Valley'},
+    'Modoc': {'lat': 41.5887, 'lon': -120.7252, 'pop': 8700, 'region': 'North'},
+    'Mono': {'lat': 37.9389, 'lon': -118.8864, 'pop': 13195, 'region': 'Sierra'},
+    'Monterey': {'lat': 36.6002, 'lon': -121.8947, 'pop': 439091, 'region': 'Central Coast'},
+    'Napa': {'lat': 38.5025, 'lon': -122.2654, 'pop': 138019, 'region': 'Bay Area'},
+    'Nevada': {'lat': 39.3013, 'lon': -120.7689, 'pop': 102241, 'region': 'Sierra'},
+    'Orange': {'lat': 33.7175, 'lon': -117.8311, 'pop': 3167809, 'region': 'South'},
+    'Placer': {'lat': 39.0916, 'lon': -120.8039, 'pop': 412300, 'region': 'Sierra'},
+    'Plumas': {'lat': 40.0034, 'lon': -120.8388, 'pop': 19790, 'region': 'Sierra'},
+    'Riverside': {'lat': 33.9533, 'lon': -117.3962, 'pop': 2470546, 'region': 'South'},
+    'Sacramento': {'lat': 38.5816, 'lon': -121.4944, 'pop': 1585055, 'region': 'Central Valley'},
+    'San Benito': {'lat': 36.6058, 'lon': -121.0750, 'pop': 64209, 'region': 'Central Coast'},
+    'San Bernardino': {'lat': 34.1083, 'lon': -117.2898, 'pop': 2181654, 'region': 'South'},
+    'San Diego': {'lat': 32.7157, 'lon': -117.1611, 'pop': 3286069, 'region': 'South'},
+    'San Francisco': {'lat': 37.7749, 'lon': -122.4194, 'pop': 815201, 'region': 'Bay Area'},
+    'San Joaquin': {'lat': 37.9577, 'lon': -121.2908, 'pop': 789410, 'region': 'Central Valley'},
+    'San Luis Obispo': {'lat': 35.2828, 'lon': -120.6596, 'pop': 282165, 'region': 'Central Coast'},
+    'San Mateo': {'lat': 37.5630, 'lon': -122.3255, 'pop': 737888, 'region': 'Bay Area'},
+    'Santa Barbara': {'lat': 34.4208, 'lon': -119.6982, 'pop': 446527, 'region': 'Central Coast'},
+    'Santa Clara': {'lat': 37.3541, 'lon': -121.9552, 'pop': 1927470, 'region': 'Bay Area'},
+    'Santa Cruz': {'lat': 36.9741, 'lon': -122.0308, 'pop': 270861, 'region': 'Central Coast'},
+    'Shasta': {'lat': 40.7909, 'lon': -122.0389, 'pop': 182155, 'region': 'North'},
+    'Sierra': {'lat': 39.5803, 'lon': -120.5156, 'pop': 3236, 'region': 'Sierra'},
+    'Siskiyou': {'lat': 41.5926, 'lon': -122.5402, 'pop': 44076, 'region': 'North'},
+    'Solano': {'lat': 38.2494, 'lon': -121.9400, 'pop': 453491, 'region': 'Bay Area'},
+    'Sonoma': {'lat': 38.5110, 'lon': -122.9550, 'pop': 488863, 'region': 'Bay Area'},
+    'Stanislaus': {'lat': 37.5091, 'lon': -120.9876, 'pop': 552999, 'region': 'Central Valley'},
+    'Sutter': {'lat': 39.0346, 'lon': -121.6950, 'pop': 99633, 'region': 'Central Valley'},
+    'Tehama': {'lat': 40.1255, 'lon': -122.2342, 'pop': 65829, 'region': 'North'},
+    'Trinity': {'lat': 40.6517, 'lon': -123.1118, 'pop': 16112, 'region': 'North'},
+    'Tulare': {'lat': 36.2077, 'lon': -118.7815, 'pop': 473117, 'region': 'Central Valley'},
+    'Tuolumne': {'lat': 38.0268, 'lon': -119.9533, 'pop': 55810, 'region': 'Sierra'},
+    'Ventura': {'lat': 34.3705, 'lon': -119.1391, 'pop': 839784, 'region': 'South'},
+    'Yolo': {'lat': 38.7316, 'lon': -121.9018, 'pop': 216986, 'region': 'Central Valley'},
+    'Yuba': {'lat': 39.2676, 'lon': -121.3503, 'pop': 81575, 'region': 'Central Valley'}
+}
+
+EAGLE_I_DATA = {
+    'Alameda': {'events': 5406, 'customers': 12995442, 'avg_duration': 2.91, 'weather': 2163, 'equipment': 1621, 'psps': 1081, 'vegetation': 432, 'unknown': 109, 'residential': 0.68, 'commercial': 0.24, 'industrial': 0.08},
+    'Alpine': {'events': 350, 'customers': 239300, 'avg_duration': 3.80, 'weather': 175, 'equipment': 70, 'psps': 63, 'vegetation': 35, 'unknown': 7, 'residential': 0.82, 'commercial': 0.12, 'industrial': 0.06},
+    'Amador': {'events': 843, 'customers': 3974586, 'avg_duration': 3.69, 'weather': 337, 'equipment': 253, 'psps': 169, 'vegetation': 67, 'unknown': 17, 'residential': 0.75, 'commercial': 0.18, 'industrial': 0.07},
+    'Butte': {'events': 2177, 'customers': 8797004, 'avg_duration': 3.53, 'weather': 653, 'equipment': 436, 'psps': 871, 'vegetation': 174, 'unknown': 43, 'residential': 0.72, 'commercial': 0.20, 'industrial': 0.08},
+    'Calaveras': {'events': 1393, 'customers': 5557093, 'avg_duration': 4.64, 'weather': 418, 'equipment': 279, 'psps': 557, 'vegetation': 111, 'unknown': 28, 'residential': 0.78, 'commercial': 0.15, 'industrial': 0.07},
+    'Colusa': {'events': 402, 'customers': 321213, 'avg_duration': 4.39, 'weather': 161, 'equipment': 120, 'psps': 80, 'vegetation': 32, 'unknown': 9, 'residential': 0.55, 'commercial': 0.15, 'industrial': 0.30},
+    'Contra Costa': {'events': 5221, 'customers': 9755092, 'avg_duration': 2.83, 'weather': 2088, 'equipment': 1566, 'psps': 1044, 'vegetation': 418, 'unknown': 105, 'residential': 0.65, 'commercial': 0.27, 'industrial': 0.08},
+    'Del Norte': {'events': 302, 'customers': 630171, 'avg_duration': 3.97, 'weather': 151, 'equipment': 91, 'psps': 30, 'vegetation': 24, 'unknown': 6, 'residential': 0.80, 'commercial': 0.15, 'industrial': 0.05},
+    'El Dorado': {'events': 2437, 'customers': 11788380, 'avg_duration': 3.78, 'weather': 731, 'equipment': 487, 'psps': 975, 'vegetation': 195, 'unknown': 49, 'residential': 0.76, 'commercial': 0.18, 'industrial': 0.06},
+    'Fresno': {'events': 4442, 'customers': 5074069, 'avg_duration': 2.76, 'weather': 1777, 'equipment': 1333, 'psps': 444, 'vegetation': 711, 'unknown': 177, 'residential': 0.58, 'commercial': 0.22, 'industrial': 0.20},
+    'Glenn': {'events': 417, 'customers': 328082, 'avg_duration': 4.72, 'weather': 167, 'equipment': 125, 'psps': 83, 'vegetation': 33, 'unknown': 9, 'residential': 0.52, 'commercial': 0.18, 'industrial': 0.30},
+    'Humboldt': {'events': 1841, 'customers': 3507899, 'avg_duration': 4.67, 'weather': 920, 'equipment': 368, 'psps': 368, 'vegetation': 147, 'unknown': 38, 'residential': 0.75, 'commercial': 0.18, 'industrial': 0.07},
+    'Imperial': {'events': 144, 'customers': 122638, 'avg_duration': 4.15, 'weather': 72, 'equipment': 43, 'psps': 7, 'vegetation': 17, 'unknown': 5, 'residential': 0.50, 'commercial': 0.20, 'industrial': 0.30},
+    'Inyo': {'events': 298, 'customers': 202562, 'avg_duration': 3.13, 'weather': 149, 'equipment': 89, 'psps': 30, 'vegetation': 24, 'unknown': 6, 'residential': 0.78, 'commercial': 0.17, 'industrial': 0.05},
+    'Kern': {'events': 5383, 'customers': 6646983, 'avg_duration': 2.88, 'weather': 2153, 'equipment': 1615, 'psps': 538, 'vegetation': 861, 'unknown': 216, 'residential': 0.52, 'commercial': 0.23, 'industrial': 0.25},
+    'Kings': {'events': 887, 'customers': 980163, 'avg_duration': 2.30, 'weather': 355, 'equipment': 266, 'psps': 89, 'vegetation': 142, 'unknown': 35, 'residential': 0.55, 'commercial': 0.20, 'industrial': 0.25},
+    'Lake': {'events': 1521, 'customers': 8191350, 'avg_duration': 3.60, 'weather': 456, 'equipment': 304, 'psps': 608, 'vegetation': 122, 'unknown': 31, 'residential': 0.80, 'commercial': 0.15, 'industrial': 0.05},
+    'Lassen': {'events': 22, 'customers': 6917, 'avg_duration': 5.20, 'weather': 11, 'equipment': 7, 'psps': 2, 'vegetation': 2, 'unknown': 0, 'residential': 0.70, 'commercial': 0.20, 'industrial': 0.10},
+    'Los Angeles': {'events': 8245, 'customers': 28855748, 'avg_duration': 8.47, 'weather': 2474, 'equipment': 2474, 'psps': 825, 'vegetation': 1649, 'unknown': 823, 'residential': 0.62, 'commercial': 0.30, 'industrial': 0.08},
+    'Madera': {'events': 1451, 'customers': 2555246, 'avg_duration': 2.98, 'weather': 580, 'equipment': 435, 'psps': 290, 'vegetation': 116, 'unknown': 30, 'residential': 0.60, 'commercial': 0.18, 'industrial': 0.22},
+    'Marin': {'events': 2102, 'customers': 6172246, 'avg_duration': 3.07, 'weather': 841, 'equipment': 630, 'psps': 420, 'vegetation': 168, 'unknown': 43, 'residential': 0.72, 'commercial': 0.23, 'industrial': 0.05},
+    'Mariposa': {'events': 596, 'customers': 757117, 'avg_duration': 5.24, 'weather': 179, 'equipment': 119, 'psps': 238, 'vegetation': 48, 'unknown': 12, 'residential': 0.85, 'commercial': 0.12, 'industrial': 0.03},
+    'Mendocino': {'events': 1334, 'customers': 5348755, 'avg_duration': 3.69, 'weather': 534, 'equipment': 400, 'psps': 267, 'vegetation': 107, 'unknown': 26, 'residential': 0.78, 'commercial': 0.17, 'industrial': 0.05},
+    'Merced': {'events': 1206, 'customers': 1401551, 'avg_duration': 2.07, 'weather': 482, 'equipment': 362, 'psps': 121, 'vegetation': 193, 'unknown': 48, 'residential': 0.55, 'commercial': 0.20, 'industrial': 0.25},
+    'Modoc': {'events': 77, 'customers': 52272, 'avg_duration': 1.71, 'weather': 38, 'equipment': 23, 'psps': 8, 'vegetation': 6, 'unknown': 2, 'residential': 0.75, 'commercial': 0.15, 'industrial': 0.10},
+    'Mono': {'events': 750, 'customers': 716354, 'avg_duration': 3.32, 'weather': 375, 'equipment': 225, 'psps': 75, 'vegetation': 60, 'unknown': 15, 'residential': 0.80, 'commercial': 0.15, 'industrial': 0.05},
+    'Monterey': {'events': 2602, 'customers': 4596623, 'avg_duration': 3.14, 'weather': 1041, 'equipment': 781, 'psps': 520, 'vegetation': 208, 'unknown': 52, 'residential': 0.60, 'commercial': 0.25, 'industrial': 0.15},
+    'Napa': {'events': 2130, 'customers': 5884476, 'avg_duration': 3.52, 'weather': 639, 'equipment': 426, 'psps': 852, 'vegetation': 170, 'unknown': 43, 'residential': 0.70, 'commercial': 0.22, 'industrial': 0.08},
+    'Nevada': {'events': 1540, 'customers': 9360516, 'avg_duration': 3.60, 'weather': 462, 'equipment': 308, 'psps': 616, 'vegetation': 123, 'unknown': 31, 'residential': 0.78, 'commercial': 0.17, 'industrial': 0.05},
+    'Orange': {'events': 10293, 'customers': 17076909, 'avg_duration': 4.13, 'weather': 3088, 'equipment': 3088, 'psps': 1029, 'vegetation': 2058, 'unknown': 1030, 'residential': 0.65, 'commercial': 0.28, 'industrial': 0.07},
+    'Placer': {'events': 1978, 'customers': 6718466, 'avg_duration': 3.56, 'weather': 593, 'equipment': 396, 'psps': 791, 'vegetation': 158, 'unknown': 40, 'residential': 0.75, 'commercial': 0.20, 'industrial': 0.05},
+    'Plumas': {'events': 823, 'customers': 1256231, 'avg_duration': 4.70, 'weather': 247, 'equipment': 165, 'psps': 329, 'vegetation': 66, 'unknown': 16, 'residential': 0.82, 'commercial': 0.13, 'industrial': 0.05},
+    'Riverside': {'events': 11071, 'customers': 17509497, 'avg_duration': 3.74, 'weather': 3321, 'equipment': 3321, 'psps': 1107, 'vegetation': 2214, 'unknown': 1108, 'residential': 0.68, 'commercial': 0.24, 'industrial': 0.08},
+    'Sacramento': {'events': 5116, 'customers': 9763014, 'avg_duration': 1.63, 'weather': 2046, 'equipment': 1535, 'psps': 512, 'vegetation': 819, 'unknown': 204, 'residential': 0.62, 'commercial': 0.28, 'industrial': 0.10},
+    'San Benito': {'events': 473, 'customers': 327192, 'avg_duration': 1.82, 'weather': 189, 'equipment': 142, 'psps': 95, 'vegetation': 38, 'unknown': 9, 'residential': 0.70, 'commercial': 0.18, 'industrial': 0.12},
+    'San Bernardino': {'events': 10201, 'customers': 17619431, 'avg_duration': 4.70, 'weather': 3060, 'equipment': 3060, 'psps': 1020, 'vegetation': 2040, 'unknown': 1021, 'residential': 0.65, 'commercial': 0.25, 'industrial': 0.10},
+    'San Diego': {'events': 9993, 'customers': 14931492, 'avg_duration': 4.08, 'weather': 2998, 'equipment': 2998, 'psps': 999, 'vegetation': 1999, 'unknown': 999, 'residential': 0.67, 'commercial': 0.26, 'industrial': 0.07},
+    'San Francisco': {'events': 3291, 'customers': 3675689, 'avg_duration': 2.56, 'weather': 988, 'equipment': 988, 'psps': 165, 'vegetation': 823, 'unknown': 327, 'residential': 0.55, 'commercial': 0.40, 'industrial': 0.05},
+    'San Joaquin': {'events': 3038, 'customers': 4510414, 'avg_duration': 2.22, 'weather': 1215, 'equipment': 911, 'psps': 304, 'vegetation': 486, 'unknown': 122, 'residential': 0.58, 'commercial': 0.22, 'industrial': 0.20},
+    'San Luis Obispo': {'events': 2117, 'customers': 2748269, 'avg_duration': 2.92, 'weather': 847, 'equipment': 635, 'psps': 423, 'vegetation': 169, 'unknown': 43, 'residential': 0.72, 'commercial': 0.22, 'industrial': 0.06},
+    'San Mateo': {'events': 4223, 'customers': 7258231, 'avg_duration': 2.85, 'weather': 1689, 'equipment': 1267, 'psps': 845, 'vegetation': 338, 'unknown': 84, 'residential': 0.68, 'commercial': 0.27, 'industrial': 0.05},
+    'Santa Barbara': {'events': 4334, 'customers': 4737885, 'avg_duration': 3.79, 'weather': 1300, 'equipment': 867, 'psps': 867, 'vegetation': 867, 'unknown': 433, 'residential': 0.68, 'commercial': 0.25, 'industrial': 0.07},
+    'Santa Clara': {'events': 6215, 'customers': 10318946, 'avg_duration': 3.12, 'weather': 2486, 'equipment': 1865, 'psps': 621, 'vegetation': 994, 'unknown': 249, 'residential': 0.60, 'commercial': 0.32, 'industrial': 0.08},
+    'Santa Cruz': {'events': 2318, 'customers': 7819962, 'avg_duration': 3.89, 'weather': 927, 'equipment': 695, 'psps': 464, 'vegetation': 185, 'unknown': 47, 'residential': 0.75, 'commercial': 0.20, 'industrial': 0.05},
+    'Shasta': {'events': 1537, 'customers': 8515735, 'avg_duration': 4.62, 'weather': 461, 'equipment': 307, 'psps': 615, 'vegetation': 123, 'unknown': 31, 'residential': 0.72, 'commercial': 0.20, 'industrial': 0.08},
+    'Sierra': {'events': 842, 'customers': 822148, 'avg_duration': 4.04, 'weather': 253, 'equipment': 168, 'psps': 337, 'vegetation': 67, 'unknown': 17, 'residential': 0.88, 'commercial': 0.10, 'industrial': 0.02},
+    'Siskiyou': {'events': 640, 'customers': 968748, 'avg_duration': 3.12, 'weather': 256, 'equipment': 192, 'psps': 128, 'vegetation': 51, 'unknown': 13, 'residential': 0.78, 'commercial': 0.15, 'industrial': 0.07},
+    'Solano': {'events': 2684, 'customers': 5820017, 'avg_duration': 2.91, 'weather': 1074, 'equipment': 805, 'psps': 537, 'vegetation': 215, 'unknown': 53, 'residential': 0.65, 'commercial': 0.25, 'industrial': 0.10},
+    'Sonoma': {'events': 4140, 'customers': 12901852, 'avg_duration': 2.98, 'weather': 1242, 'equipment': 828, 'psps': 1656, 'vegetation': 331, 'unknown': 83, 'residential': 0.72, 'commercial': 0.22, 'industrial': 0.06},
+    'Stanislaus': {'events': 450, 'customers': 598588, 'avg_duration': 1.97, 'weather': 180, 'equipment': 135, 'psps': 45, 'vegetation': 72, 'unknown': 18, 'residential': 0.58, 'commercial': 0.22, 'industrial': 0.20},
+    'Sutter': {'events': 524, 'customers': 781897, 'avg_duration': 2.50, 'weather': 210, 'equipment': 157, 'psps': 52, 'vegetation': 84, 'unknown': 21, 'residential': 0.60, 'commercial': 0.20, 'industrial': 0.20},
+    'Tehama': {'events': 1108, 'customers': 2908710, 'avg_duration': 4.00, 'weather': 332, 'equipment': 222, 'psps': 443, 'vegetation': 89, 'unknown': 22, 'residential': 0.70, 'commercial': 0.18, 'industrial': 0.12},
+    'Trinity': {'events': 473, 'customers': 325248, 'avg_duration': 3.77, 'weather': 189, 'equipment': 142, 'psps': 95, 'vegetation': 38, 'unknown': 9, 'residential': 0.85, 'commercial': 0.12, 'industrial': 0.03},
+    'Tulare': {'events': 3760, 'customers': 3269069, 'avg_duration': 2.74, 'weather': 1504, 'equipment': 1128, 'psps': 376, 'vegetation': 602, 'unknown': 150, 'residential': 0.55, 'commercial': 0.20, 'industrial': 0.25},
+    'Tuolumne': {'events': 1129, 'customers': 6095314, 'avg_duration': 4.07, 'weather': 339, 'equipment': 226, 'psps': 452, 'vegetation': 90, 'unknown': 22, 'residential': 0.80, 'commercial': 0.15, 'industrial': 0.05},
+    'Ventura': {'events': 7922, 'customers': 10052905, 'avg_duration': 3.56, 'weather': 2377, 'equipment': 2377, 'psps': 792, 'vegetation': 1584, 'unknown': 792, 'residential': 0.70, 'commercial': 0.23, 'industrial': 0.07},
+    'Yolo': {'events': 2178, 'customers': 2931070, 'avg_duration': 2.47, 'weather': 871, 'equipment': 653, 'psps': 218, 'vegetation': 349, 'unknown': 87, 'residential': 0.60, 'commercial': 0.25, 'industrial': 0.15},
+    'Yuba': {'events': 1213, 'customers': 2752649, 'avg_duration': 3.27, 'weather': 485, 'equipment': 364, 'psps': 243, 'vegetation': 97, 'unknown': 24, 'residential': 0.68, 'commercial': 0.20, 'industrial': 0.12}
+}
+
+YEARLY_DATA = {2014: {'events': 950, 'customers': 1617143}, 2015: {'events': 7631, 'customers': 11697580}, 2016: {'events': 6523, 'customers': 10633518}, 2017: {'events': 6579, 'customers': 10714053}, 2018: {'events': 13624, 'customers': 19327442}, 2019: {'events': 26024, 'customers': 97449194}, 2020: {'events': 34623, 'customers': 84460143}, 2021: {'events': 22617, 'customers': 37682249}, 2022: {'events': 23432, 'customers': 30731212}, 2023: {'events': 17600, 'customers': 25522900}}
+
+
+def county_attributes():
+    """County attribute table (latitude, longitude, population, region) indexed by county."""
+    return pd.DataFrame.from_dict(CA_COUNTIES, orient='index').rename(columns={'lat': 'latitude', 'lon': 'longitude', 'pop': 'population'}).rename_axis('county')
+
+
+def embedded_outages():
+    """County-indexed embedded summary with event_count, total_customers, avg_duration, per-type counts and sector shares."""
+    return pd.DataFrame.from_dict(EAGLE_I_DATA, orient='index').rename(columns={'events': 'event_count', 'customers': 'total_customers'})
+
+
+def embedded_yearly():
+    """Statewide yearly profile: year, events, customers."""
+    return pd.DataFrame.from_dict(YEARLY_DATA, orient='index').rename_axis('year').reset_index()
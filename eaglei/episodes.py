@@ -0,0 +1,124 @@
+"""
+Outage episode reconstruction from raw EAGLE-I snapshot files.
+
+EAGLE-I publishes "customers out" per county every 15 minutes
+(eaglei_outages_<year>.csv). Each county's series is sorted once and
+run-length encoded into episodes: consecutive snapshots with customers out,
+allowing a configurable number of missing intervals, form one episode with a
+start, end, peak customers out and customer-hours. Counties are independent,
+so large inputs are split across a process pool.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from eaglei.ingest import EVENT_TYPES
+
+# Canonical field -> column name in the snapshot files (override per call via `columns=`)
+SNAPSHOT_COLUMNS = {'county': 'county', 'state': 'state', 'time': 'run_start_time', 'customers_out': 'customers_out'}
+
+INTERVAL = pd.Timedelta(minutes=15)
+
+# Below this many snapshot rows the pool costs more than it saves
+PARALLEL_MIN_ROWS = 1_000_000
+
+EPISODE_COLUMNS = ['county', 'start', 'end', 'duration_hours', 'peak_customers', 'customer_hours']
+
+
+def read_snapshots(path, state='California', columns=None):
+    """Typed snapshot table (county category, time datetime64[ns], customers_out int32) for one state."""
+    cols = {**SNAPSHOT_COLUMNS, **(columns or {})}
+    header = set(pd.read_csv(path, nrows=0).columns)
+    usecols = [c for c in (cols['county'], cols['state'], cols['time'], cols['customers_out']) if c in header]
+    raw = pd.read_csv(path, usecols=usecols, dtype={cols['county']: 'category', cols['state']: 'category', cols['customers_out']: 'float64'})
+    if cols['state'] in raw and state:
+        raw = raw[raw[cols['state']] == state]
+    snap = pd.DataFrame({
+        'county': raw[cols['county']].cat.remove_unused_categories(),
+        'time': pd.to_datetime(raw[cols['time']], errors='coerce'),
+        'customers_out': raw[cols['customers_out']].fillna(0).to_numpy().astype('int32'),
+    })
+    return snap[snap['county'].notna() & snap['time'].notna()].reset_index(drop=True)
+
+
+def _runs(t, v, max_gap, interval):
+    # Episodes of one county: t int64 ns, v customers out (>= threshold)
+    # Duplicate timestamps (several feeder rows per interval) are summed first
+    order = np.argsort(t, kind='stable')
+    t, v = t[order], v[order]
+    first = np.flatnonzero(np.r_[True, np.diff(t) > 0])
+    t, v = t[first], np.add.reduceat(v.astype('int64'), first)
+    starts = np.flatnonzero(np.r_[True, np.diff(t) > max_gap])
+    ends = np.r_[starts[1:], len(t)] - 1
+    return t[starts], t[ends] + interval, np.maximum.reduceat(v, starts), np.add.reduceat(v, starts)
+
+
+def _county_batch(task):
+    # Worker entry point: (county codes, per-county time and value arrays, max_gap, interval)
+    codes, series, max_gap, interval = task
+    return [(code, *_runs(t, v, max_gap, interval)) for code, (t, v) in zip(codes, series)]
+
+
+def detect_episodes(snap, interval=INTERVAL, gap_tolerance=1, min_customers=1, workers=None):
+    """
+    Segment each county's snapshot series into outage episodes.
+
+    A snapshot counts when at least `min_customers` are out; an episode continues across
+    up to `gap_tolerance` missing intervals. Returns county, start, end (last snapshot +
+    one interval), duration_hours, peak_customers and customer_hours. `workers` sizes the
+    process pool (None = all cores, 1 = in-process); small inputs always run in-process.
+    """
+    snap = snap[snap['customers_out'] >= min_customers]
+    if not len(snap):
+        # Nothing reached the threshold: no county groups to segment
+        return pd.DataFrame({c: pd.Series(dtype=d) for c, d in zip(EPISODE_COLUMNS, ['str', 'datetime64[ns]', 'datetime64[ns]', 'float32', 'int32', 'float64'])})
+    counties = snap['county'].cat.categories
+    code = snap['county'].cat.codes.to_numpy()
+    t = snap['time'].to_numpy(dtype='datetime64[ns]').view('int64')
+    v = snap['customers_out'].to_numpy()
+    # Group rows by county (stable radix sort on the small codes); time order is sorted per county
+    order = np.argsort(code, kind='stable')
+    code, t, v = code[order], t[order], v[order]
+    bounds = np.flatnonzero(np.r_[True, np.diff(code) != 0, True])
+    present = code[bounds[:-1]]
+    series = [(t[a:b], v[a:b]) for a, b in zip(bounds[:-1], bounds[1:])]
+    step = int(pd.Timedelta(interval).value)
+    max_gap = step * (gap_tolerance + 1)
+
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(t) < PARALLEL_MIN_ROWS or len(series) < 2:
+        results = _county_batch((present, series, max_gap, step))
+    else:
+        # Round-robin counties over the workers so big and small counties mix
+        tasks = [(present[i::workers], series[i::workers], max_gap, step) for i in range(min(workers, len(series)))]
+        with ProcessPoolExecutor(len(tasks)) as pool:
+            results = [r for batch in pool.map(_county_batch, tasks) for r in batch]
+
+    codes = np.concatenate([np.full(len(r[1]), r[0]) for r in results])
+    start, end, peak, total = (np.concatenate([r[i] for r in results]) for i in range(1, 5))
+    episodes = pd.DataFrame({
+        'county': pd.Categorical.from_codes(codes, categories=counties),
+        'start': start.astype('datetime64[ns]'),
+        'end': end.astype('datetime64[ns]'),
+        'duration_hours': ((end - start) / 3.6e12).astype('float32'),
+        'peak_customers': peak.astype('int32'),
+        'customer_hours': total * (step / 3.6e12),
+    })
+    return episodes.sort_values(['start', 'county'], ignore_index=True)
+
+
+def episode_events(episodes):
+    """Episodes as canonical ingest chunk rows (peak customers out, duration in hours, cause unknown)."""
+    start = episodes['start'].to_numpy(dtype='datetime64[ns]')
+    return pd.DataFrame({
+        'county': episodes['county'].astype('category'),
+        'year': (start.astype('datetime64[Y]').astype('int64') + 1970).astype('int16'),
+        'month': (start.astype('datetime64[M]').astype('int64') % 12 + 1).astype('int8'),
+        'start': start,
+        'event_type': pd.Categorical(np.full(len(episodes), 'unknown'), categories=EVENT_TYPES),
+        'customers': episodes['peak_customers'].to_numpy(dtype='int32'),
+        'duration': episodes['duration_hours'].to_numpy(dtype='float32'),
+    })
@@ -0,0 +1,164 @@
+"""
+Event-level outage store for the Query & Explore page.
+
+Raw EAGLE-I and DOE-417 events are held as compact, start-time-sorted column
+arrays with CSR-style county and event-type indexes. A compiled query plan
+(eaglei.query) resolves year filters by binary search on the sorted start
+timestamps, county/region and event-type filters by slicing and probing the
+indexes, and only evaluates the remaining predicates on the surviving rows.
+"""
+
+from collections import namedtuple
+
+import numpy as np
+import pandas as pd
+
+from eaglei.ingest import CHUNKSIZE, EVENT_TYPES, read_eaglei_chunks
+from eaglei.metrics import timed
+from eaglei.query import compare, compile_query, describe, rank_order
+
+EventStore = namedtuple('EventStore', ['start', 'county', 'event_type', 'customers', 'duration', 'source',
+                                       'county_index', 'type_index', 'counties', 'sources', 'attrs'])
+
+EVENT_COLUMNS = ('start_time', 'year', 'county', 'region', 'event_type', 'customers', 'duration_hours', 'source')
+
+
+def encode_events(frame, counties, source):
+    """Compact column arrays for canonical event rows (county, start, event_type, customers, duration) from source code `source`."""
+    county = pd.Categorical(frame['county'], categories=counties).codes
+    keep = county >= 0
+    return {
+        'start': frame['start'].to_numpy(dtype='datetime64[ns]')[keep].view('int64'),
+        'county': county[keep].astype('int16'),
+        'event_type': pd.Categorical(frame['event_type'], categories=EVENT_TYPES).codes[keep].astype('int8'),
+        'customers': frame['customers'].to_numpy(dtype='int32')[keep],
+        'duration': frame['duration'].to_numpy(dtype='float32')[keep],
+        'source': np.full(int(keep.sum()), source, dtype='int8'),
+    }
+
+
+def eaglei_event_parts(path, counties, source=0, chunksize=CHUNKSIZE):
+    """Stream eaglei_transformed.csv into encoded event parts, one per chunk."""
+    for chunk in read_eaglei_chunks(path, chunksize):
+        yield encode_events(chunk, counties, source)
+
+
+def _csr(codes, k):
+    # Row positions grouped by code; each group stays ascending (= time order) thanks to the stable sort
+    rows = np.argsort(codes, kind='stable')
+    offsets = np.concatenate([[0], np.cumsum(np.bincount(codes, minlength=k))])
+    return offsets, rows
+
+
+def build_event_store(parts, attrs, sources=('EAGLE-I', 'DOE-417')):
+    """
+    Concatenate encoded parts into a time-sorted EventStore.
+
+    `attrs` is a county-indexed frame with region, latitude, longitude and population;
+    its index order defines the county codes used by the parts.
+    """
+    parts = list(parts)
+    cols = {k: np.concatenate([p[k] for p in parts]) if parts else np.empty(0, dtype='int64') for k in ('start', 'county', 'event_type', 'customers', 'duration', 'source')}
+    order = np.argsort(cols['start'], kind='stable')
+    cols = {k: v[order] for k, v in cols.items()}
+    counties = list(attrs.index)
+    return EventStore(cols['start'], cols['county'].astype('int16'), cols['event_type'].astype('int8'), cols['customers'].astype('int32'),
+                      cols['duration'].astype('float32'), cols['source'].astype('int8'),
+                      _csr(cols['county'].astype('int64'), len(counties)), _csr(cols['event_type'].astype('int64'), len(EVENT_TYPES)),
+                      counties, list(sources), attrs)
+
+
+def _year_bounds(f):
+    # Year filter -> half-open [first year, last year + 1)
+    first, last = f.value if f.op == 'between' else (f.value, f.value)
+    lo, hi = {'==': (first, last + 1), 'between': (first, last + 1), '>=': (first, None), '>': (first + 1, None), '<': (None, first), '<=': (None, first + 1)}[f.op]
+    to_ns = lambda y: np.datetime64(f'{int(y)}-01-01', 'ns').astype('int64')
+    return (None if lo is None else to_ns(lo)), (None if hi is None else to_ns(hi))
+
+
+def _index_rows(index, codes, lo, hi):
+    # Rows of the given codes inside positions [lo, hi): a binary-searched slice per code
+    offsets, rows = index
+    segs = [rows[offsets[c]:offsets[c + 1]] for c in codes]
+    segs = [s[np.searchsorted(s, lo):np.searchsorted(s, hi)] for s in segs]
+    return np.sort(np.concatenate(segs)) if len(segs) > 1 else segs[0] if segs else np.empty(0, dtype='int64')
+
+
+def select_events(store, plan):
+    """Row positions (time order, or rank order) of the events a compiled plan selects."""
+    lo, hi = 0, len(store.start)
+    county_codes = type_codes = None
+    residual = []
+    for f in plan.filters:
+        if f.column == 'year':
+            t0, t1 = _year_bounds(f)
+            if t0 is not None:
+                lo = max(lo, int(np.searchsorted(store.start, t0, 'left')))
+            if t1 is not None:
+                hi = min(hi, int(np.searchsorted(store.start, t1, 'left')))
+        elif f.column in ('county', 'region'):
+            names = f.value if f.column == 'county' else store.attrs.index[store.attrs['region'].isin(f.value)]
+            codes = {store.counties.index(n) for n in names if n in store.counties}
+            county_codes = codes if county_codes is None else county_codes & codes
+        elif f.column == 'event_type':
+            codes = {EVENT_TYPES.index(t) for t in f.value}
+            type_codes = codes if type_codes is None else type_codes & codes
+        else:
+            residual.append(f)
+    hi = max(lo, hi)
+
+    # Drive from the smaller index and probe the other one by code
+    probes = [(store.county_index, store.county, county_codes), (store.type_index, store.event_type, type_codes)]
+    probes = [p for p in probes if p[2] is not None]
+    if probes:
+        probes.sort(key=lambda p: sum(p[0][0][c + 1] - p[0][0][c] for c in p[2]))
+        idx = _index_rows(probes[0][0], sorted(probes[0][2]), lo, hi)
+        for index, codes_arr, codes in probes[1:]:
+            member = np.zeros(len(index[0]) - 1, dtype=bool)
+            member[list(codes)] = True
+            idx = idx[member[codes_arr[idx]]]
+    else:
+        idx = np.arange(lo, hi)
+
+    for f in residual:
+        idx = idx[compare(_column(store, f.column, idx), f)]
+    if plan.rank:
+        col, ascending, n = plan.rank
+        idx = idx[rank_order(_column(store, col, idx), ascending, n)]
+    return idx
+
+
+def _column(store, col, idx):
+    values = {'customers': store.customers, 'duration_hours': store.duration}[col]
+    return values[idx].astype('float64')
+
+
+def event_frame(store, idx):
+    """Materialize selected events with county attributes for the results table, map and download."""
+    attrs = store.attrs.iloc[store.county[idx]]
+    start = store.start[idx].astype('datetime64[ns]')
+    return pd.DataFrame({
+        'start_time': start,
+        'year': start.astype('datetime64[Y]').astype('int64') + 1970,
+        'county': pd.Categorical.from_codes(store.county[idx], categories=store.counties),
+        'region': attrs['region'].to_numpy(),
+        'event_type': pd.Categorical.from_codes(store.event_type[idx], categories=EVENT_TYPES),
+        'customers': store.customers[idx],
+        'duration_hours': store.duration[idx],
+        'source': pd.Categorical.from_codes(store.source[idx], categories=store.sources),
+        'latitude': attrs['latitude'].to_numpy(),
+        'longitude': attrs['longitude'].to_numpy(),
+        'population': attrs['population'].to_numpy(),
+    })
+
+
+def event_plan(store, query):
+    """QueryPlan of `query` against the event store (cached)."""
+    return compile_query(query, store.counties, EVENT_COLUMNS)
+
+
+@timed('query', 'query_events')
+def query_events(store, query, plan=None):
+    """Compile (cached) and run a natural-language query against the event store; returns (results, explanation)."""
+    plan = plan or event_plan(store, query)
+    return describe(plan, event_frame(store, select_events(store, plan)), query, 'events')
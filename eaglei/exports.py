@@ -0,0 +1,98 @@
+"""
+Streamed table exports: CSV, Parquet and Arrow IPC.
+
+Encoders are generators that yield the file in pieces (CSV text per slice of
+rows, one Parquet row group or one Arrow record batch at a time), so a file can
+be written to disk or assembled on demand without a second full copy of the
+table. The pages hand Streamlit a callable instead of bytes, so nothing is
+encoded until someone clicks download, and the encoded blob is kept in the
+payload LRU under the query plan's hash (plan_key) and the data version.
+"""
+
+import hashlib
+import io
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+# Rows per CSV slice, Parquet row group and Arrow record batch
+CHUNK_ROWS = 100_000
+
+# Format -> (file extension, MIME type)
+EXPORT_FORMATS = {
+    'csv': ('csv', 'text/csv'),
+    'parquet': ('parquet', 'application/vnd.apache.parquet'),
+    'arrow': ('arrow', 'application/vnd.apache.arrow.stream'),
+}
+
+FORMAT_LABELS = {'csv': 'CSV', 'parquet': 'Parquet', 'arrow': 'Arrow IPC'}
+
+
+def _drain(sink):
+    # Bytes written to `sink` since the last drain
+    data = sink.getvalue()
+    sink.seek(0)
+    sink.truncate()
+    return data
+
+
+def iter_csv(df, chunk_rows=CHUNK_ROWS):
+    """Yield `df` as UTF-8 CSV (header first, no index) in slices of `chunk_rows` rows."""
+    yield df.iloc[:0].to_csv(index=False).encode()
+    for lo in range(0, len(df), chunk_rows):
+        yield df.iloc[lo:lo + chunk_rows].to_csv(index=False, header=False).encode()
+
+
+def _arrow_table(df):
+    return pa.Table.from_pandas(df, preserve_index=False)
+
+
+def iter_parquet(df, chunk_rows=CHUNK_ROWS):
+    """Yield `df` as a Parquet file, one row group of `chunk_rows` rows at a time, then the footer."""
+    table = _arrow_table(df)
+    sink = io.BytesIO()
+    with pq.ParquetWriter(sink, table.schema) as writer:
+        for batch in table.to_batches(max_chunksize=chunk_rows):
+            writer.write_table(pa.Table.from_batches([batch], table.schema))
+            yield _drain(sink)
+    yield _drain(sink)
+
+
+def iter_arrow(df, chunk_rows=CHUNK_ROWS):
+    """Yield `df` as an Arrow IPC stream (read back with pyarrow.ipc.open_stream), one record batch at a time."""
+    table = _arrow_table(df)
+    sink = io.BytesIO()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        for batch in table.to_batches(max_chunksize=chunk_rows):
+            writer.write_batch(batch)
+            yield _drain(sink)
+    yield _drain(sink)
+
+
+ENCODERS = {'csv': iter_csv, 'parquet': iter_parquet, 'arrow': iter_arrow}
+
+
+def iter_export(df, fmt, chunk_rows=CHUNK_ROWS):
+    """Yield `df` encoded as `fmt` (an EXPORT_FORMATS key) in pieces."""
+    return ENCODERS[fmt](df, chunk_rows)
+
+
+def export_bytes(df, fmt, chunk_rows=CHUNK_ROWS):
+    """The whole `fmt` file of `df` as one bytes object."""
+    return b''.join(iter_export(df, fmt, chunk_rows))
+
+
+def write_export(df, path, fmt=None, chunk_rows=CHUNK_ROWS):
+    """Stream `df` to `path` as `fmt` (default: from the extension); returns the bytes written."""
+    fmt = fmt or next(f for f, (ext, _) in EXPORT_FORMATS.items() if path.endswith(f'.{ext}'))
+    written = 0
+    with open(path, 'wb') as f:
+        for piece in iter_export(df, fmt, chunk_rows):
+            f.write(piece)
+            written += len(piece)
+    return written
+
+
+def plan_key(plan):
+    """Stable digest of a compiled query plan (eaglei.query.QueryPlan), for keying its exports."""
+    return hashlib.blake2b(repr(plan).encode(), digest_size=16).hexdigest()
@@ -0,0 +1,205 @@
+"""
+Per-county outage forecasts: events and customers affected, 1-3 years ahead.
+
+Every county x event-type series of the outage cube gets a quasi-Poisson GLM,
+log E[y_t] = a + b*t (+ a month effect when the cube has monthly detail), with
+older years down-weighted by a HALF_LIFE so the trend tracks recent ones. All
+series are fitted together by iteratively reweighted least squares: each
+iteration solves one stacked (series x p x p) batch of normal equations with
+np.linalg.solve, so the cost is a few dozen small GEMMs, not one fit per series.
+Forecast bands combine the Poisson noise scaled by each series' dispersion with
+the parameter uncertainty (delta method). Series are treated as independent
+when they are summed to a county, region or the state.
+
+Fitted parameters are saved under the cache directory keyed by a fingerprint
+of the input series and the model (FORECAST_VERSION and its constants), so the
+app and eaglei.batch only refit when the data or the model change.
+"""
+
+import hashlib
+import os
+import re
+from collections import namedtuple
+
+import numpy as np
+import pandas as pd
+
+from eaglei.cache import CACHE_DIR
+from eaglei.cube import rollup
+
+FORECAST_NAME = 'forecast'
+
+# Bump whenever the design, the fit (fit_glm) or the saved arrays change, so cached fits are refitted
+FORECAST_VERSION = 1
+
+# Fitted measures (cube measures)
+MEASURES = ('events', 'customers')
+
+# Years over which an observation's weight in the fit halves, so the trend follows recent years (exponential smoothing)
+HALF_LIFE = 2.0
+
+# Ridge penalty on the trend and month coefficients (the intercept is unpenalized), in units of Fisher information
+RIDGE = 1.0
+
+# counties / event_types: series axes; resolution: 'year' or 'month'; years: fitted years;
+# beta / cov: measure -> (counties x types x p) coefficients and (... x p x p) covariances; dispersion: measure -> (counties x types)
+ForecastModel = namedtuple('ForecastModel', ['counties', 'event_types', 'resolution', 'years', 'beta', 'cov', 'dispersion'])
+
+
+def resolution(cube):
+    """'month' when every event of `cube` has a month, 'year' when some only record the year."""
+    return 'year' if rollup(cube, 'events', where={'month': 0}) > 0 else 'month'
+
+
+def design(years, res, center):
+    """Design matrix (periods x p) and the year of every period: intercept, trend in years, and 11 month effects at monthly resolution."""
+    years = np.asarray(years)
+    if res == 'year':
+        return np.column_stack([np.ones(len(years)), years - center]), years
+    year = np.repeat(years, 12)
+    month = np.tile(np.arange(1, 13), len(years))
+    t = year + (month - 1) / 12 - center
+    return np.column_stack([np.ones(len(t)), t, (month[:, None] == np.arange(2, 13)[None, :]).astype('float64')]), year
+
+
+def series(cube, measure, res):
+    """(counties x types x periods) array of `measure` at resolution `res`."""
+    arr = cube.measures[measure]
+    if measure == 'customers':
+        arr = arr.sum(axis=-1)
+    # cube axes: county, year, month, event_type
+    arr = arr.sum(axis=2) if res == 'year' else arr[:, :, 1:]
+    # -> county, event_type, periods (year-major, month-minor at monthly resolution)
+    arr = np.moveaxis(arr, -1, 1)
+    return arr.reshape(arr.shape[0], arr.shape[1], -1)
+
+
+def fit_glm(y, X, w=None, ridge=RIDGE, iterations=50, tol=1e-8):
+    """
+    Quasi-Poisson log-linear fit of every row of `y` (series x periods) on the shared design `X`.
+
+    `w` are per-period likelihood weights (default 1).
+    Returns coefficients (series x p), their covariance (series x p x p) and the Pearson
+    dispersion (series). All-zero series get a -inf intercept and zero dispersion.
+    """
+    n, p = X.shape
+    S = len(y)
+    w = np.ones(n) if w is None else w
+    penalty = np.full(p, ridge)
+    penalty[0] = 0
+    beta = np.zeros((S, p))
+    active = y.sum(axis=1) > 0
+    beta[:, 0] = np.log(np.where(active, y.mean(axis=1), 1))
+    for _ in range(iterations):
+        eta = np.clip(beta @ X.T, -30, 30)
+        mu = np.exp(eta)
+        z = eta + (y - mu) / mu
+        # Stacked weighted normal equations (X' W X + R) beta = X' W z, one p x p system per series
+        info = np.einsum('tp,st,tq->spq', X, w * mu, X) + np.diag(penalty)
+        new = np.linalg.solve(info, np.einsum('tp,st->sp', X, w * mu * z)[..., None])[..., 0]
+        done = np.abs(new - beta).max() < tol
+        beta = new
+        if done:
+            break
+    mu = np.exp(np.clip(beta @ X.T, -30, 30))
+    info = np.einsum('tp,st,tq->spq', X, w * mu, X) + np.diag(penalty)
+    # Pearson dispersion over the effective number of weighted periods
+    dispersion = (w * (y - mu) ** 2 / mu).sum(axis=1) / max(w.sum() - p, 1)
+    dispersion = np.where(active, np.maximum(dispersion, 1.0), 0.0)
+    cov = np.linalg.inv(info) * dispersion[:, None, None]
+    beta[~active] = 0
+    beta[~active, 0] = -np.inf
+    return beta, cov, dispersion
+
+
+def fit_forecasts(cube):
+    """ForecastModel of every county x event-type series of `cube`."""
+    res, years = resolution(cube), cube.dims['year']
+    X, year = design(years, res, years.mean() if len(years) else 0)
+    w = 0.5 ** ((year.max() - year) / HALF_LIFE) if len(year) else None
+    beta, cov, dispersion = {}, {}, {}
+    for m in MEASURES:
+        y = series(cube, m, res)
+        shape = y.shape[:2]
+        b, c, d = fit_glm(y.reshape(-1, y.shape[-1]), X, w)
+        beta[m], cov[m], dispersion[m] = b.reshape(shape + b.shape[1:]), c.reshape(shape + c.shape[1:]), d.reshape(shape)
+    return ForecastModel(cube.dims['county'], cube.dims['event_type'], res, years, beta, cov, dispersion)
+
+
+def series_fingerprint(cube):
+    """Digest of the fitted inputs (the county x year x month x type events and customers) and the model: FORECAST_VERSION, HALF_LIFE and RIDGE."""
+    h = hashlib.blake2b(digest_size=16)
+    h.update(f'v{FORECAST_VERSION}|{HALF_LIFE!r}|{RIDGE!r}|'.encode())
+    for m in MEASURES:
+        h.update(np.ascontiguousarray(series(cube, m, resolution(cube)), dtype='float64').tobytes())
+    for d in ('county', 'year', 'event_type'):
+        h.update('|'.join(map(str, cube.dims[d])).encode())
+    return h.hexdigest()
+
+
+def cached_forecasts(cube, cache_dir=None):
+    """fit_forecasts(cube), served from <cache_dir>/forecast-<fingerprint>.npz when the series and the model are unchanged."""
+    cache_dir = cache_dir or CACHE_DIR
+    key = series_fingerprint(cube)
+    path = os.path.join(cache_dir, f'{FORECAST_NAME}-{key}.npz')
+    if os.path.exists(path):
+        with np.load(path, allow_pickle=False) as f:
+            return ForecastModel(cube.dims['county'], cube.dims['event_type'], str(f['resolution']), f['years'],
+                                 *({m: f[f'{part}_{m}'] for m in MEASURES} for part in ('beta', 'cov', 'dispersion')))
+    model = fit_forecasts(cube)
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        tmp = f'{path}.{os.getpid()}.tmp.npz'
+        arrays = {f'{part}_{m}': getattr(model, part)[m] for part in ('beta', 'cov', 'dispersion') for m in MEASURES}
+        np.savez(tmp, resolution=model.resolution, years=model.years, **arrays)
+        os.replace(tmp, path)
+        for stale in os.listdir(cache_dir):
+            if re.fullmatch(rf'{FORECAST_NAME}-[0-9a-f]{{32}}\.npz', stale) and stale != os.path.basename(path):
+                os.remove(os.path.join(cache_dir, stale))
+    except OSError:
+        pass
+    return model
+
+
+def forecast(model, horizon=3, counties=None, event_types=None, by=(), level=0.9):
+    """
+    Forecast table for the `horizon` years after the fitted ones.
+
+    Series are restricted to `counties` / `event_types` (None = all) and summed within
+    `by` (a subset of 'county' and 'event_type'). One row per year and group with, per
+    measure, the mean and the `level` band (<measure>_low, <measure>_high; normal
+    approximation, clipped at 0).
+    """
+    from statistics import NormalDist
+    years = np.arange(model.years[-1] + 1, model.years[-1] + 1 + horizon) if len(model.years) else np.empty(0, dtype='int64')
+    X, year = design(years, model.resolution, model.years.mean() if len(model.years) else 0)
+    # Period -> horizon year summation matrix
+    to_year = (year[None, :] == years[:, None]).astype('float64')
+    rows = np.isin(model.counties, model.counties if counties is None else np.atleast_1d(counties))
+    cols = np.isin(model.event_types, model.event_types if event_types is None else np.atleast_1d(event_types))
+    z = NormalDist().inv_cdf(0.5 + level / 2)
+    by = (by,) if isinstance(by, str) else tuple(by)
+    labels = {'county': np.asarray(model.counties)[rows], 'event_type': np.asarray(model.event_types)[cols]}
+    out = {}
+    for m in MEASURES:
+        beta, cov, phi = model.beta[m][rows][:, cols], model.cov[m][rows][:, cols], model.dispersion[m][rows][:, cols]
+        with np.errstate(invalid='ignore'):
+            mu = np.nan_to_num(np.exp(np.clip(beta @ X.T, None, 30)))
+        mean = mu @ to_year.T
+        # d(yearly mean)/d(beta) for every series and year, then g' Cov g plus the quasi-Poisson noise
+        grad = np.einsum('tp,yt,cet->ceyp', X, to_year, mu)
+        var = np.einsum('ceyp,cepq,ceyq->cey', grad, np.nan_to_num(cov), grad) + phi[..., None] * mean
+        keep = tuple(ax for ax, d in enumerate(('county', 'event_type')) if d in by)
+        drop = tuple(ax for ax in (0, 1) if ax not in keep)
+        mean, var = mean.sum(axis=drop), var.sum(axis=drop)
+        out[m] = mean.reshape(-1, len(years)), np.sqrt(var).reshape(-1, len(years))
+    groups = pd.MultiIndex.from_product([labels[d] for d in ('county', 'event_type') if d in by]) if by else pd.Index([0])
+    table = pd.DataFrame({'year': np.tile(years, len(groups))})
+    for level_no, d in enumerate(d for d in ('county', 'event_type') if d in by):
+        table[d] = np.repeat(groups.get_level_values(level_no), len(years))
+    for m, (mean, sd) in out.items():
+        table[m] = mean.ravel()
+        table[f'{m}_low'] = np.clip(mean - z * sd, 0, None).ravel()
+        table[f'{m}_high'] = (mean + z * sd).ravel()
+    order = [d for d in ('county', 'event_type') if d in by]
+    return table[order + [c for c in table.columns if c not in order]]
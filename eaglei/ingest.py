@@ -0,0 +1,145 @@
+"""
+Streaming ingest for eaglei_transformed.csv (EAGLE-I outage events).
+
+The raw file is read in bounded-memory chunks with compact dtypes and every
+chunk is folded into a small county x year x month x event-type aggregate, so the whole
+file never sits in RAM.
+"""
+
+import numpy as np
+import pandas as pd
+
+CHUNKSIZE = 1_000_000
+
+EVENT_TYPES = ['weather', 'equipment', 'psps', 'vegetation', 'unknown']
+
+# Canonical field -> column name in the source file (override per call via `columns=`)
+EAGLEI_COLUMNS = {'county': 'county', 'start_time': 'start_time', 'year': 'year', 'event_type': 'event_type', 'customers': 'customers_affected', 'duration': 'duration_hours',
+                  'latitude': 'latitude', 'longitude': 'longitude'}
+
+# Keyword rules mapping raw cause labels to the dashboard's five event types (first match wins)
+EVENT_TYPE_RULES = [
+    ('psps', ['psps', 'public safety', 'shutoff', 'de-energiz']),
+    ('vegetation', ['vegetation', 'tree']),
+    ('equipment', ['equipment', 'failure', 'fault', 'transmission', 'distribution', 'breaker']),
+    ('weather', ['weather', 'storm', 'wind', 'rain', 'snow', 'heat', 'lightning', 'flood', 'fire']),
+]
+
+AGG_KEYS = ['county', 'year', 'month', 'event_type']
+
+
+def normalize_event_type(label):
+    """Map a raw cause label to one of EVENT_TYPES."""
+    text = str(label).lower()
+    for event_type, keywords in EVENT_TYPE_RULES:
+        if any(k in text for k in keywords):
+            return event_type
+    return 'unknown'
+
+
+def normalize_event_types(cat):
+    """Vectorized normalize_event_type over a categorical Series."""
+    # Rules run once per distinct label, never per row; the trailing slot catches missing labels (code -1)
+    labels = [normalize_event_type(c) for c in cat.cat.categories]
+    lookup = np.append(pd.Categorical(labels, categories=EVENT_TYPES).codes, EVENT_TYPES.index('unknown'))
+    return pd.Categorical.from_codes(lookup[cat.cat.codes.to_numpy()], categories=EVENT_TYPES)
+
+
+def read_eaglei_chunks(path, chunksize=CHUNKSIZE, columns=None):
+    """
+    Yield canonical chunks of the raw EAGLE-I event file.
+
+    Each chunk has columns county (category), year (int16), month (int8), start
+    (datetime64[ns]), event_type (category of EVENT_TYPES), customers (int32) and
+    duration (float32 hours). The year comes from the `year` column when present
+    (start is then January 1st and month 0, "unknown"), otherwise from parsing `start_time`.
+    Optional latitude/longitude columns are passed through (float64) when the file has both.
+    """
+    cols = {**EAGLEI_COLUMNS, **(columns or {})}
+    header = set(pd.read_csv(path, nrows=0).columns)
+    year_col = cols['year'] if cols['year'] in header else cols['start_time']
+    usecols = [cols['county'], year_col, cols['event_type'], cols['customers'], cols['duration']]
+    dtype = {cols['county']: 'category', cols['event_type']: 'category', cols['customers']: 'float64', cols['duration']: 'float32'}
+    coords = [cols['latitude'], cols['longitude']] if {cols['latitude'], cols['longitude']} <= header else []
+    usecols += coords
+    dtype.update({c: 'float64' for c in coords})
+    if year_col == cols['year']:
+        dtype[year_col] = 'float32'
+    for raw in pd.read_csv(path, usecols=usecols, dtype=dtype, chunksize=chunksize):
+        if year_col == cols['year']:
+            year, start = raw[year_col], None
+        else:
+            start = pd.to_datetime(raw[year_col], errors='coerce')
+            year = start.dt.year
+        keep = raw[cols['county']].notna().to_numpy() & year.notna().to_numpy()
+        raw, year = raw[keep], year.to_numpy()[keep].astype('int16')
+        if start is None:
+            start = (year.astype('int64') - 1970).astype('datetime64[Y]')
+            month = np.zeros(len(year), dtype='int8')
+        else:
+            start = start.to_numpy()[keep]
+            month = (start.astype('datetime64[M]').astype('int64') % 12 + 1).astype('int8')
+        yield pd.DataFrame({
+            'county': raw[cols['county']].cat.remove_unused_categories(),
+            'year': year,
+            'month': month,
+            'start': start.astype('datetime64[ns]'),
+            'event_type': normalize_event_types(raw[cols['event_type']]),
+            'customers': raw[cols['customers']].fillna(0).to_numpy().astype('int32'),
+            'duration': raw[cols['duration']].to_numpy(),
+            **{name: raw[c].to_numpy() for name, c in zip(['latitude', 'longitude'], coords)},
+        }, index=raw.index)
+
+
+def fold_chunk(chunk):
+    """Reduce one canonical chunk to county x year x month x event-type partial sums."""
+    part = chunk.groupby(AGG_KEYS, observed=True, sort=False).agg(
+        events=('customers', 'size'), customers=('customers', 'sum'),
+        duration_sum=('duration', 'sum'), duration_n=('duration', 'count')).reset_index()
+    part['county'] = part['county'].astype(str)
+    part['event_type'] = part['event_type'].astype(str)
+    part['customers'] = part['customers'].astype('int64')
+    part['duration_sum'] = part['duration_sum'].astype('float64')
+    return part
+
+
+def combine_partials(parts):
+    """Merge partial aggregates; every measure is additive."""
+    if not parts:
+        return pd.DataFrame({'county': pd.Series(dtype=str), 'year': pd.Series(dtype='int16'), 'month': pd.Series(dtype='int8'), 'event_type': pd.Series(dtype=str),
+                             'events': pd.Series(dtype='int64'), 'customers': pd.Series(dtype='int64'),
+                             'duration_sum': pd.Series(dtype='float64'), 'duration_n': pd.Series(dtype='int64')})
+    return pd.concat(parts, ignore_index=True).groupby(AGG_KEYS, sort=True).sum().reset_index()
+
+
+def aggregate_eaglei(path, chunksize=CHUNKSIZE, columns=None):
+    """
+    Stream the raw EAGLE-I file into a county x year x month x event-type aggregate table.
+
+    Columns: county, year, month, event_type, events, customers, duration_sum, duration_n.
+    Durations are kept as sum/count so averages stay exact when tables are merged.
+    """
+    parts = []
+    for chunk in read_eaglei_chunks(path, chunksize, columns):
+        parts.append(fold_chunk(chunk))
+        if len(parts) >= 32:
+            parts = [combine_partials(parts)]
+    return combine_partials(parts)
+
+
+def county_summary(agg):
+    """Per-county outage columns in load_data() layout, indexed by county."""
+    totals = agg.groupby('county').agg(event_count=('events', 'sum'), total_customers=('customers', 'sum'), duration_sum=('duration_sum', 'sum'), duration_n=('duration_n', 'sum'))
+    totals['avg_duration'] = (totals['duration_sum'] / totals['duration_n'].replace(0, np.nan)).fillna(0).round(2)
+    # Counts may be fractional when the table was apportioned from summaries (cube.apportion_by_year)
+    totals[['event_count', 'total_customers']] = totals[['event_count', 'total_customers']].round().astype('int64')
+    by_type = agg.pivot_table(index='county', columns='event_type', values='events', aggfunc='sum', fill_value=0).reindex(columns=EVENT_TYPES, fill_value=0).round().astype('int64')
+    return totals[['event_count', 'total_customers', 'avg_duration']].join(by_type).rename_axis(columns=None)
+
+
+def yearly_summary(agg):
+    """Statewide events and customers per year in load_yearly() layout."""
+    yearly = agg.groupby('year', as_index=False).agg(events=('events', 'sum'), customers=('customers', 'sum'))
+    yearly['year'] = yearly['year'].astype(int)
+    yearly[['events', 'customers']] = yearly[['events', 'customers']].round().astype('int64')
+    return yearly
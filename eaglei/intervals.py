@@ -0,0 +1,56 @@
+"""
+Sorted interval index for overlap joins (which outages overlap this DOE-417 report?).
+
+Intervals are [start, end] int64 nanosecond timestamps, each in a group (a
+county code). The index sorts them by one composite key per interval:
+group * 2**34 + start in seconds since 1970. 2**34 seconds is about 544 years,
+so every group fits in one sorted array, and one searchsorted answers all the
+queries together.
+
+`reach` is the running maximum of the end keys in that order, so it never
+decreases. The intervals that can overlap a query [s, e] are therefore the
+contiguous range from the first position whose reach is at least s up to the
+last position whose start is at most e. Only that range is checked exactly:
+the searches cost O(queries log n), plus one check per candidate, i.e. per
+interval of the group starting between s - L and e, where L is the longest
+interval before it in the group. With short intervals that is close to the
+matches; one very long interval makes every later interval of its group a
+candidate, so such queries cost up to the group's size.
+"""
+
+from collections import namedtuple
+
+import numpy as np
+
+GROUP_SHIFT = 34
+
+# rows: caller's row ids in sorted order; start/end: exact bounds (ns) in that order;
+# key: composite start keys; reach: running max of the composite end keys
+IntervalIndex = namedtuple('IntervalIndex', ['rows', 'start', 'end', 'key', 'reach'])
+
+
+def _keys(group, ns, ceil=False):
+    seconds = np.asarray(ns, dtype='int64') // 1_000_000_000 + (1 if ceil else 0)
+    return (np.asarray(group, dtype='int64') << GROUP_SHIFT) + np.clip(seconds, 0, (1 << GROUP_SHIFT) - 1)
+
+
+def interval_index(group, start, end, rows=None):
+    """IntervalIndex over intervals [start, end] (int64 ns) in non-negative integer `group`s; `rows` are the ids overlap_join() returns (default 0..n-1)."""
+    start, end = np.asarray(start, dtype='int64'), np.asarray(end, dtype='int64')
+    rows = np.arange(len(start)) if rows is None else np.asarray(rows)
+    key = _keys(group, start)
+    order = np.argsort(key, kind='stable')
+    return IntervalIndex(rows[order], start[order], end[order], key[order], np.maximum.accumulate(_keys(group, end, ceil=True)[order]) if len(order) else key)
+
+
+def overlap_join(index, group, start, end):
+    """(query positions, index rows) of every pair where interval [start, end] in `group` overlaps an indexed interval of the same group."""
+    start, end = np.asarray(start, dtype='int64'), np.asarray(end, dtype='int64')
+    # Candidate range per query: reach >= query start .. start key <= query end (keys are conservative, checked exactly below)
+    lo = np.searchsorted(index.reach, _keys(group, start), 'left')
+    hi = np.searchsorted(index.key, _keys(group, end, ceil=True), 'right')
+    n = np.maximum(hi - lo, 0)
+    query = np.repeat(np.arange(len(start)), n)
+    pos = np.repeat(lo - np.cumsum(n) + n, n) + np.arange(n.sum())
+    hit = (index.start[pos] <= end[query]) & (index.end[pos] >= start[query])
+    return query[hit], index.rows[pos[hit]]
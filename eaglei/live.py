@@ -0,0 +1,140 @@
+"""
+Incremental append of new EAGLE-I batches onto the outage aggregates.
+
+A batch of raw rows is folded into a small aggregate delta and added to the
+running county x year x month x event-type sums; averages stay exact because
+durations are kept as sum/count accumulators. Appended deltas and the
+watermarks (latest start time taken per county, plus the content hashes of
+applied batches) are persisted together in one Arrow file next to the source
+cache, so re-running the same or an overlapping batch adds nothing twice.
+Watermarks are per county, so batches only have to move forward in time per
+county: late rows for one county are kept even after a batch with newer rows
+for another county was applied.
+
+Rows with coordinates are also folded into finest-level map cells
+(eaglei.tiles), so the binned map layer includes appended batches. The cells
+go to a second file named by their fingerprint, written before the delta file
+that points at it, so a crash between the two never pairs a delta with the
+wrong cells.
+"""
+
+import json
+import os
+import re
+from collections import namedtuple
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.feather as feather
+
+from eaglei.cache import CACHE_DIR, content_hash, frame_fingerprint
+from eaglei.ingest import CHUNKSIZE, combine_partials, fold_chunk, read_eaglei_chunks
+from eaglei.tiles import combine_cells, fold_points
+
+LIVE_NAME = 'eaglei_live'
+
+# tables: 'base' (full-load aggregates), 'delta' (all appended batches), 'agg' (base + delta) and
+# 'cells' (map cells of the appended rows with coordinates);
+# meta: {'base', 'watermarks' (county -> latest start ns), 'batches', 'cells' (fingerprint of the cells file)}
+# stored in the delta file's schema metadata
+LiveState = namedtuple('LiveState', ['tables', 'meta', 'cache_dir'])
+
+
+def open_live(base, cache_dir=None):
+    """LiveState over `base` with the persisted deltas re-applied; deltas made for a different base or store format are dropped."""
+    cache_dir = cache_dir or CACHE_DIR
+    # Appended deltas only apply on top of the base they were made for
+    key = frame_fingerprint(base)
+    meta, delta, cells = {'base': key, 'watermarks': {}, 'batches': [], 'cells': None}, combine_partials([]), combine_cells([])
+    try:
+        table = feather.read_table(os.path.join(cache_dir, f'{LIVE_NAME}.arrow'))
+        saved = json.loads(table.schema.metadata[LIVE_NAME.encode()])
+        if saved.get('base') == key and 'watermarks' in saved:
+            meta, delta = {'cells': None, **saved}, table.replace_schema_metadata(None).to_pandas()
+            if meta['cells']:
+                cells = feather.read_table(os.path.join(cache_dir, f'{LIVE_NAME}_cells-{meta["cells"]}.arrow')).to_pandas()
+    except (OSError, KeyError, TypeError, ValueError, pa.ArrowInvalid):
+        pass
+    return LiveState({'base': base, 'delta': delta, 'agg': combine_partials([base, delta]), 'cells': cells}, meta, cache_dir)
+
+
+def apply_batch(state, path, chunksize=CHUNKSIZE, columns=None):
+    """
+    Fold a batch file of raw EAGLE-I rows into a new LiveState and persist it; `state` is left untouched.
+
+    Returns the new state and the batch's aggregate delta (`state` itself and an empty
+    delta when nothing was new). A batch whose content hash was already applied is
+    skipped outright; timestamped rows at or before their county's watermark are
+    dropped, so overlapping snapshot exports are only counted once. Year-only rows carry no
+    timestamp and rely on the batch hash alone.
+    """
+    digest = content_hash(path)
+    if digest in state.meta['batches']:
+        return state, combine_partials([])
+    marks, floor = state.meta['watermarks'], np.iinfo('int64').min
+    latest, parts, cells = dict(marks), [], []
+    for chunk in read_eaglei_chunks(path, chunksize, columns):
+        start = chunk['start'].to_numpy().view('int64')
+        timed = chunk['month'].to_numpy() > 0
+        # Each row against its own county's watermark (as of before this batch)
+        county = chunk['county']
+        limit = np.array([marks.get(c, floor) for c in county.cat.categories], dtype='int64')[county.cat.codes.to_numpy()]
+        new = ~timed | (start > limit)
+        chunk, start, timed = chunk[new], start[new], timed[new]
+        if timed.any():
+            for c, wm in pd.Series(start[timed]).groupby(chunk['county'].to_numpy()[timed]).max().items():
+                latest[c] = max(latest.get(c, floor), int(wm))
+        parts.append(fold_chunk(chunk))
+        if 'latitude' in chunk:
+            cells.append(fold_points(chunk))
+    delta = combine_partials(parts)
+    tables = {**state.tables,
+              'delta': combine_partials([state.tables['delta'], delta]),
+              'agg': combine_partials([state.tables['agg'], delta])}
+    meta = {**state.meta, 'watermarks': latest, 'batches': state.meta['batches'] + [digest]}
+    if cells:
+        tables['cells'] = combine_cells([state.tables['cells']] + cells)
+        meta['cells'] = frame_fingerprint(tables['cells'])
+    new = LiveState(tables, meta, state.cache_dir)
+    _persist(new)
+    return new, delta
+
+
+def append_batch(state, path, chunksize=CHUNKSIZE, columns=None):
+    """apply_batch() folded into `state` in place; returns the batch's aggregate delta."""
+    new, delta = apply_batch(state, path, chunksize, columns)
+    state.tables.update(new.tables)
+    state.meta.update(new.meta)
+    return delta
+
+
+def _write(table, path):
+    tmp = f'{path}.{os.getpid()}.tmp'
+    feather.write_feather(table, tmp, compression='uncompressed')
+    os.replace(tmp, path)
+
+
+def _persist(state):
+    # Delta and watermark go into one file replaced atomically, so they can never disagree;
+    # the cells file it names is written first and older ones removed after
+    table = pa.Table.from_pandas(state.tables['delta'], preserve_index=False)
+    table = table.replace_schema_metadata({**(table.schema.metadata or {}), LIVE_NAME.encode(): json.dumps(state.meta).encode()})
+    cells = f'{LIVE_NAME}_cells-{state.meta["cells"]}.arrow' if state.meta['cells'] else None
+    try:
+        os.makedirs(state.cache_dir, exist_ok=True)
+        if cells and not os.path.exists(os.path.join(state.cache_dir, cells)):
+            _write(pa.Table.from_pandas(state.tables['cells'], preserve_index=False), os.path.join(state.cache_dir, cells))
+        _write(table, os.path.join(state.cache_dir, f'{LIVE_NAME}.arrow'))
+        for stale in os.listdir(state.cache_dir):
+            if re.fullmatch(rf'{LIVE_NAME}_cells-[0-9a-f]+\.arrow', stale) and stale != cells:
+                os.remove(os.path.join(state.cache_dir, stale))
+    except OSError:
+        pass
+
+
+def watermark_time(state, county=None):
+    """Latest appended start time (of `county`, default any county) as a Timestamp, or None before any timestamped batch."""
+    marks = state.meta['watermarks']
+    values = [marks[county]] if county in marks else [] if county is not None else list(marks.values())
+    return pd.Timestamp(np.int64(max(values)), unit='ns') if values else None
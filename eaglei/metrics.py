@@ -0,0 +1,151 @@
+"""
+Process-wide timing, cache and memory metrics for the app's hot paths.
+
+timed(stage, name) works as a context manager and as a decorator. It adds the
+wall time of each call to a histogram for that (stage, name) pair. The stages
+are cache (a cached loader call), load (a loader computing on a cache miss),
+query, figure and render. count() and set_gauge() record cache calls, misses
+and sizes. Everything lives in one registry per server process behind a lock,
+because Streamlit serves sessions from separate threads.
+
+The admin Performance page reads the registry, and write_prometheus() saves
+it in the Prometheus text exposition format for a textfile scraper. Only the
+standard library is imported, so the registry costs nothing at startup.
+"""
+
+import os
+import resource
+import sys
+import threading
+import time
+from bisect import bisect_left
+from collections import namedtuple
+from contextlib import contextmanager
+
+# Histogram bucket upper bounds in seconds (Prometheus `le`)
+BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+# Prometheus dump path (EAGLEI_METRICS_FILE overrides <cache dir>/metrics.prom)
+METRICS_FILE = os.environ.get('EAGLEI_METRICS_FILE') or os.path.join(
+    os.environ.get('EAGLEI_CACHE_DIR') or os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), '.eaglei_cache'), 'metrics.prom')
+
+# timings: (stage, name) -> [count, sum, max, per-bucket counts..., overflow count]
+# counters / gauges: (metric, sorted label pairs) -> value; started: time.time() of creation or reset
+Registry = namedtuple('Registry', ['timings', 'counters', 'gauges', 'lock', 'started'])
+
+
+def registry():
+    """Empty Registry."""
+    return Registry({}, {}, {}, threading.Lock(), [time.time()])
+
+
+METRICS = registry()
+
+
+def observe(stage, name, seconds, metrics=METRICS):
+    """Add one `seconds` observation to the (stage, name) histogram."""
+    with metrics.lock:
+        row = metrics.timings.get((stage, name))
+        if row is None:
+            row = metrics.timings[(stage, name)] = [0, 0.0, 0.0] + [0] * (len(BUCKETS) + 1)
+        row[0] += 1
+        row[1] += seconds
+        row[2] = max(row[2], seconds)
+        row[3 + bisect_left(BUCKETS, seconds)] += 1
+
+
+@contextmanager
+def timed(stage, name, metrics=METRICS):
+    """Time the block (or, used as a decorator, every call) into the (stage, name) histogram, exceptions included."""
+    t0 = time.perf_counter()
+    try:
+        yield
+    finally:
+        observe(stage, name, time.perf_counter() - t0, metrics)
+
+
+def count(metric, n=1, metrics=METRICS, **labels):
+    """Add `n` to the counter `metric` with `labels`."""
+    key = metric, tuple(sorted(labels.items()))
+    with metrics.lock:
+        metrics.counters[key] = metrics.counters.get(key, 0) + n
+
+
+def set_gauge(metric, value, metrics=METRICS, **labels):
+    """Set the gauge `metric` with `labels` to `value`."""
+    with metrics.lock:
+        metrics.gauges[metric, tuple(sorted(labels.items()))] = value
+
+
+def reset(metrics=METRICS):
+    """Drop every timing, counter and gauge and restart the uptime clock."""
+    with metrics.lock:
+        metrics.timings.clear()
+        metrics.counters.clear()
+        metrics.gauges.clear()
+        metrics.started[0] = time.time()
+
+
+def snapshot(metrics=METRICS):
+    """Consistent copy of the registry: (timings, counters, gauges, started) with the rows copied."""
+    with metrics.lock:
+        return {k: list(v) for k, v in metrics.timings.items()}, dict(metrics.counters), dict(metrics.gauges), metrics.started[0]
+
+
+def peak_rss_bytes():
+    """Peak resident set size of this process."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and in kilobytes elsewhere
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+
+def rss_bytes():
+    """Current resident set size of this process (from /proc; the peak where /proc is unavailable)."""
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, IndexError):
+        return peak_rss_bytes()
+
+
+def _labels(pairs):
+    escape = lambda v: str(v).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+    return '{' + ','.join(f'{k}="{escape(v)}"' for k, v in pairs) + '}' if pairs else ''
+
+
+def prometheus_text(metrics=METRICS):
+    """The registry plus process memory and uptime in the Prometheus text exposition format."""
+    timings, counters, gauges, started = snapshot(metrics)
+    lines = ['# HELP eaglei_stage_seconds Wall time of instrumented loaders, queries, figure builds and page renders.',
+             '# TYPE eaglei_stage_seconds histogram']
+    for (stage, name), row in sorted(timings.items()):
+        labels = (('stage', stage), ('name', name))
+        cumulative = 0
+        for bound, n in zip(BUCKETS, row[3:]):
+            cumulative += n
+            lines.append(f'eaglei_stage_seconds_bucket{_labels(labels + (("le", f"{bound:g}"),))} {cumulative}')
+        lines.append(f'eaglei_stage_seconds_bucket{_labels(labels + (("le", "+Inf"),))} {row[0]}')
+        lines.append(f'eaglei_stage_seconds_sum{_labels(labels)} {row[1]:.6f}')
+        lines.append(f'eaglei_stage_seconds_count{_labels(labels)} {row[0]}')
+    for kind, values in (('counter', counters), ('gauge', gauges)):
+        for metric in sorted({m for m, _ in values}):
+            name = f'eaglei_{metric}_total' if kind == 'counter' else f'eaglei_{metric}'
+            lines.append(f'# TYPE {name} {kind}')
+            lines.extend(f'{name}{_labels(pairs)} {value}' for (m, pairs), value in sorted(values.items()) if m == metric)
+    lines += ['# TYPE eaglei_process_resident_memory_bytes gauge', f'eaglei_process_resident_memory_bytes {rss_bytes()}',
+              '# TYPE eaglei_process_peak_resident_memory_bytes gauge', f'eaglei_process_peak_resident_memory_bytes {peak_rss_bytes()}',
+              '# TYPE eaglei_metrics_uptime_seconds gauge', f'eaglei_metrics_uptime_seconds {time.time() - started:.1f}']
+    return '\n'.join(lines) + '\n'
+
+
+def write_prometheus(path=METRICS_FILE, metrics=METRICS):
+    """Atomically replace `path` with prometheus_text(); returns False when it cannot be written."""
+    tmp = f'{path}.{os.getpid()}.tmp'
+    try:
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        with open(tmp, 'w') as f:
+            f.write(prometheus_text(metrics))
+        os.replace(tmp, path)
+    except OSError:
+        return False
+    return True
@@ -0,0 +1,84 @@
+"""
+Process-wide LRU cache for rendered figures and computed page payloads.
+
+Streamlit reruns the whole script on every interaction, so each view would
+otherwise rebuild the same Plotly figures and pandas results. Payloads are
+stored under (page, widget state, data fingerprint) in one OrderedDict
+shared by all sessions of the server process. Each entry's size is
+estimated once when it is inserted, and least recently used entries are
+evicted once the total exceeds the memory cap. A lock guards the dict
+because Streamlit serves sessions from separate threads.
+"""
+
+import os
+import sys
+import threading
+from collections import OrderedDict, namedtuple
+
+import numpy as np
+import pandas as pd
+
+# Memory cap in bytes (EAGLEI_PAYLOAD_CACHE_MB overrides the 256 MB default)
+PAYLOAD_LIMIT = int(float(os.environ.get('EAGLEI_PAYLOAD_CACHE_MB', 256)) * 2 ** 20)
+
+# entries: key -> (payload, size in bytes), oldest first; stats: hits, misses, evictions, bytes
+PayloadCache = namedtuple('PayloadCache', ['entries', 'lock', 'limit', 'stats'])
+
+
+def payload_cache(limit=PAYLOAD_LIMIT):
+    """Empty PayloadCache holding at most `limit` bytes."""
+    return PayloadCache(OrderedDict(), threading.Lock(), limit, {'hits': 0, 'misses': 0, 'evictions': 0, 'bytes': 0})
+
+
+def payload_key(page, state, fingerprint):
+    """Hashable cache key from a page name, a dict of widget values and a data fingerprint."""
+    return page, tuple(sorted(state.items())), fingerprint
+
+
+def payload_size(value):
+    """Approximate memory held by a payload: frames deeply, figures by their JSON, containers recursively."""
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(deep=True).sum())
+    if isinstance(value, pd.Series):
+        return int(value.memory_usage(deep=True))
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    if isinstance(value, (tuple, list)):
+        return sys.getsizeof(value) + sum(payload_size(v) for v in value)
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(payload_size(v) for v in value.values())
+    if hasattr(value, 'to_plotly_json'):
+        # Plotly figures: the serialized spec is what the figure actually carries
+        return len(value.to_json())
+    return sys.getsizeof(value)
+
+
+def cached_payload(cache, key, build):
+    """
+    Return the payload stored under `key`, calling `build()` to create it on a miss.
+
+    Concurrent misses on the same key may each build it, and the last one to finish
+    is kept. A payload larger than the whole cap is returned without being stored.
+    Callers must treat the returned payload as read-only, because other sessions
+    share it.
+    """
+    with cache.lock:
+        if key in cache.entries:
+            cache.entries.move_to_end(key)
+            cache.stats['hits'] += 1
+            return cache.entries[key][0]
+        cache.stats['misses'] += 1
+    value = build()
+    size = payload_size(value)
+    if size > cache.limit:
+        return value
+    with cache.lock:
+        if key in cache.entries:
+            cache.stats['bytes'] -= cache.entries.pop(key)[1]
+        cache.entries[key] = (value, size)
+        cache.stats['bytes'] += size
+        while cache.stats['bytes'] > cache.limit:
+            _, (_, dropped) = cache.entries.popitem(last=False)
+            cache.stats['bytes'] -= dropped
+            cache.stats['evictions'] += 1
+    return value
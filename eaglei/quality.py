@@ -0,0 +1,244 @@
+"""
+Column-level data quality of the working tables and the raw source files (Data Quality page).
+
+A profile is built one chunk at a time and every part of it is mergeable. Per
+column it keeps:
+- counts of nulls, zeros (any numeric dtype, nullable ones included) and
+  sentinels such as EIA-861's "." or DOE-417's empty Date_of_Restoration;
+- the min and max;
+- a HyperLogLog sketch for the approximate distinct count;
+- for timestamp columns, the values that fail to parse or fall outside the
+  expected range.
+
+Duplicate keys are counted exactly. Each part keeps the sorted unique 64-bit
+hashes of its key columns, so memory grows with the distinct keys (8 bytes
+each) and not with rows times columns. merge_profiles() combines parts from
+chunks or worker processes. The result is identical in any order, because
+sums, min/max, register maxima and hash-set unions are all associative.
+"""
+
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from eaglei.eia import COUNT_COLUMNS
+
+# HyperLogLog precision: 2**12 registers (~1.6% standard error). The remaining 52 hash
+# bits convert to float64 exactly, so leading zeros come straight from np.frexp.
+HLL_P = 12
+HLL_M = 1 << HLL_P
+
+PROFILE_CHUNKSIZE = 250_000
+
+# Timestamps outside this span are reported as out of range
+TIME_RANGE = (pd.Timestamp('2000-01-01'), None)
+
+# rows: rows seen; columns: name -> stats dict; keys: sorted unique key hashes (None without a key);
+# duplicates: rows whose key was already seen
+Profile = namedtuple('Profile', ['rows', 'columns', 'keys', 'duplicates'])
+
+# Per source file: key columns, sentinel values per column and timestamp columns (-> strptime format or None)
+SOURCE_PROFILES = {
+    'eaglei': {'key': ['county', 'start_time', 'event_type'], 'sentinels': {}, 'times': {'start_time': None}},
+    'snapshots': {'key': ['county', 'state', 'run_start_time'], 'sentinels': {}, 'times': {'run_start_time': None}},
+    'doe417': {'key': ['Event_ID'], 'sentinels': {'Date_of_Restoration': ['']}, 'times': {'Date_Event_Began': '%m/%d/%Y'}},
+    'eia861': {'key': ['Year', 'Utility_Number', 'county'], 'sentinels': {c: ['.', ''] for c in COUNT_COLUMNS + ['Total_Customer_ Count']}, 'times': {}},
+}
+
+
+def _hash(values):
+    # Value-based 64-bit hashes that agree across chunks whatever dtype pandas inferred
+    if pd.api.types.is_numeric_dtype(values) and not pd.api.types.is_bool_dtype(values):
+        values = values.astype('float64')
+    elif isinstance(values.dtype, pd.CategoricalDtype) or pd.api.types.is_datetime64_any_dtype(values):
+        values = values.astype(str)
+    return pd.util.hash_pandas_object(values, index=False).to_numpy()
+
+
+def hll_registers(hashes):
+    """HyperLogLog registers (uint8[HLL_M]) of 64-bit hashes."""
+    hashes = np.asarray(hashes, dtype='uint64')
+    index = (hashes >> np.uint64(64 - HLL_P)).astype('int64')
+    rest = (hashes & np.uint64((1 << (64 - HLL_P)) - 1)).astype('float64')
+    # Rank = position of the first 1-bit in the remaining 52 bits (53 when all are zero)
+    rank = np.where(rest > 0, 64 - HLL_P + 1 - np.frexp(rest)[1], 64 - HLL_P + 1).astype('uint8')
+    registers = np.zeros(HLL_M, dtype='uint8')
+    np.maximum.at(registers, index, rank)
+    return registers
+
+
+def hll_estimate(registers):
+    """Distinct-count estimate from HyperLogLog registers (linear counting for small cardinalities)."""
+    alpha = 0.7213 / (1 + 1.079 / HLL_M)
+    estimate = alpha * HLL_M ** 2 / np.sum(2.0 ** -registers.astype('float64'))
+    zeros = int((registers == 0).sum())
+    if estimate <= 2.5 * HLL_M and zeros:
+        estimate = HLL_M * np.log(HLL_M / zeros)
+    return int(round(estimate))
+
+
+def _extreme(a, b, pick):
+    # min/max that tolerate None and values of different types (then compared as text)
+    if a is None or b is None:
+        return b if a is None else a
+    try:
+        return pick(a, b)
+    except TypeError:
+        return pick(str(a), str(b))
+
+
+def _as_numeric(values):
+    # Text columns whose every non-null value is a number ("32,803" included) as float64, else None
+    if not (pd.api.types.is_object_dtype(values) or pd.api.types.is_string_dtype(values)) or isinstance(values.dtype, pd.CategoricalDtype):
+        return None
+    # Cheap rejection of ordinary text columns before converting the whole chunk
+    if pd.to_numeric(values.iloc[:100].astype('string').str.replace(',', '', regex=False).str.strip(), errors='coerce').isna().any():
+        return None
+    numbers = pd.to_numeric(values.astype('string').str.replace(',', '', regex=False).str.strip(), errors='coerce')
+    return numbers.astype('float64') if numbers.notna().sum() == values.notna().sum() else None
+
+
+def profile_column(values, sentinels=(), time_format=False, time_range=TIME_RANGE):
+    """
+    Stats dict of one column chunk: rows, nulls, zeros, sentinels, min, max, hll and,
+    for timestamp columns (time_format a strptime format, None to infer, False for none),
+    unparsed and out_of_range counts. Sentinel values count as neither null nor data.
+    """
+    stats = {'rows': len(values), 'nulls': 0, 'zeros': 0, 'sentinels': 0, 'min': None, 'max': None, 'unparsed': 0, 'out_of_range': 0, 'numeric': False}
+    if len(sentinels):
+        hit = values.isin(list(sentinels)).to_numpy(dtype=bool)
+        stats['sentinels'] = int(hit.sum())
+        values = values[~hit]
+    null = values.isna().to_numpy(dtype=bool)
+    stats['nulls'] = int(null.sum())
+    values = values[~null]
+    if time_format is not False:
+        parsed = pd.to_datetime(values, format=time_format, errors='coerce')
+        stats['unparsed'] = int(parsed.isna().sum())
+        lo, hi = time_range
+        hi = hi if hi is not None else pd.Timestamp.now()
+        stats['out_of_range'] = int(((parsed < lo) | (parsed > hi)).sum())
+        values = parsed.dropna()
+    else:
+        numbers = values if pd.api.types.is_numeric_dtype(values) and not pd.api.types.is_bool_dtype(values) else _as_numeric(values)
+        if numbers is not None:
+            stats['numeric'] = True
+            stats['zeros'] = int((numbers == 0).sum())
+            values = numbers
+    if len(values):
+        if isinstance(values.dtype, pd.CategoricalDtype):
+            values = values.astype(str)
+        stats['min'], stats['max'] = values.min(), values.max()
+        stats['min'] = stats['min'].item() if hasattr(stats['min'], 'item') else stats['min']
+        stats['max'] = stats['max'].item() if hasattr(stats['max'], 'item') else stats['max']
+    stats['hll'] = hll_registers(_hash(values)) if len(values) else np.zeros(HLL_M, dtype='uint8')
+    return stats
+
+
+def _sorted_unique(hashes):
+    # np.unique's hash-table path is several times slower than a sort for uint64
+    hashes = np.sort(hashes)
+    return hashes[np.concatenate(([True], hashes[1:] != hashes[:-1]))] if len(hashes) else hashes
+
+
+def _key_hashes(df, key):
+    # Sorted unique key hashes of a chunk and how many of its rows repeat a key within it
+    hashes = _hash(df[key[0]])
+    for col in key[1:]:
+        # FNV-style combination (wraps around in uint64)
+        hashes = (hashes * np.uint64(0x100000001B3)) ^ _hash(df[col])
+    unique = _sorted_unique(hashes)
+    return unique, len(hashes) - len(unique)
+
+
+def profile_chunk(df, key=None, sentinels=None, times=None, time_range=TIME_RANGE):
+    """Profile of one DataFrame chunk; `sentinels` maps column -> sentinel values, `times` column -> strptime format (None infers)."""
+    sentinels, times = sentinels or {}, times or {}
+    columns = {col: profile_column(df[col], sentinels.get(col, ()), times.get(col, False), time_range) for col in df.columns}
+    key = [c for c in key or [] if c in df.columns]
+    keys, duplicates = _key_hashes(df, key) if key else (None, 0)
+    return Profile(len(df), columns, keys, duplicates)
+
+
+def _merge_stats(a, b):
+    merged = {k: a[k] + b[k] for k in ('rows', 'nulls', 'zeros', 'sentinels', 'unparsed', 'out_of_range')}
+    merged.update(min=_extreme(a['min'], b['min'], min), max=_extreme(a['max'], b['max'], max), hll=np.maximum(a['hll'], b['hll']), numeric=a['numeric'] or b['numeric'])
+    return merged
+
+
+def merge_profiles(profiles):
+    """Combine partial profiles (chunks, files or worker results) into one."""
+    profiles = [p for p in profiles if p is not None]
+    if not profiles:
+        return Profile(0, {}, None, 0)
+    columns = {}
+    for p in profiles:
+        for col, stats in p.columns.items():
+            columns[col] = _merge_stats(columns[col], stats) if col in columns else stats
+    keyed = [p.keys for p in profiles if p.keys is not None]
+    keys, duplicates = None, sum(p.duplicates for p in profiles)
+    if keyed:
+        # A key already present in another part repeats once per extra part holding it
+        all_keys = np.concatenate(keyed)
+        keys = _sorted_unique(all_keys)
+        duplicates += len(all_keys) - len(keys)
+    return Profile(sum(p.rows for p in profiles), columns, keys, duplicates)
+
+
+def profile_frame(df, key=None, sentinels=None, times=None, chunksize=PROFILE_CHUNKSIZE):
+    """Profile of an in-memory table, `chunksize` rows at a time."""
+    parts = [profile_chunk(df.iloc[i:i + chunksize], key, sentinels, times) for i in range(0, len(df), chunksize)]
+    return merge_profiles(parts) if parts else profile_chunk(df, key, sentinels, times)
+
+
+def profile_csv(path, key=None, sentinels=None, times=None, chunksize=PROFILE_CHUNKSIZE):
+    """
+    Profile of a CSV file read in `chunksize`-row chunks.
+
+    Only empty fields become nulls, and sentinel columns are read as raw text, so
+    values such as "." or an empty Date_of_Restoration are counted as sentinels.
+    """
+    sentinels = sentinels or {}
+    header = list(pd.read_csv(path, nrows=0).columns)
+    # Empty fields are nulls except where '' is itself a sentinel
+    na_values = {c: [''] for c in header if '' not in sentinels.get(c, ())}
+    dtype = {c: 'string' for c in sentinels if c in header}
+    parts = [profile_chunk(chunk, key, sentinels, times) for chunk in pd.read_csv(path, chunksize=chunksize, keep_default_na=False, na_values=na_values, dtype=dtype)]
+    return merge_profiles(parts)
+
+
+def _profile_source_file(args):
+    path, spec, chunksize = args
+    return profile_csv(path, spec['key'], spec['sentinels'], spec['times'], chunksize)
+
+
+def profile_source(paths, spec, workers=1, chunksize=PROFILE_CHUNKSIZE):
+    """
+    Profile of one source spread over `paths` (e.g. the yearly snapshot files) with a
+    SOURCE_PROFILES `spec`; files are profiled by a process pool when `workers` > 1.
+    """
+    jobs = [(p, spec, chunksize) for p in paths]
+    if workers > 1 and len(jobs) > 1:
+        with ProcessPoolExecutor(min(workers, len(jobs))) as pool:
+            return merge_profiles(pool.map(_profile_source_file, jobs))
+    return merge_profiles(map(_profile_source_file, jobs))
+
+
+def profile_report(profile):
+    """(report, score): one row per column and the mean completeness (% of rows neither null nor sentinel)."""
+    rows = []
+    n = max(profile.rows, 1)
+    for col, s in profile.columns.items():
+        missing = s['nulls'] + s['sentinels']
+        rows.append({'Column': col, 'Nulls': s['nulls'], 'Null%': round(s['nulls'] / n * 100, 2), 'Zeros': s['zeros'], 'Zero%': round(s['zeros'] / n * 100, 2),
+                     'Sentinels': s['sentinels'], 'Distinct≈': hll_estimate(s['hll']), 'Min': '' if s['min'] is None else str(s['min']), 'Max': '' if s['max'] is None else str(s['max']),
+                     'Unparsed': s['unparsed'], 'Out of range': s['out_of_range'], 'Completeness': round(100 - missing / n * 100, 2)})
+    report = pd.DataFrame(rows, columns=['Column', 'Nulls', 'Null%', 'Zeros', 'Zero%', 'Sentinels', 'Distinct≈', 'Min', 'Max', 'Unparsed', 'Out of range', 'Completeness'])
+    return report, float(report['Completeness'].mean()) if len(report) else 100.0
+
+
+def analyze_missingness(df, key=None):
+    """Per-column profile_report of an in-memory table: nulls, zeros, sentinels, distinct counts, range and completeness."""
+    return profile_report(profile_frame(df, key))
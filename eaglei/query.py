@@ -0,0 +1,419 @@
+"""
+Natural-language query engine for the Query & Explore page.
+
+A query is tokenized and compiled once into a QueryPlan (filter -> sort -> top-N ->
+aggregate) over a column registry, and compiled plans are cached by normalized
+query text. Execution ANDs every filter into a single boolean mask over the column
+arrays and takes the selected rows once, so clauses combine
+("Bay Area with more than 2000 events") without intermediate frame copies.
+"""
+
+import re
+from collections import namedtuple
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+from eaglei.metrics import timed
+
+# Column registry: column -> (keywords, label). Only columns present in the frame are used.
+METRICS = {
+    'event_count': (['event', 'events', 'outage', 'outages'], 'events'),
+    'total_customers': (['customer', 'customers'], 'customers'),
+    'avg_duration': (['duration', 'durations', 'hour', 'hours', 'hrs', 'longest'], 'duration (hrs)'),
+    'psps': (['psps', 'shutoff', 'shutoffs'], 'PSPS events'),
+    'weather': (['weather', 'storm', 'storms'], 'weather events'),
+    'equipment': (['equipment', 'failure', 'failures'], 'equipment failures'),
+    'vegetation': (['vegetation', 'tree', 'trees'], 'vegetation events'),
+    'population': (['population', 'pop', 'people'], 'population'),
+    'industrial': (['industrial', 'industry'], 'industrial share'),
+    'commercial': (['commercial'], 'commercial share'),
+    'residential': (['residential'], 'residential share'),
+    'svi_score': (['svi', 'vulnerability', 'vulnerable'], 'SVI'),
+    'ces_score': (['ces', 'calenviroscreen'], 'CES score'),
+    'fire_risk': (['fire', 'wildfire'], 'fire risk'),
+    'pm25': (['pm', 'pm2.5', 'pm25', 'pollution', 'air'], 'PM2.5'),
+    'poverty_rate': (['poverty', 'poor'], 'poverty rate'),
+    'composite_ej': (['composite', 'ej'], 'composite EJ'),
+    # Reliability indices (eaglei.reliability), yearly averages
+    'saidi': (['saidi'], 'SAIDI (min/yr)'),
+    'saifi': (['saifi', 'interruption', 'interruptions'], 'SAIFI (/yr)'),
+    'caidi': (['caidi', 'restoration'], 'CAIDI (min)'),
+    # Event-level columns (eaglei.events)
+    'customers': (['customer', 'customers', 'affected'], 'customers affected'),
+    'duration_hours': (['duration', 'durations', 'hour', 'hours', 'hrs', 'longest'], 'duration (hrs)'),
+}
+# keyword -> candidate columns in registry order; the first one the frame has wins
+KEYWORDS = {kw: [c for c, (kws, _) in METRICS.items() if kw in kws] for kws, _ in METRICS.values() for kw in kws}
+
+# Event-type words become event_type filters on event-level data
+EVENT_TYPE_WORDS = {'psps': 'psps', 'shutoff': 'psps', 'shutoffs': 'psps', 'weather': 'weather', 'storm': 'weather', 'storms': 'weather',
+                    'equipment': 'equipment', 'failure': 'equipment', 'failures': 'equipment', 'vegetation': 'vegetation', 'tree': 'vegetation', 'trees': 'vegetation'}
+EVENT_TYPE_LABELS = {'psps': 'PSPS', 'weather': 'weather', 'equipment': 'equipment', 'vegetation': 'vegetation', 'unknown': 'unknown-cause'}
+
+# (phrase, regions, label); longer phrases are tried first
+REGIONS = [
+    (('bay', 'area'), ('Bay Area',), 'Bay Area'),
+    (('central', 'valley'), ('Central Valley',), 'Central Valley'),
+    (('central', 'coast'), ('Central Coast',), 'Central Coast'),
+    (('north', 'coast'), ('North Coast',), 'North Coast'),
+    (('southern', 'california'), ('South',), 'Southern California'),
+    (('northern', 'california'), ('North', 'North Coast'), 'Northern California'),
+    (('socal',), ('South',), 'Southern California'),
+    (('south',), ('South',), 'Southern California'),
+    (('southern',), ('South',), 'Southern California'),
+    (('norcal',), ('North', 'North Coast'), 'Northern California'),
+    (('north',), ('North', 'North Coast'), 'Northern California'),
+    (('northern',), ('North', 'North Coast'), 'Northern California'),
+    (('sierra',), ('Sierra',), 'Sierra region'),
+    (('coast',), ('Central Coast', 'North Coast'), 'Coastal'),
+    (('coastal',), ('Central Coast', 'North Coast'), 'Coastal'),
+]
+
+COMPARATORS = [
+    (('more', 'than'), '>'), (('greater', 'than'), '>'), (('longer', 'than'), '>'), (('higher', 'than'), '>'),
+    (('at', 'least'), '>='), (('over',), '>'), (('above',), '>'), (('exceeding',), '>'), (('>',), '>'), (('>=',), '>='),
+    (('less', 'than'), '<'), (('fewer', 'than'), '<'), (('shorter', 'than'), '<'), (('lower', 'than'), '<'),
+    (('at', 'most'), '<='), (('under',), '<'), (('below',), '<'), (('<',), '<'), (('<=',), '<='),
+]
+
+# Fixed "high"/"low" cut-offs; any other metric uses its top/bottom quartile
+HIGH = {'svi_score': 0.5, 'fire_risk': 60, 'pm25': 12}
+LOW = {'svi_score': 0.35}
+RURAL_POP, URBAN_POP = 100_000, 500_000
+
+YEAR_RANGE = (1990, 2100)
+YEAR_OPS = {'in': '==', 'during': '==', 'for': '==', 'of': '==', 'year': '==', 'since': '>=', 'from': '>=', 'after': '>', 'before': '<', 'until': '<='}
+
+DESCENDING = {'top', 'highest', 'largest', 'most', 'worst', 'biggest'}
+ASCENDING = {'bottom', 'lowest', 'least', 'fewest', 'smallest'}
+CLAUSE_BREAKS = {'with', 'where', 'having', 'that', 'and', 'in'}
+SUMMARY = {'summary', 'stats', 'statistics', 'overview'}
+MEAN = {'average', 'mean', 'avg'}
+TOTAL = {'total', 'sum'}
+
+QueryPlan = namedtuple('QueryPlan', ['filters', 'rank', 'aggregate', 'parts'])
+Filter = namedtuple('Filter', ['column', 'op', 'value', 'label'])
+
+TOKEN_RE = re.compile(r"\d[\d,]*(?:\.\d+)?[km]?\b|[<>]=?|[a-z][a-z0-9.&'-]*")
+
+
+def normalize(query):
+    """Cache key for a query: lower-cased with collapsed whitespace."""
+    return ' '.join(query.lower().split())
+
+
+def tokenize(text):
+    return [t.rstrip('.') if t[0].isalpha() else t for t in TOKEN_RE.findall(text)]
+
+
+def parse_number(token):
+    """'5,000' -> 5000, '2.5' -> 2.5, '10k' -> 10000; None for non-numbers."""
+    if not token[0].isdigit():
+        return None
+    scale = {'k': 1_000, 'm': 1_000_000}.get(token[-1], 1)
+    value = float(token.rstrip('km').replace(',', '')) * scale
+    return int(value) if value.is_integer() else value
+
+
+def _fmt(value):
+    return f"{value:,}" if isinstance(value, int) else f"{value:,.2f}"
+
+
+def compile_query(query, counties=(), columns=()):
+    """Compile `query` into a QueryPlan for a frame with the given county names and columns (cached)."""
+    return _compile(normalize(query), tuple(counties), tuple(columns))
+
+
+@lru_cache(maxsize=1024)
+def _compile(text, counties, columns):
+    toks = tokenize(text)
+    used = [False] * len(toks)
+    available = set(columns)
+    filters, parts = [], []
+    rank = aggregate = None
+
+    def at(i, phrase):
+        return toks[i:i + len(phrase)] == list(phrase) and not any(used[i:i + len(phrase)])
+
+    def claim(i, k=1):
+        used[i:i + k] = [True] * k
+
+    def resolve(tok):
+        return next((c for c in KEYWORDS.get(tok, ()) if c in available), None)
+
+    def metric(i, stop, step=1, breaks=()):
+        # First unused registry keyword between i and stop, not crossing a clause break
+        for j in range(i, stop, step):
+            if not 0 <= j < len(toks) or toks[j] in breaks:
+                break
+            col = None if used[j] else resolve(toks[j])
+            if col:
+                claim(j)
+                # Swallow synonyms of the same column ("3 hours duration")
+                while 0 <= j + step < len(toks) and not used[j + step] and resolve(toks[j + step]) == col:
+                    j += step
+                    claim(j)
+                return col
+        return None
+
+    def default_metric():
+        return next((c for c in ('event_count', 'svi_score', 'customers') if c in available), None)
+
+    def is_year(tok):
+        value = parse_number(tok)
+        return isinstance(value, int) and YEAR_RANGE[0] <= value <= YEAR_RANGE[1]
+
+    # Places: regions win over same-named counties ("Sierra") unless followed by "county"
+    places, regions = [], []
+    county_grams = {tuple(c.lower().split()): c for c in counties}
+    if 'region' in available:
+        for phrase, names, label in sorted(REGIONS, key=lambda r: -len(r[0])):
+            for i in range(len(toks)):
+                if at(i, phrase) and not (len(phrase) == 1 and toks[i + 1:i + 2] == ['county'] and phrase in county_grams):
+                    claim(i, len(phrase))
+                    regions.append((names, label))
+    for size in (3, 2, 1):
+        for i in range(len(toks) - size + 1):
+            gram = tuple(toks[i:i + size])
+            if gram in county_grams and not any(used[i:i + size]):
+                claim(i, size)
+                places.append((i, county_grams[gram]))
+    if places:
+        names = tuple(c for _, c in sorted(places))
+        label = f"Comparison: {' vs '.join(names)}" if len(names) > 1 else f"{names[0]} County details"
+        filters.append(Filter('county', 'in', names, label))
+    for names, label in regions:
+        filters.append(Filter('region', 'in', names, f"{label} counties"))
+
+    # Event types ("PSPS events") on event-level data
+    if 'event_type' in available:
+        types = []
+        for i, tok in enumerate(toks):
+            if tok in EVENT_TYPE_WORDS and not used[i]:
+                claim(i)
+                types.append(EVENT_TYPE_WORDS[tok])
+        if types:
+            types = tuple(dict.fromkeys(types))
+            filters.append(Filter('event_type', 'in', types, f"{' / '.join(EVENT_TYPE_LABELS[t] for t in types)} events"))
+
+    # Years: "in 2019", "since 2020", "between 2018 and 2020"
+    if 'year' in available:
+        for i, tok in enumerate(toks):
+            if used[i]:
+                continue
+            if tok == 'between' and i + 3 < len(toks) and toks[i + 2] in ('and', 'to') and is_year(toks[i + 1]) and is_year(toks[i + 3]) \
+                    and resolve(toks[i + 4] if i + 4 < len(toks) else '') is None:
+                lo, hi = sorted((parse_number(toks[i + 1]), parse_number(toks[i + 3])))
+                claim(i, 4)
+                filters.append(Filter('year', 'between', (lo, hi), f"{lo}-{hi}"))
+            elif is_year(tok) and (i == 0 or toks[i - 1] in YEAR_OPS):
+                op = YEAR_OPS[toks[i - 1]] if i else '=='
+                claim(i - 1 if i else i, 2 if i else 1)
+                filters.append(Filter('year', op, parse_number(tok), f"{'in' if op == '==' else toks[i - 1]} {tok}"))
+
+    # between A and B <metric>
+    for i, tok in enumerate(toks):
+        if tok == 'between' and not used[i] and i + 3 < len(toks) and toks[i + 2] in ('and', 'to', '-'):
+            lo, hi = parse_number(toks[i + 1]), parse_number(toks[i + 3])
+            if lo is not None and hi is not None:
+                claim(i, 4)
+                col = metric(i + 4, i + 8) or metric(i - 1, i - 4, -1) or default_metric()
+                if col is None:
+                    continue
+                lo, hi = min(lo, hi), max(lo, hi)
+                filters.append(Filter(col, 'between', (lo, hi), f"{METRICS[col][1]} {_fmt(lo)}-{_fmt(hi)}"))
+
+    # <comparator> N <metric> | <metric> <comparator> N
+    for phrase, op in COMPARATORS:
+        for i in range(len(toks)):
+            k = i + len(phrase)
+            if at(i, phrase) and k < len(toks) and not used[k] and parse_number(toks[k]) is not None:
+                value = parse_number(toks[k])
+                claim(i, len(phrase) + 1)
+                col = metric(k + 1, k + 5) or metric(i - 1, i - 4, -1)
+                if col is None and phrase[0] in ('longer', 'shorter'):
+                    col = resolve('duration')
+                col = col or default_metric()
+                if col is None:
+                    continue
+                filters.append(Filter(col, op, value, f"{METRICS[col][1]} {op} {_fmt(value)}"))
+
+    # high/low <metric>, rural/urban
+    for i, tok in enumerate(toks):
+        if tok in ('high', 'low') and not used[i]:
+            col = metric(i + 1, i + 3)
+            if col:
+                claim(i)
+                if tok == 'high':
+                    value, op = (HIGH[col], '>=') if col in HIGH else (0.75, 'q>=')
+                else:
+                    value, op = (LOW[col], '<') if col in LOW else (0.25, 'q<=')
+                label = f"{tok.title()} {METRICS[col][1]} counties" + (f" ({op} {value})" if op[0] != 'q' else f" ({'top' if tok == 'high' else 'bottom'} quartile)")
+                filters.append(Filter(col, op, value, label))
+        elif tok in ('rural', 'urban') and not used[i] and 'population' in available:
+            claim(i)
+            filters.append(Filter('population', '<', RURAL_POP, 'Rural counties (pop < 100K)') if tok == 'rural' else Filter('population', '>=', URBAN_POP, 'Urban counties (pop ≥ 500K)'))
+
+    # top/bottom [N] [by] <metric>
+    for i, tok in enumerate(toks):
+        if (tok in DESCENDING or tok in ASCENDING) and not used[i] and rank is None:
+            claim(i)
+            n = parse_number(toks[i + 1]) if i + 1 < len(toks) and not used[i + 1] else None
+            if n is not None:
+                claim(i + 1)
+            # "top 10 by psps", else the metric being filtered on ("top 10 with more than 3000 PSPS events")
+            col = metric(i + 1, i + 6, breaks=CLAUSE_BREAKS) or next((f.column for f in filters if f.column in METRICS), None) or default_metric()
+            if col is None:
+                continue
+            rank = (col, tok in ASCENDING, int(n) if n else 10)
+            parts.append(f"{'Bottom' if tok in ASCENDING else 'Top'} {rank[2]} by {METRICS[col][1]}")
+
+    # Statistics
+    for i, tok in enumerate(toks):
+        if used[i] or aggregate:
+            continue
+        if tok in SUMMARY:
+            claim(i)
+            aggregate = ('summary', None)
+        elif tok in MEAN | TOTAL:
+            col = metric(i + 1, i + 4)
+            if col:
+                claim(i)
+                aggregate = ('mean' if tok in MEAN else 'sum', col)
+
+    # Bare metric ("PSPS counties"): sort by it
+    if rank is None and aggregate is None:
+        col = metric(0, len(toks))
+        if col and all(f.column != col for f in filters):
+            rank = (col, False, None)
+            parts.append(f"Ranked by {METRICS[col][1]}")
+
+    # Partial county name ("angeles") as a last resort
+    if not (filters or rank or aggregate):
+        for c in counties:
+            if any(len(t) > 3 and t in c.lower() for t in toks):
+                filters.append(Filter('county', 'in', (c,), f"{c} County (partial match)"))
+                break
+
+    parts.extend(f.label for f in filters)
+    return QueryPlan(tuple(filters), rank, aggregate, tuple(parts))
+
+
+OPS = {'>': np.greater, '>=': np.greater_equal, '<': np.less, '<=': np.less_equal, '==': np.equal}
+
+
+def _values(df, col):
+    return df[col].to_numpy(dtype='float64', na_value=np.nan)
+
+
+def compare(a, f):
+    """Boolean mask of a numeric filter over array `a`."""
+    if f.op in ('q>=', 'q<='):
+        # Quartile value cut with every tie at the boundary kept, so equal values always fall on the same side
+        threshold = np.nanquantile(a, f.value)
+        return a >= threshold if f.op == 'q>=' else a <= threshold
+    if f.op == 'between':
+        return (a >= f.value[0]) & (a <= f.value[1])
+    return OPS[f.op](a, f.value)
+
+
+def _mask(df, f):
+    if f.op == 'in':
+        return df[f.column].isin(f.value).to_numpy()
+    return compare(_values(df, f.column), f)
+
+
+def rank_order(vals, ascending, n):
+    """Positions into `vals` of its n smallest/largest non-NaN values in order (stable on ties); n=None sorts all."""
+    keep = np.flatnonzero(~np.isnan(vals))
+    key = vals[keep] if ascending else -vals[keep]
+    if n and n < len(key) // 8:
+        part = np.argpartition(key, n - 1)[:n]
+        order = part[np.lexsort((part, key[part]))]
+    else:
+        order = np.argsort(key, kind='stable')[:n]
+    return keep[order]
+
+
+def select(plan, df):
+    """Positions of the rows a plan selects: one AND-ed mask, then an optional (partial) sort."""
+    mask = None
+    for f in plan.filters:
+        mask = _mask(df, f) if mask is None else mask & _mask(df, f)
+    idx = np.flatnonzero(mask) if mask is not None else None
+    if plan.rank:
+        col, ascending, n = plan.rank
+        vals = _values(df, col)
+        order = rank_order(vals if idx is None else vals[idx], ascending, n)
+        idx = order if idx is None else idx[order]
+    return idx
+
+
+def _summary(rows, noun='counties'):
+    metrics = [('Total Events', 'event_count', lambda s: f"{s.sum():,}"), ('Total Customers', 'total_customers', lambda s: f"{s.sum():,}"),
+               ('Total Customers', 'customers', lambda s: f"{s.sum():,}"), ('Avg Duration', 'avg_duration', lambda s: f"{s.mean():.2f} hrs"),
+               ('Avg Duration', 'duration_hours', lambda s: f"{s.mean():.2f} hrs"), ('Weather Events', 'weather', lambda s: f"{s.sum():,}"),
+               ('PSPS Events', 'psps', lambda s: f"{s.sum():,}"), ('Avg SVI', 'svi_score', lambda s: f"{s.mean():.3f}")]
+    out = [(name, fmt(rows[col])) for name, col, fmt in metrics if col in rows.columns]
+    out.insert(min(3, len(out)), (noun.title(), len(rows)))
+    return pd.DataFrame(out, columns=['Metric', 'Value'])
+
+
+def describe(plan, results, query='', noun='counties'):
+    """Apply the plan's aggregate (if any) to the selected rows and build the explanation."""
+    explanation = ' · '.join(plan.parts)
+    if plan.aggregate:
+        kind, col = plan.aggregate
+        if kind == 'summary':
+            return _summary(results, noun), ' · '.join(('Summary Statistics',) + plan.parts)
+        value = results[col].mean() if kind == 'mean' else results[col].sum()
+        head = f"Average {METRICS[col][1]}: {value:,.2f}" if kind == 'mean' else f"Total {METRICS[col][1]}: {value:,.0f}"
+        return results, ' · '.join((head,) + plan.parts)
+    if not explanation:
+        explanation = f"Showing all {len(results)} {noun} (query: '{query}')"
+    return results, explanation
+
+
+def execute(plan, df, query='', noun='counties'):
+    """Run a compiled plan; returns (results, explanation) like query_data()."""
+    idx = select(plan, df)
+    return describe(plan, df if idx is None else df.iloc[idx], query, noun)
+
+
+@timed('query', 'query_plan')
+def query_plan(df, query, counties=None):
+    """QueryPlan of `query` against `df`, whose county names default to its county column (cached)."""
+    if counties is None and 'county' in df.columns:
+        col = df['county']
+        counties = col.cat.categories if isinstance(col.dtype, pd.CategoricalDtype) else col.unique()
+    return compile_query(query, counties if counties is not None else (), df.columns)
+
+
+@timed('query', 'run_query')
+def run_query(df, query, counties=None, noun='counties', plan=None):
+    """Compile (cached) and execute a natural-language query against `df`; pass `plan` when the caller already compiled it."""
+    return execute(plan or query_plan(df, query, counties), df, query, noun)
+
+
+def query_data(df, query, plan=None):
+    """
+    Comprehensive natural language query function (compiled and cached by run_query).
+
+    Supported queries:
+    - Top/Bottom N: "top 10 by events", "bottom 5 by duration"
+    - Comparisons: "more than 5000 events", "less than 3 hours duration"
+    - Regions: "Bay Area", "Central Valley", "South", "North", "Sierra", "Coast"
+    - Event Types: "top 10 PSPS", "weather events", "equipment failures"
+    - Sectors: "high industrial", "residential counties"
+    - Statistics: "average duration", "total events", "summary"
+    - Counties: "Los Angeles", "show Fresno"
+    - Combinations: "Bay Area with more than 2000 events"
+    """
+    return run_query(df, query, plan=plan)
+
+
+def query_ej_data(df, query, plan=None):
+    """Query function specifically for EJ data ("high SVI", "top 5 fire", plus everything query_data understands)."""
+    return run_query(df, query, plan=plan)
@@ -0,0 +1,198 @@
+"""
+Customer-weighted reliability indices: SAIDI, SAIFI, CAIDI and customer-minutes interrupted.
+
+Monthly interruption flows per county come from the outage cube: customers
+interrupted, and customer-minutes interrupted (CMI) as customers x mean
+duration of each county x year x month x event-type cell, since the
+aggregates keep durations only as sum/count. Events that only record their
+year are spread evenly over its months. Customers served are the EIA-861
+customers allocated to counties (eaglei.crosswalk); utilities get their
+share of each county's flows through the same crosswalk weights.
+
+Every flow and the customer-months served are stored as prefix sums over
+months, so the totals and indices of any month window are two lookups per
+county or utility after one O(n) cumsum:
+
+    SAIDI = CMI / mean customers served      (minutes per customer)
+    SAIFI = customers interrupted / mean customers served
+    CAIDI = CMI / customers interrupted = SAIDI / SAIFI
+"""
+
+from collections import namedtuple
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+from eaglei.crosswalk import CUSTOMER_COUNTS
+
+FLOWS = ['events', 'customers_interrupted', 'cmi']
+
+# level: 'county', 'utility' or a group name; labels: one per row; periods: datetime64[M] of each month;
+# prefix: FLOWS + 'customer_months' -> (labels x months + 1) cumulative sums starting at 0
+Reliability = namedtuple('Reliability', ['level', 'labels', 'periods', 'prefix'])
+
+
+def county_flows(cube):
+    """FLOWS -> (counties x months) arrays over the cube's years, and the datetime64[M] of every month."""
+    months = 12 * len(cube.dims['year'])
+    with np.errstate(divide='ignore', invalid='ignore'):
+        duration = np.nan_to_num(cube.measures['duration_sum'] / cube.measures['duration_n'])
+    customers = cube.measures['customers'].sum(axis=-1)
+    cells = {'events': cube.measures['events'], 'customers_interrupted': customers, 'cmi': customers * duration * 60}
+    flows = {}
+    for name, arr in cells.items():
+        arr = arr.sum(axis=-1)
+        # county x year x 12 months, month 0 (year only) spread evenly
+        flows[name] = (arr[:, :, 1:] + arr[:, :, :1] / 12).reshape(len(arr), months)
+    start = np.datetime64(f'{cube.dims["year"][0]}-01', 'M') if len(cube.dims['year']) else np.datetime64('1970-01', 'M')
+    return flows, start + np.arange(months)
+
+
+def _prefix(arr):
+    out = np.zeros((arr.shape[0], arr.shape[1] + 1))
+    np.cumsum(arr, axis=1, out=out[:, 1:])
+    return out
+
+
+def _year_columns(periods, years):
+    # Index into `years` of every month, clamped to the nearest year with data
+    month_year = periods.astype('datetime64[Y]').astype('int64') + 1970
+    return np.abs(month_year[:, None] - np.asarray(years)[None, :]).argmin(axis=1)
+
+
+def county_reliability(cube, customers):
+    """
+    Reliability of every cube county; `customers` is crosswalk.allocate_customers output.
+
+    A month outside the EIA-861 years is served by the nearest year's customers.
+    """
+    flows, periods = county_flows(cube)
+    served = customers.pivot_table(index='county', columns='Year', values='customers', aggfunc='sum').reindex(cube.dims['county']).fillna(0)
+    months = served.to_numpy(dtype='float64')[:, _year_columns(periods, served.columns)] if served.shape[1] else np.zeros_like(flows['events'])
+    prefix = {name: _prefix(arr) for name, arr in flows.items()}
+    prefix['customer_months'] = _prefix(months)
+    return Reliability('county', np.asarray(cube.dims['county']), periods, prefix)
+
+
+def utility_reliability(cube, crosswalk):
+    """
+    Reliability of every EIA-861 utility (labels are Utility_Number).
+
+    A county's flows in year y go to its utilities in proportion to the customers each
+    contributes there (crosswalk weight x utility customers), one sparse mat-mul per year.
+    """
+    flows, periods = county_flows(cube)
+    counties = np.asarray(cube.dims['county'])
+    utilities = np.unique(np.concatenate([crosswalk.utilities[y] for y in crosswalk.years])) if crosswalk.years else np.empty(0, dtype='int64')
+    out = {name: np.zeros((len(utilities), len(periods))) for name in flows}
+    served = np.zeros((len(utilities), len(periods)))
+    if not len(utilities):
+        return Reliability('utility', utilities, periods, {name: _prefix(arr) for name, arr in {**out, 'customer_months': served}.items()})
+    # Crosswalk counties -> cube counties
+    cols = pd.Index(crosswalk.counties).get_indexer(counties)
+    which = _year_columns(periods, crosswalk.years)
+    total = list(CUSTOMER_COUNTS).index('customers')
+    for k, year in enumerate(crosswalk.years):
+        month = np.flatnonzero(which == k)
+        if not len(month):
+            continue
+        weights, counts = crosswalk.matrices[year], crosswalk.customers[year][:, total]
+        contrib = sparse.csr_matrix(weights.multiply(counts[:, None]))
+        county_total = np.asarray(contrib.sum(axis=0)).ravel()
+        share = contrib @ sparse.diags(np.divide(1.0, county_total, out=np.zeros_like(county_total), where=county_total > 0))
+        # utilities of this year x cube counties (counties outside the crosswalk get no utility)
+        share = share[:, np.where(cols >= 0, cols, 0)] @ sparse.diags((cols >= 0).astype('float64'))
+        rows = np.searchsorted(utilities, crosswalk.utilities[year])
+        for name, arr in flows.items():
+            out[name][np.ix_(rows, month)] = share @ arr[:, month]
+        served[np.ix_(rows, month)] = counts[:, None]
+    prefix = {name: _prefix(arr) for name, arr in out.items()}
+    prefix['customer_months'] = _prefix(served)
+    return Reliability('utility', utilities, periods, prefix)
+
+
+def group_reliability(rel, groups, level):
+    """Reliability summed over `groups` (a group label per row of `rel`), e.g. counties into regions."""
+    labels, codes = np.unique(np.asarray(groups, dtype=object).astype(str), return_inverse=True)
+    onehot = sparse.csr_matrix((np.ones(len(codes)), (codes, np.arange(len(codes)))), shape=(len(labels), len(codes)))
+    return Reliability(level, labels, rel.periods, {name: onehot @ p for name, p in rel.prefix.items()})
+
+
+def _bounds(rel, start, end):
+    # [lo, hi) month positions of the inclusive start..end range (None = open; a bare year as `end` means its December)
+    # Years are parsed as text: np.datetime64(2020, 'M') would be month 2020 after the epoch
+    if end is not None and len(str(end)) == 4:
+        end = f'{end}-12'
+    lo = 0 if start is None else int(np.searchsorted(rel.periods, np.datetime64(str(start), 'M')))
+    hi = len(rel.periods) if end is None else int(np.searchsorted(rel.periods, np.datetime64(str(end), 'M'), side='right'))
+    return lo, max(lo, hi)
+
+
+def _rows(rel, labels):
+    rows = np.arange(len(rel.labels)) if labels is None else pd.Index(rel.labels).get_indexer(np.atleast_1d(labels))
+    return rows[rows >= 0]
+
+
+def indices(totals, months):
+    """Add customers_served (mean over the window), saidi, saifi and caidi to a frame of FLOWS + customer_months totals."""
+    served = totals['customer_months'] / max(months, 1)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return totals.drop(columns='customer_months').assign(
+            customers_served=served,
+            saidi=np.where(served > 0, totals['cmi'] / served, np.nan),
+            saifi=np.where(served > 0, totals['customers_interrupted'] / served, np.nan),
+            caidi=np.where(totals['customers_interrupted'] > 0, totals['cmi'] / totals['customers_interrupted'], np.nan))
+
+
+def window(rel, start=None, end=None, labels=None):
+    """
+    Totals and indices of every row of `rel` (or `labels`) over the months start..end inclusive.
+
+    `start`/`end` are anything np.datetime64 takes ('2019', '2019-10', ...). Two prefix
+    lookups per row.
+    """
+    lo, hi = _bounds(rel, start, end)
+    rows = _rows(rel, labels)
+    out = indices(pd.DataFrame({name: p[rows, hi] - p[rows, lo] for name, p in rel.prefix.items()}), hi - lo)
+    out.insert(0, rel.level, rel.labels[rows])
+    return out
+
+
+def scope_window(rel, labels=None, start=None, end=None):
+    """Totals and indices (a Series) of the rows of `labels` (None = all) taken together over start..end."""
+    lo, hi = _bounds(rel, start, end)
+    rows = _rows(rel, labels)
+    return indices(pd.DataFrame({name: [(p[rows, hi] - p[rows, lo]).sum()] for name, p in rel.prefix.items()}), hi - lo).iloc[0]
+
+
+def annual(rel, labels=None):
+    """window() over all months with saidi and saifi as yearly averages (per customer per year)."""
+    out = window(rel, labels=labels)
+    years = max(len(rel.periods) / 12, 1)
+    return out.assign(saidi=out['saidi'] / years, saifi=out['saifi'] / years)
+
+
+def by_period(rel, freq='year'):
+    """Long table of totals and indices per row and calendar year ('year') or month ('month')."""
+    step = 12 if freq == 'year' else 1
+    edges = np.arange(0, len(rel.periods) + 1, step)
+    diffs = {name: np.diff(p[:, edges], axis=1) for name, p in rel.prefix.items()}
+    n = len(edges) - 1
+    totals = pd.DataFrame({name: d.ravel() for name, d in diffs.items()})
+    out = indices(totals, step)
+    period = rel.periods[edges[:-1]]
+    out.insert(0, freq, np.tile(period.astype('datetime64[Y]').astype('int64') + 1970 if freq == 'year' else period, len(rel.labels)))
+    out.insert(0, rel.level, np.repeat(rel.labels, n))
+    return out
+
+
+def rolling(rel, months=12, measure='saidi', labels=None):
+    """(window end month x row) frame of `measure` over every trailing window of `months` months."""
+    rows = _rows(rel, labels)
+    diff = {name: p[rows, months:] - p[rows, :-months] for name, p in rel.prefix.items()}
+    served = diff['customer_months'] / months
+    with np.errstate(divide='ignore', invalid='ignore'):
+        value = {'saidi': diff['cmi'] / served, 'saifi': diff['customers_interrupted'] / served,
+                 'caidi': diff['cmi'] / diff['customers_interrupted']}.get(measure, diff.get(measure))
+    return pd.DataFrame(value.T, index=pd.Index(rel.periods[months - 1:], name='end'), columns=rel.labels[rows])
@@ -0,0 +1,209 @@
+"""
+Outage reports for any scope of the cube: statewide, a region or a county, over all years or one year.
+
+Everything is read from the outage cube with rollup(), so a report costs a
+handful of slice-and-sums. Given a forecast model (eaglei.forecast), all-years
+reports also carry 3-year forecasts with 90% bands, and given county reliability
+prefix arrays (eaglei.reliability) every report states its SAIDI/SAIFI/CAIDI. The Report page renders the statewide text, and
+eaglei.batch writes text, CSV and chart files for every scope.
+"""
+
+import os
+import re
+from collections import namedtuple
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+
+from eaglei.cube import rollup
+from eaglei.forecast import forecast
+from eaglei.reliability import scope_window
+
+# kind: 'state', 'region' or 'county'; name: region/county label (None statewide); year: None for all years
+Scope = namedtuple('Scope', ['kind', 'name', 'year'])
+
+STATEWIDE = Scope('state', None, None)
+
+REPORT_TYPES = {'Weather': 'weather', 'Equipment': 'equipment', 'PSPS': 'psps', 'Vegetation': 'vegetation'}
+
+CHART_FORMATS = ('html', 'svg', 'png')
+
+
+def report_scopes(cube, by_year=True):
+    """Statewide, every region and every county, each over all years and (with `by_year`) every single year."""
+    places = [(STATEWIDE.kind, None)] + [('region', r) for r in sorted(set(cube.groups['region'][1]))] + [('county', c) for c in cube.dims['county']]
+    years = [None] + (cube.dims['year'].tolist() if by_year else [])
+    return [Scope(kind, name, year) for kind, name in places for year in years]
+
+
+def scope_where(scope):
+    """rollup `where` filter selecting `scope`."""
+    where = {} if scope.kind == 'state' else {scope.kind: scope.name}
+    if scope.year is not None:
+        where['year'] = scope.year
+    return where
+
+
+def scope_label(cube, scope):
+    """Title text such as 'California 2014-2023', 'Bay Area 2020' or 'Fresno County 2014-2023'."""
+    years = cube.dims['year']
+    period = str(scope.year) if scope.year is not None else f'{years[0]}-{years[-1]}' if len(years) else ''
+    place = {'state': 'California', 'region': scope.name, 'county': f'{scope.name} County'}[scope.kind]
+    return f'{place} {period}'.strip()
+
+
+def scope_slug(scope):
+    """File-name stem for `scope`, e.g. 'california', 'region_bay_area_2020', 'county_san_diego'."""
+    parts = [scope.kind if scope.kind != 'state' else 'california', scope.name or '', str(scope.year or '')]
+    return '_'.join(re.sub(r'[^a-z0-9]+', '_', p.lower()).strip('_') for p in parts if p)
+
+
+def scope_counties(cube, scope):
+    """Counties of `scope` (None statewide)."""
+    if scope.kind == 'state':
+        return None
+    if scope.kind == 'county':
+        return [scope.name]
+    dim, labels = cube.groups[scope.kind]
+    return cube.dims[dim][labels == scope.name]
+
+
+def reliability_line(cube, scope, reliability):
+    """SAIDI/SAIFI/CAIDI line of `scope` from a county Reliability (eaglei.reliability); yearly averages for all-years scopes."""
+    stats = scope_window(reliability, scope_counties(cube, scope), scope.year, scope.year)
+    years, unit = (1, '') if scope.year is not None else (max(len(reliability.periods) / 12, 1), '/yr')
+    return (f"SAIDI {stats['saidi'] / years:,.1f} min{unit} | SAIFI {stats['saifi'] / years:.2f}{unit} | CAIDI {stats['caidi']:,.1f} min"
+            f" | {stats['cmi'] / years / 1e6:,.1f}M customer-minutes{unit} | {stats['customers_served'] / 1e6:.2f}M customers served")
+
+
+def forecast_table(cube, scope, forecasts, horizon=3):
+    """Events and customers forecast for the `horizon` years after the data, summed over `scope`, with 90% bands."""
+    return forecast(forecasts, horizon, scope_counties(cube, scope))
+
+
+def _breakdown(cube, scope):
+    # Period axis, where filter and period labels of the breakdown rows: years for multi-year
+    # scopes, months for one year (month 0, year-only records, only when it holds events)
+    where = scope_where(scope)
+    if scope.year is None:
+        return 'year', where, cube.dims['year']
+    months = list(range(0 if rollup(cube, 'events', where={**where, 'month': 0}) > 0 else 1, 13))
+    return 'month', {**where, 'month': months}, months
+
+
+def report_table(cube, scope):
+    """Long table of events, customers and avg_duration per period (year, or month for one year) and event type."""
+    axis, where, periods = _breakdown(cube, scope)
+    by = (axis, 'event_type')
+    events, customers, dsum, dn = (rollup(cube, m, by, where).to_numpy() for m in ('events', 'customers', 'duration_sum', 'duration_n'))
+    types = cube.dims['event_type']
+    with np.errstate(divide='ignore', invalid='ignore'):
+        avg = dsum / dn
+    return pd.DataFrame({
+        axis: np.repeat(periods, len(types)),
+        'event_type': np.tile(types, len(periods)),
+        'events': events.ravel().round().astype('int64'),
+        'customers': customers.ravel().round().astype('int64'),
+        'avg_duration': avg.ravel(),
+    })
+
+
+def report_text(cube, scope=STATEWIDE, generated=None, forecasts=None, reliability=None):
+    """
+    Plain-text report for `scope` (event totals, type mix and the top counties or the period breakdown).
+
+    With `forecasts` (eaglei.forecast.ForecastModel) all-years reports add a 3-year forecast section;
+    with `reliability` (county eaglei.reliability.Reliability) every report adds its SAIDI/SAIFI/CAIDI.
+    """
+    where = scope_where(scope)
+    generated = generated or datetime.now()
+    by_county = rollup(cube, 'events', ('county', 'event_type'), where)
+    customers = rollup(cube, 'customers', 'county', where)
+    by_type = by_county.sum().round().astype(int)
+    events = {label: by_type[t] for label, t in REPORT_TYPES.items()}
+    total = sum(events.values())
+    share = lambda v: v / total * 100 if total else 0.0
+    n = len(by_county)
+    if scope.kind == 'county':
+        table = report_table(cube, scope)
+        axis = table.columns[0]
+        breakdown = table.groupby(axis, sort=False)[['events', 'customers']].sum().rename(columns={'events': 'event_count', 'customers': 'total_customers'}).reset_index()
+        section = f"EVENTS BY {axis.upper()}:\n{breakdown.to_string(index=False)}"
+    else:
+        top = pd.DataFrame({'event_count': by_county.sum(axis=1), 'total_customers': customers}).nlargest(5, 'event_count').round().astype(int).reset_index()
+        section = f"TOP 5 COUNTIES:\n{top.to_string(index=False)}"
+    reliability_block = f"\nRELIABILITY: {reliability_line(cube, scope, reliability)}" if reliability is not None else ''
+    if forecasts is not None and scope.year is None:
+        ahead = forecast_table(cube, scope, forecasts)
+        lines = [f"{int(r.year)}: {r.events:,.0f} events ({r.events_low:,.0f}-{r.events_high:,.0f}) | {r.customers/1e6:.2f}M customers ({r.customers_low/1e6:.2f}-{r.customers_high/1e6:.2f}M)" for r in ahead.itertuples()]
+        section += "\n\nFORECAST (90% band):\n" + "\n".join(lines)
+    return f"""EAGLE-I EJ ANALYSIS REPORT v3.1 - {scope_label(cube, scope)}
+Generated: {generated.strftime('%B %d, %Y')}
+
+SUMMARY: {by_county.to_numpy().sum():,.0f} events | {customers.sum()/1e6:.1f}M customers | {n} count{'y' if n == 1 else 'ies'}{reliability_block}
+
+EVENT TYPES:
+- Weather: {events['Weather']:,} ({share(events['Weather']):.1f}%)
+- Equipment: {events['Equipment']:,} ({share(events['Equipment']):.1f}%)
+- PSPS: {events['PSPS']:,} ({share(events['PSPS']):.1f}%)
+- Vegetation: {events['Vegetation']:,} ({share(events['Vegetation']):.1f}%)
+
+{section}
+
+AUTHORS: Victoria Love Franklin, Dr. Sajid Hussain, Dr. Lei Qian
+INSTITUTION: Meharry Medical College | FUNDING: DoE SRNL"""
+
+
+def forecast_bar(ahead, measure, color='#94a3b8'):
+    """Bar trace of a forecast_table measure with its band as asymmetric error bars."""
+    mean = ahead[measure].to_numpy()
+    return go.Bar(x=ahead['year'], y=mean, name='Forecast (90% band)', marker_color=color, opacity=0.6,
+                  error_y={'type': 'data', 'symmetric': False, 'array': ahead[f'{measure}_high'].to_numpy() - mean, 'arrayminus': mean - ahead[f'{measure}_low'].to_numpy()})
+
+
+def report_figures(cube, scope, forecasts=None):
+    """(name, figure) pairs: events by period stacked by type, and customers by period (plus forecast bars for all-years scopes)."""
+    table = report_table(cube, scope)
+    axis = table.columns[0]
+    label = scope_label(cube, scope)
+    ahead = forecast_table(cube, scope, forecasts) if forecasts is not None and scope.year is None else None
+    events = go.Figure([go.Bar(x=g[axis], y=g['events'], name=t) for t, g in table.groupby('event_type', sort=False)])
+    events.update_layout(barmode='stack', title=f'Outage Events by {axis.title()} - {label}', plot_bgcolor='white')
+    customers = table.groupby(axis)['customers'].sum()
+    cust = go.Figure(go.Bar(x=customers.index, y=customers.to_numpy(), marker_color='#8b5cf6', name='customers'))
+    cust.update_layout(title=f'Customers Affected by {axis.title()} - {label}', plot_bgcolor='white')
+    if ahead is not None:
+        events.add_trace(forecast_bar(ahead, 'events'))
+        cust.add_trace(forecast_bar(ahead, 'customers'))
+    return [('events', events), ('customers', cust)]
+
+
+def write_report(cube, scope, out_dir, charts='html', generated=None, plotlyjs='../plotly.min.js', forecasts=None, reliability=None):
+    """
+    Write <slug>.txt, <slug>.csv and one chart file per report_figures entry under out_dir/<kind>/.
+    With `forecasts`, all-years scopes also get <slug>_forecast.csv.
+
+    `charts` is 'html' (plotly.js loaded from `plotlyjs`, written once by the caller),
+    'svg'/'png' (static export; needs kaleido) or None. Returns the written paths.
+    """
+    folder = os.path.join(out_dir, {'state': 'statewide', 'region': 'regions', 'county': 'counties'}[scope.kind])
+    os.makedirs(folder, exist_ok=True)
+    stem = os.path.join(folder, scope_slug(scope))
+    paths = [f'{stem}.txt', f'{stem}.csv']
+    with open(paths[0], 'w') as f:
+        f.write(report_text(cube, scope, generated, forecasts, reliability))
+    report_table(cube, scope).to_csv(paths[1], index=False)
+    if forecasts is not None and scope.year is None:
+        paths.append(f'{stem}_forecast.csv')
+        forecast_table(cube, scope, forecasts).to_csv(paths[-1], index=False)
+    if charts:
+        for name, fig in report_figures(cube, scope, forecasts):
+            path = f'{stem}_{name}.{charts}'
+            if charts == 'html':
+                fig.write_html(path, include_plotlyjs=plotlyjs, full_html=True)
+            else:
+                fig.write_image(path)
+            paths.append(path)
+    return paths
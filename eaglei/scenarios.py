@@ -0,0 +1,185 @@
+"""
+Monte Carlo resilience scenarios (PSPS, wildfire and heat-storm stress cases).
+
+fit_rates() turns the outage cube into a per-county, per-event-type model:
+events per year (Poisson rate), mean outage duration and customers per event.
+A scenario multiplies rates and durations over a counties x types mask. simulate()
+draws whole simulated years as one scenarios x counties x types tensor per block
+of years: Poisson event counts, then the summed duration of those events. The
+aggregates only carry mean durations, so events are lognormal with an assumed
+shape (DURATION_SIGMA) and the sum of n of them is drawn as one lognormal with
+the same mean and variance (Fenton-Wilkinson), instead of one draw per event.
+
+Blocks of BLOCK_YEARS years each get their own child of SeedSequence(seed), so
+a run gives the same numbers in-process or over any number of pool workers.
+
+    python -m eaglei.scenarios --years 100000 --workers 8
+"""
+
+import argparse
+import os
+import time
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from eaglei.cube import rollup
+from eaglei.ingest import EVENT_TYPES
+
+# Simulated years per block (and per RNG stream); fixed so results do not depend on the worker count
+BLOCK_YEARS = 1_000
+
+# Lognormal shape of a single outage duration (the aggregates carry only the mean)
+DURATION_SIGMA = 1.0
+
+# fire_risk at or above which a county counts as high fire risk (the elevated synthetic range starts here)
+HIGH_FIRE_RISK = 65
+
+# counties / event_types: axis labels; rate: events per year, duration: mean hours per event,
+# customers: mean customers per event, all (counties x event types)
+RateModel = namedtuple('RateModel', ['counties', 'event_types', 'rate', 'duration', 'customers'])
+
+# rate / duration: (counties x event types) multipliers on the fitted model
+Scenario = namedtuple('Scenario', ['name', 'rate', 'duration'])
+
+# Annual totals are (scenarios x years); county_* are per-county means over the simulated years (scenarios x counties)
+Simulation = namedtuple('Simulation', ['scenarios', 'counties', 'events', 'customer_hours', 'ej_customer_hours', 'county_events', 'county_customer_hours'])
+
+
+def fit_rates(cube):
+    """RateModel of every county and event type of `cube`, averaged over its years."""
+    counties, years = cube.dims['county'], max(len(cube.dims['year']), 1)
+    grid = lambda m: rollup(cube, m, ('county', 'event_type')).reindex(index=counties, columns=EVENT_TYPES).to_numpy(dtype='float64')
+    events, customers, duration = grid('events'), grid('customers'), grid('avg_duration')
+    # Types a county never recorded take the county's mean duration, then the statewide mean
+    by_county = rollup(cube, 'avg_duration', 'county').reindex(counties).to_numpy(dtype='float64')
+    duration = np.where(np.isfinite(duration), duration, by_county[:, None])
+    duration = np.where(np.isfinite(duration), duration, np.nanmean(by_county) if np.isfinite(by_county).any() else 0.0)
+    per_event = np.divide(customers, events, out=np.zeros_like(customers), where=events > 0)
+    return RateModel(counties, list(EVENT_TYPES), events / years, duration, per_event)
+
+
+def scenario(model, name, shocks=()):
+    """
+    Scenario over `model` from (counties, event_types, rate factor, duration factor) shocks.
+
+    `counties` is a boolean mask or a list of names (None = all); `event_types` a list
+    (None = all). Shocks on the same cells multiply.
+    """
+    rate = np.ones_like(model.rate)
+    duration = np.ones_like(model.duration)
+    for counties, types, rate_factor, duration_factor in shocks:
+        rows = np.ones(len(model.counties), bool) if counties is None else np.asarray(counties) if np.asarray(counties).dtype == bool else np.isin(model.counties, counties)
+        cols = np.isin(model.event_types, model.event_types if types is None else types)
+        cell = rows[:, None] & cols[None, :]
+        rate[cell] *= rate_factor
+        duration[cell] *= duration_factor
+    return Scenario(name, rate, duration)
+
+
+def stress_cases(model, ej):
+    """
+    Baseline plus the standard PSPS, wildfire and heat-storm stress cases.
+
+    `ej` is the county EJ table (county, region, fire_risk); high fire-risk counties
+    have fire_risk >= HIGH_FIRE_RISK.
+    """
+    attrs = ej.set_index('county').reindex(model.counties)
+    fire = (attrs['fire_risk'] >= HIGH_FIRE_RISK).to_numpy()
+    sierra = (attrs['region'] == 'Sierra').to_numpy()
+    return [
+        scenario(model, 'Baseline'),
+        scenario(model, 'PSPS ×2 (high fire risk)', [(fire, ['psps'], 2.0, 1.0)]),
+        scenario(model, 'Wildfire season', [(fire, ['psps', 'vegetation'], 1.5, 1.25), (None, ['weather'], 1.1, 1.0)]),
+        scenario(model, 'Heat storm', [(None, ['weather'], 1.3, 1.2), (None, ['equipment'], 1.2, 1.1)]),
+        scenario(model, 'Sierra weather +30%', [(sierra, ['weather'], 1.3, 1.0)]),
+    ]
+
+
+def ej_weights(ej, counties):
+    """composite_ej of `counties` scaled to mean 1, so EJ-weighted impacts stay in customer-hours."""
+    score = ej.set_index('county')['composite_ej'].reindex(counties).to_numpy(dtype='float64')
+    score = np.where(np.isfinite(score), score, np.nanmean(score))
+    return score / score.mean()
+
+
+def _simulate_block(args):
+    # Years of one block for every scenario: annual totals (years x scenarios) and per-county sums over the block
+    seed, years, rate, duration, customers, weight, sigma = args
+    rng = np.random.default_rng(seed)
+    n = rng.poisson(rate, size=(years,) + rate.shape).astype('float64')
+    # Sum of n iid lognormal durations with mean m and shape sigma: lognormal with mean n*m and
+    # variance n*m^2*(exp(sigma^2)-1), i.e. log-variance log(1 + (exp(sigma^2)-1)/n)
+    s2 = np.log1p(np.expm1(sigma ** 2) / np.maximum(n, 1))
+    hours = n * duration * np.exp(np.sqrt(s2) * rng.standard_normal(n.shape) - s2 / 2)
+    impact = hours * customers
+    by_county = impact.sum(axis=-1)
+    return (n.sum(axis=(-2, -1)), by_county.sum(axis=-1), by_county @ weight,
+            n.sum(axis=(0, -1)), by_county.sum(axis=0))
+
+
+def simulate(model, scenarios, years=10_000, seed=0, weight=None, workers=1, sigma=DURATION_SIGMA):
+    """
+    Simulation of `years` outage years for every scenario over all counties of `model`.
+
+    `weight` is a per-county EJ weight (ej_weights; default 1). `workers` > 1 spreads the
+    blocks of years over a process pool; the result does not depend on it.
+    """
+    rate = np.stack([model.rate * s.rate for s in scenarios])
+    duration = np.stack([model.duration * s.duration for s in scenarios])
+    customers = np.broadcast_to(model.customers, rate.shape)
+    weight = np.ones(len(model.counties)) if weight is None else np.asarray(weight, dtype='float64')
+    sizes = [min(BLOCK_YEARS, years - lo) for lo in range(0, years, BLOCK_YEARS)]
+    tasks = [(s, y, rate, duration, customers, weight, sigma) for s, y in zip(np.random.SeedSequence(seed).spawn(len(sizes)), sizes)]
+    workers = min(workers or os.cpu_count() or 1, len(tasks))
+    if workers <= 1:
+        blocks = [_simulate_block(t) for t in tasks]
+    else:
+        with ProcessPoolExecutor(workers) as pool:
+            blocks = list(pool.map(_simulate_block, tasks))
+    annual = [np.concatenate([b[i] for b in blocks]).T for i in range(3)]
+    county = [sum(b[i] for b in blocks) / years for i in (3, 4)]
+    return Simulation([s.name for s in scenarios], model.counties, *annual, *county)
+
+
+def impact_summary(sim, quantiles=(0.5, 0.9, 0.99)):
+    """Per scenario: mean annual events, and mean plus `quantiles` of annual customer-hours and EJ-weighted customer-hours."""
+    rows = {}
+    for i, name in enumerate(sim.scenarios):
+        row = {'events': sim.events[i].mean()}
+        for measure in ('customer_hours', 'ej_customer_hours'):
+            values = getattr(sim, measure)[i]
+            row[measure] = values.mean()
+            row.update({f'{measure}_p{round(q * 100)}': v for q, v in zip(quantiles, np.quantile(values, quantiles))})
+        rows[name] = row
+    return pd.DataFrame.from_dict(rows, orient='index').rename_axis('scenario').reset_index()
+
+
+def main(argv=None):
+    from eaglei.datasets import DATA_DIR, county_table, eaglei_aggregates, eia861_sector_mix, ej_table, outage_base, outage_cube
+    from eaglei.embedded import county_attributes
+    from eaglei.live import open_live
+
+    parser = argparse.ArgumentParser(prog='python -m eaglei.scenarios', description='Simulate annual outage impacts under the standard stress cases.')
+    parser.add_argument('--data-dir', default=DATA_DIR, help='directory holding the source CSV files')
+    parser.add_argument('--years', type=int, default=10_000, help='simulated years per scenario (default: 10,000)')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--workers', type=int, default=1, help='process pool size (default: 1, in-process)')
+    args = parser.parse_args(argv)
+    t0 = time.perf_counter()
+    # The same live aggregates and cube as the app and the batch reports
+    agg = open_live(outage_base(eaglei_aggregates(args.data_dir))).tables['agg']
+    mix = eia861_sector_mix(args.data_dir)
+    counties = county_table(agg, mix)
+    ej = ej_table(county_attributes(), counties)
+    model = fit_rates(outage_cube(counties, agg, mix))
+    sim = simulate(model, stress_cases(model, ej), args.years, args.seed, ej_weights(ej, model.counties), args.workers)
+    with pd.option_context('display.width', 200, 'display.max_columns', None, 'display.float_format', '{:,.0f}'.format):
+        print(impact_summary(sim).to_string(index=False))
+    print(f'{args.years:,} years x {len(sim.scenarios)} scenarios in {time.perf_counter() - t0:.1f}s')
+
+
+if __name__ == '__main__':
+    main()
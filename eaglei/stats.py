@@ -0,0 +1,81 @@
+"""
+Significance tests for the EJ correlation matrix.
+
+Bootstrap resamples and permutations are drawn as (B x n) index matrices
+(in row batches for tract-sized n) and every pairwise Pearson r of a batch
+is computed with batched matrix products: bootstrap resamples as a row-count
+matrix times the per-row moment matrix, permutations as stacked Z' P Z. No
+Python-level loop runs over resamples or pairs.
+"""
+
+import numpy as np
+import pandas as pd
+
+# Upper bound on the floats materialized per batch of resamples (tract-sized inputs are split)
+BATCH_ELEMENTS = 4_000_000
+
+
+def _standardize(x):
+    # Center and scale columns (along axis -2) so that Pearson r is a plain dot product
+    x = x - x.mean(axis=-2, keepdims=True)
+    norm = np.sqrt((x * x).sum(axis=-2, keepdims=True))
+    return x / np.where(norm > 0, norm, np.nan)
+
+
+def _batches(B, width):
+    size = max(1, BATCH_ELEMENTS // max(width, 1))
+    for lo in range(0, B, size):
+        yield lo, min(B, lo + size)
+
+
+def bootstrap_corr(x, B=10_000, seed=0):
+    """(B x k x k) Pearson correlation matrices of row-resampled `x` (n x k)."""
+    n, k = x.shape
+    rng = np.random.default_rng(seed)
+    # Work on full-sample z-scores so the raw-moment formulas below stay well conditioned
+    z = _standardize(x) * np.sqrt(n)
+    moments = np.hstack([z, (z[:, :, None] * z[:, None, :]).reshape(n, k * k)])
+    out = np.empty((B, k, k))
+    for lo, hi in _batches(B, n * max(k * k, 2)):
+        idx = rng.integers(0, n, size=(hi - lo, n))
+        # Resample b as multiplicities of each row: one GEMM gives every resample's first and second moments
+        counts = np.bincount((idx + n * np.arange(hi - lo)[:, None]).ravel(), minlength=(hi - lo) * n).reshape(hi - lo, n)
+        m = counts @ moments / n
+        mean, second = m[:, :k], m[:, k:].reshape(-1, k, k)
+        cov = second - mean[:, :, None] * mean[:, None, :]
+        sd = np.sqrt(np.clip(np.diagonal(cov, axis1=1, axis2=2), 0, None))
+        with np.errstate(divide='ignore', invalid='ignore'):
+            out[lo:hi] = cov / (sd[:, :, None] * sd[:, None, :])
+    return out
+
+
+def permutation_corr(x, B=10_000, seed=1):
+    """(B x k x k) correlations of each column of `x` against row-permuted copies of every column (the null)."""
+    n, k = x.shape
+    rng = np.random.default_rng(seed)
+    z = _standardize(x)
+    out = np.empty((B, k, k))
+    for lo, hi in _batches(B, n * k):
+        perm = rng.permuted(np.broadcast_to(np.arange(n), (hi - lo, n)), axis=1)
+        out[lo:hi] = z.T @ z[perm]
+    return out
+
+
+def correlation_tests(df, columns, B=10_000, alpha=0.05, seed=0):
+    """
+    Pearson r, percentile bootstrap CI and two-sided permutation p-value for every column pair.
+
+    Rows with a missing value in any of `columns` are dropped. Returns a long frame with
+    var1, var2, r, ci_low, ci_high, p_value and n (one row per unordered pair).
+    """
+    x = df[list(columns)].dropna().to_numpy(dtype='float64')
+    n, k = x.shape
+    z = _standardize(x)
+    r = z.T @ z
+    boot = bootstrap_corr(x, B, seed)
+    low, high = np.nanquantile(boot, [alpha / 2, 1 - alpha / 2], axis=0)
+    null = permutation_corr(x, B, seed + 1)
+    p = (1 + (np.abs(null) >= np.abs(r) - 1e-12).sum(axis=0)) / (B + 1)
+    i, j = np.triu_indices(k, 1)
+    return pd.DataFrame({'var1': np.asarray(columns)[i], 'var2': np.asarray(columns)[j], 'r': r[i, j],
+                         'ci_low': low[i, j], 'ci_high': high[i, j], 'p_value': p[i, j], 'n': n})
@@ -0,0 +1,171 @@
+"""
+Seeded synthetic source files shaped like the real ones, for benchmarks.
+
+Scale 1 matches the current data volume (159,605 EAGLE-I events, 399 DOE-417
+reports, 2,454 EIA-861 utility rows); scale k multiplies every row count over
+the same 58 counties and 2014-2023 span. EAGLE-I events are drawn per county
+and type from the embedded outage summary and per year from the statewide
+profile, so the aggregates resemble the real ones. Rows come in chunks, each
+from its own generator seeded with (seed, source, chunk number): any scale
+streams to disk in bounded memory, and a seed always gives the same files.
+"""
+
+import os
+
+import numpy as np
+import pandas as pd
+
+from eaglei.datasets import source_path
+from eaglei.embedded import county_attributes, embedded_outages, embedded_yearly
+from eaglei.ingest import CHUNKSIZE, EVENT_TYPES
+
+BASE_ROWS = {'eaglei': 159_605, 'doe417': 399, 'eia861': 2_454}
+
+# Raw cause label written for each event type (normalize_event_type maps it back)
+EVENT_LABELS = {'weather': 'Severe Weather', 'equipment': 'Equipment Failure', 'psps': 'Public Safety Power Shutoff', 'vegetation': 'Vegetation Contact', 'unknown': 'Unknown'}
+
+# DOE-417 Category -> Event_Type, with the relative frequencies of the real file
+DOE417_CATEGORIES = {
+    'Physical Attack': ('Vandalism', 138), 'Weather': ('Severe Weather', 98), 'Operations': ('System Operations', 39),
+    'Fuel Supply Deficiency': ('Fuel Supply Deficiency', 35), 'Islanding': ('Electrical System Separation (Islanding)', 26),
+    'Transmission Interruption': ('Transmission Interruption', 10), 'Cyber Attack': ('Cyber Event', 9), 'Wildfire': ('Severe Weather', 5),
+    'Equipment': ('Equipment Failure', 3),
+}
+
+# Share of values left missing, as in the real files
+MISSING_RATES = {'duration_hours': 0.05, 'event_type': 0.01, 'Time_of_Restoration': 0.19, 'Demand_Loss_MW': 0.19, 'Number_of_Customers_Affected': 0.17,
+                 'Residential_Customer_Count': 0.04, 'Commercial_Customer_Count': 0.004, 'Industrial_Customer_Count': 0.04, 'Transportation_Customer_Count': 0.28}
+
+_SOURCES = list(BASE_ROWS)
+
+
+def _chunk_rng(seed, source, i):
+    return np.random.default_rng([seed, _SOURCES.index(source), i])
+
+
+def _chunks(n, chunksize):
+    # (chunk number, rows) covering n rows
+    return [(i, min(chunksize, n - start)) for i, start in enumerate(range(0, n, chunksize))]
+
+
+def _blank(rng, values, rate):
+    # Object copy of `values` with about `rate` of them replaced by None
+    values = np.asarray(values, dtype=object)
+    values[rng.random(len(values)) < rate] = None
+    return values
+
+
+def _date_text(t):
+    # DOE-417 dates and times are not zero-padded: 1/18/2010, 5:00:00
+    t = pd.DatetimeIndex(t)
+    return (t.month.astype(str) + '/' + t.day.astype(str) + '/' + t.year.astype(str)).to_numpy(dtype=object)
+
+
+def _clock_text(t):
+    t = pd.DatetimeIndex(t)
+    return (t.hour.astype(str) + ':' + pd.Index(t.minute).map('{:02d}'.format) + ':00').to_numpy(dtype=object)
+
+
+def eaglei_chunks(n, seed=0, chunksize=CHUNKSIZE):
+    """Yield eaglei_transformed.csv-shaped frames totalling `n` events (county, start_time, event_type, customers_affected, duration_hours, latitude, longitude)."""
+    attrs, outage = county_attributes(), embedded_outages()
+    outage = outage.loc[attrs.index.intersection(outage.index, sort=False)]
+    attrs = attrs.loc[outage.index]
+    county_p = outage['event_count'].to_numpy(dtype='float64')
+    county_p /= county_p.sum()
+    type_p = outage[EVENT_TYPES].to_numpy(dtype='float64')
+    type_cum = np.cumsum(type_p / type_p.sum(axis=1, keepdims=True), axis=1)
+    mean_customers = (outage['total_customers'] / outage['event_count']).to_numpy()
+    mean_duration = outage['avg_duration'].to_numpy()
+    yearly = embedded_yearly()
+    year_p = yearly['events'].to_numpy(dtype='float64') / yearly['events'].sum()
+    labels = np.array([EVENT_LABELS[t] for t in EVENT_TYPES], dtype=object)
+    for i, size in _chunks(n, chunksize):
+        rng = _chunk_rng(seed, 'eaglei', i)
+        county = rng.choice(len(county_p), size, p=county_p)
+        etype = np.minimum((rng.random(size)[:, None] > type_cum[county]).sum(axis=1), len(EVENT_TYPES) - 1)
+        year = yearly['year'].to_numpy()[rng.choice(len(year_p), size, p=year_p)]
+        start = (year - 1970).astype('datetime64[Y]').astype('datetime64[s]') + rng.integers(0, 365 * 86_400, size).astype('timedelta64[s]')
+        # Heavy-tailed customer counts and gamma durations around each county's embedded means
+        customers = np.maximum(1, rng.lognormal(np.log(mean_customers[county]) - 0.5, 1.0)).round().astype('int64')
+        duration = rng.gamma(2.0, mean_duration[county] / 2.0).round(2)
+        duration[rng.random(size) < MISSING_RATES['duration_hours']] = np.nan
+        yield pd.DataFrame({
+            'county': attrs.index.to_numpy()[county],
+            'start_time': start,
+            'event_type': _blank(rng, labels[etype], MISSING_RATES['event_type']),
+            'customers_affected': customers,
+            'duration_hours': duration,
+            'latitude': (attrs['latitude'].to_numpy()[county] + rng.normal(0, 0.15, size)).round(5),
+            'longitude': (attrs['longitude'].to_numpy()[county] + rng.normal(0, 0.15, size)).round(5),
+        })
+
+
+def doe417_chunks(n, seed=0, chunksize=CHUNKSIZE):
+    """Yield DOE_standardized_power_outages.csv-shaped frames totalling `n` reports (Date_of_Restoration always empty, as in the real file)."""
+    counties = county_attributes().index.to_numpy()
+    cats = list(DOE417_CATEGORIES)
+    weights = np.array([w for _, w in DOE417_CATEGORIES.values()], dtype='float64')
+    for i, size in _chunks(n, chunksize):
+        yield _doe417_rows(_chunk_rng(seed, 'doe417', i), size, i * chunksize, counties, cats, weights / weights.sum())
+
+
+def _doe417_rows(rng, n, first, counties, cats, cat_p):
+    category = rng.choice(len(cats), n, p=cat_p)
+    began = np.datetime64('2010-01-01T00:00') + rng.integers(0, 14 * 365 * 1440, n).astype('timedelta64[m]')
+    restored = began + rng.gamma(1.5, 240, n).astype('timedelta64[m]')
+    return pd.DataFrame({
+        'Event_ID': np.arange(first + 1, first + n + 1),
+        'Date_Event_Began': _date_text(began),
+        'Time_Event_Began': _clock_text(began),
+        'Date_of_Restoration': None,
+        'Time_of_Restoration': _blank(rng, _clock_text(restored), MISSING_RATES['Time_of_Restoration']),
+        'Area_Affected': [f'California: {c} County;' for c in rng.choice(counties, n)],
+        'NERC_Region': 'WECC',
+        'Alert_Criteria': None,
+        'Event_Type': [DOE417_CATEGORIES[cats[c]][0] for c in category],
+        'Demand_Loss_MW': _blank(rng, rng.gamma(0.5, 200, n).round(), MISSING_RATES['Demand_Loss_MW']),
+        'Number_of_Customers_Affected': _blank(rng, rng.lognormal(8, 2, n).round().astype('int64'), MISSING_RATES['Number_of_Customers_Affected']),
+        'Category': [cats[c] for c in category],
+    })
+
+
+def eia861_chunks(n, seed=0, chunksize=CHUNKSIZE):
+    """Yield EIA861_CA_Combined_Data.csv-shaped frames totalling `n` utility x county x year rows (quoted "32,803" counts, "." for missing)."""
+    attrs = county_attributes()
+    # About 62 utilities per 2,454 rows, as in the real file
+    utilities = max(1, round(n * 62 / BASE_ROWS['eia861']))
+    for i, size in _chunks(n, chunksize):
+        yield _eia861_rows(_chunk_rng(seed, 'eia861', i), size, attrs, utilities)
+
+
+def _eia861_rows(rng, n, attrs, utilities):
+    years = np.arange(2014, 2025)
+    county = rng.choice(len(attrs), n, p=(attrs['population'] / attrs['population'].sum()).to_numpy())
+    utility = rng.integers(0, utilities, n)
+    residential = np.maximum(1, rng.lognormal(9.5, 1.8, n)).round().astype('int64')
+    counts = {'Residential_Customer_Count': residential, 'Commercial_Customer_Count': (residential * rng.uniform(0.08, 0.2, n)).round().astype('int64'),
+              'Industrial_Customer_Count': (residential * rng.uniform(0.0, 0.03, n)).round().astype('int64'), 'Transportation_Customer_Count': rng.integers(0, 3, n)}
+    total = sum(counts.values())
+    text = lambda v, rate: np.where(rng.random(n) < rate, '.', [f'{x:,}' for x in v])
+    return pd.DataFrame({
+        'Year': years[rng.integers(0, len(years), n)],
+        'Utility_Number': 100 + utility,
+        'Utility_Name_x': [f'Utility {u}' for u in utility],
+        'State': 'CA',
+        **{col: text(v, MISSING_RATES[col]) for col, v in counts.items()},
+        'Total_Customer_ Count': [f'{x:,}' for x in total],
+        'Utility_Name_y': [f'Utility {u}' for u in utility],
+        'county': attrs.index.to_numpy()[county],
+    })
+
+
+def write_synthetic(data_dir, scale=1, seed=0, chunksize=CHUNKSIZE):
+    """Write the EAGLE-I, DOE-417 and EIA-861 source files at `scale` x BASE_ROWS into `data_dir`; returns source name -> row count."""
+    os.makedirs(data_dir, exist_ok=True)
+    rows = {name: max(1, round(base * scale)) for name, base in BASE_ROWS.items()}
+    for name, chunks in (('eaglei', eaglei_chunks), ('doe417', doe417_chunks), ('eia861', eia861_chunks)):
+        path = source_path(name, data_dir)
+        for i, chunk in enumerate(chunks(rows[name], seed, chunksize)):
+            chunk.to_csv(path, mode='w' if i == 0 else 'a', header=i == 0, index=False)
+    return rows
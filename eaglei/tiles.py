@@ -0,0 +1,129 @@
+"""
+Server-side binning of outage points for the map.
+
+Event coordinates are folded chunk by chunk into Web Mercator (quadkey) tile
+cells at the finest level, keeping only per-cell sums (events, customers,
+durations and coordinates for a centroid). Every coarser level is derived
+from the one below by halving the tile coordinates and summing again, so the
+whole pyramid is built from the finest cells, never from the raw points. A map
+view then sends only the cells of the level matching its zoom that fall
+inside its bounds, found by binary search on the sorted cell keys.
+"""
+
+import numpy as np
+import pandas as pd
+
+from eaglei.ingest import CHUNKSIZE, read_eaglei_chunks
+
+# Finest and coarsest cell levels kept in the pyramid
+MAX_LEVEL = 16
+MIN_LEVEL = 6
+
+# Cells are this many levels finer than the map zoom (2**3 = 8 cells across a 256 px tile, ~32 px each)
+CELL_LEVELS = 3
+TILE_SIZE = 256
+
+# Web Mercator's latitude limit
+MAX_LAT = 85.05112878
+
+CELL_SUMS = ['events', 'customers', 'duration_sum', 'duration_n', 'lat_sum', 'lon_sum']
+
+
+def tile_xy(lat, lon, level):
+    """Integer tile column and row of each point at `level` (Web Mercator, as in Bing/OSM quadkeys)."""
+    x, y = _world_xy(lat, lon)
+    n = 1 << level
+    return np.clip((x * n).astype('int64'), 0, n - 1), np.clip((y * n).astype('int64'), 0, n - 1)
+
+
+def _world_xy(lat, lon):
+    # Fractional Web Mercator coordinates in [0, 1), y growing southwards
+    lat = np.radians(np.clip(np.asarray(lat, dtype='float64'), -MAX_LAT, MAX_LAT))
+    x = (np.asarray(lon, dtype='float64') + 180.0) / 360.0
+    y = (1.0 - np.arcsinh(np.tan(lat)) / np.pi) / 2.0
+    return x, y
+
+
+def fold_points(chunk, level=MAX_LEVEL):
+    """Reduce a canonical chunk with latitude/longitude to per-cell sums at `level` (rows without coordinates are dropped)."""
+    chunk = chunk[chunk['latitude'].notna() & chunk['longitude'].notna()]
+    lat, lon = chunk['latitude'].to_numpy(dtype='float64'), chunk['longitude'].to_numpy(dtype='float64')
+    x, y = tile_xy(lat, lon, level)
+    duration = chunk['duration'].to_numpy(dtype='float64')
+    known = ~np.isnan(duration)
+    cells = pd.DataFrame({
+        'key': (x << level) | y,
+        'events': np.ones(len(chunk)),
+        'customers': chunk['customers'].to_numpy(dtype='float64'),
+        'duration_sum': np.where(known, duration, 0.0),
+        'duration_n': known.astype('float64'),
+        'lat_sum': lat,
+        'lon_sum': lon,
+    })
+    return cells.groupby('key', sort=False).sum().reset_index()
+
+
+def combine_cells(parts):
+    """Sum partial cell tables (fold_points output) into one, sorted by key."""
+    parts = [p for p in parts if len(p)]
+    if not parts:
+        return pd.DataFrame({'key': pd.Series(dtype='int64'), **{c: pd.Series(dtype='float64') for c in CELL_SUMS}})
+    return pd.concat(parts, ignore_index=True).groupby('key', sort=True).sum().reset_index()
+
+
+def build_pyramid(cells, level=MAX_LEVEL, min_level=MIN_LEVEL):
+    """Dict level -> key-sorted cell table for every level from `level` (the level of `cells`) down to `min_level`."""
+    pyramid = {level: cells}
+    for lvl in range(level - 1, min_level - 1, -1):
+        finer = pyramid[lvl + 1]
+        key = finer['key'].to_numpy()
+        # Parent tile: drop the lowest bit of x and y, i.e. (x >> 1) << lvl | (y >> 1)
+        x, y = key >> (lvl + 1), key & ((1 << (lvl + 1)) - 1)
+        parent, inverse = np.unique(((x >> 1) << lvl) | (y >> 1), return_inverse=True)
+        pyramid[lvl] = pd.DataFrame({'key': parent, **{c: np.bincount(inverse, weights=finer[c].to_numpy(), minlength=len(parent)) for c in CELL_SUMS}})
+    return pyramid
+
+
+def view_cells(pyramid, zoom, center, width=900, height=480):
+    """
+    Cells shown by a `width` x `height` px map at `zoom` centred on `center` ({'lat', 'lon'}).
+
+    The level is zoom + CELL_LEVELS clamped to the pyramid. Returns latitude and
+    longitude (event-weighted centroid), events, customers and avg_duration per cell.
+    """
+    level = int(np.clip(round(zoom) + CELL_LEVELS, min(pyramid), max(pyramid)))
+    cells = pyramid[level]
+    cx, cy = _world_xy(center['lat'], center['lon'])
+    half_w, half_h = width / 2 / (TILE_SIZE * 2.0 ** zoom), height / 2 / (TILE_SIZE * 2.0 ** zoom)
+    n = 1 << level
+    x0, x1 = (int(np.clip(v * n, 0, n - 1)) for v in (cx - half_w, cx + half_w))
+    y0, y1 = (int(np.clip(v * n, 0, n - 1)) for v in (cy - half_h, cy + half_h))
+    # Keys sort by column first: the visible columns are one contiguous key range
+    key = cells['key'].to_numpy()
+    lo, hi = np.searchsorted(key, [x0 << level, (x1 + 1) << level])
+    cells = cells.iloc[lo:hi]
+    y = cells['key'].to_numpy() & (n - 1)
+    cells = cells[(y >= y0) & (y <= y1)]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return pd.DataFrame({
+            'latitude': cells['lat_sum'] / cells['events'],
+            'longitude': cells['lon_sum'] / cells['events'],
+            'events': cells['events'].round().astype('int64'),
+            'customers': cells['customers'].round().astype('int64'),
+            'avg_duration': cells['duration_sum'] / cells['duration_n'],
+        }).reset_index(drop=True)
+
+
+def legend_stats(values):
+    """Min, quartiles, max and mean of the values a map is coloured by (the display_legend breaks)."""
+    values = np.asarray(values, dtype='float64')
+    values = values[~np.isnan(values)]
+    if not len(values):
+        return {'min': np.nan, 'q25': np.nan, 'median': np.nan, 'q75': np.nan, 'max': np.nan, 'mean': np.nan}
+    q25, q50, q75 = np.percentile(values, [25, 50, 75])
+    return {'min': values.min(), 'q25': q25, 'median': q50, 'q75': q75, 'max': values.max(), 'mean': values.mean()}
+
+
+def read_point_cells(path, level=MAX_LEVEL, chunksize=CHUNKSIZE, columns=None):
+    """Finest-level cell sums of every event with coordinates in a raw EAGLE-I file (empty when it has none)."""
+    return combine_cells([fold_points(chunk, level) for chunk in read_eaglei_chunks(path, chunksize, columns) if 'latitude' in chunk])
@@ -0,0 +1,139 @@
+"""
+Census-tract EJ layer: CalEnviroScreen 4.0 and CDC SVI tract tables and a
+spatial join from outage events to tracts.
+
+Tract indicators are held as compact typed columns keyed by the 11-digit
+GEOID. Tract polygons go into a shapely STRtree, so locating millions of event
+points is one bulk bounding-box query plus exact point-in-polygon tests on the
+few candidates, instead of testing every event against every tract. Events
+without coordinates are apportioned to their county's tracts by population.
+"""
+
+import json
+from collections import namedtuple
+
+import numpy as np
+import pandas as pd
+import shapely
+from shapely.geometry import shape
+
+from eaglei.ingest import CHUNKSIZE, read_eaglei_chunks
+
+# CalEnviroScreen 4.0 results export -> tract columns
+CES_COLUMNS = {'Census Tract': 'geoid', 'Total Population': 'population', 'California County': 'county', 'Longitude': 'longitude', 'Latitude': 'latitude',
+               'CES 4.0 Score': 'ces_score', 'CES 4.0 Percentile': 'ces_percentile', 'Poverty': 'poverty_rate', 'PM2.5': 'pm25'}
+
+# CDC/ATSDR SVI (California, census tract) -> tract columns; -999 marks missing estimates
+SVI_COLUMNS = {'FIPS': 'geoid', 'RPL_THEMES': 'svi_score'}
+SVI_MISSING = -999
+
+TRACT_MEASURES = ['events', 'customers', 'duration_sum', 'duration_n']
+
+TractIndex = namedtuple('TractIndex', ['geoid', 'geoms', 'tree'])
+
+
+def read_ces4(path):
+    """Typed CalEnviroScreen 4.0 tract table (int64 geoid, categorical county, float32 indicators)."""
+    ces = pd.read_csv(path, usecols=list(CES_COLUMNS), dtype={'California County': 'string'}, na_values=['NA', 'N/A', ''])
+    ces = ces.rename(columns=CES_COLUMNS)
+    ces['geoid'] = ces['geoid'].astype('int64')
+    ces['population'] = ces['population'].fillna(0).astype('int32')
+    ces['county'] = ces['county'].str.strip().astype('category')
+    floats = ['longitude', 'latitude', 'ces_score', 'ces_percentile', 'poverty_rate', 'pm25']
+    ces[floats] = ces[floats].astype('float32')
+    return ces[list(CES_COLUMNS.values())]
+
+
+def read_svi(path):
+    """Overall SVI percentile rank (RPL_THEMES, 0-1) per tract; -999 becomes NaN."""
+    svi = pd.read_csv(path, usecols=list(SVI_COLUMNS)).rename(columns=SVI_COLUMNS)
+    svi['geoid'] = svi['geoid'].astype('int64')
+    svi['svi_score'] = svi['svi_score'].where(svi['svi_score'] != SVI_MISSING).astype('float32')
+    return svi
+
+
+def tract_table(ces, svi):
+    """CES tracts joined with SVI by GEOID, sorted by GEOID."""
+    return ces.merge(svi, on='geoid', how='left').sort_values('geoid', ignore_index=True)
+
+
+def read_tract_polygons(path, id_field='GEOID'):
+    """(geoid int64 array, shapely geometry array) from a tract GeoJSON FeatureCollection."""
+    with open(path) as f:
+        features = json.load(f)['features']
+    geoid = np.array([int(ft['properties'][id_field]) for ft in features], dtype='int64')
+    geoms = np.array([shape(ft['geometry']) for ft in features], dtype=object)
+    return geoid, geoms
+
+
+def build_tract_index(geoid, geoms):
+    """STRtree over tract polygons, kept alongside their GEOIDs."""
+    shapely.prepare(geoms)
+    return TractIndex(geoid, geoms, shapely.STRtree(geoms))
+
+
+def locate(index, lon, lat):
+    """Position in index.geoid of the tract containing each point, -1 when outside every tract or missing."""
+    lon, lat = np.asarray(lon, dtype='float64'), np.asarray(lat, dtype='float64')
+    out = np.full(len(lon), -1, dtype='int64')
+    valid = np.flatnonzero(np.isfinite(lon) & np.isfinite(lat))
+    if len(valid):
+        point, tract = index.tree.query(shapely.points(lon[valid], lat[valid]), predicate='intersects')
+        # Points on a shared boundary hit two tracts; keep the first
+        point, first = np.unique(point, return_index=True)
+        out[valid[point]] = tract[first]
+    return out
+
+
+def tract_outages(path, tracts, index=None, chunksize=CHUNKSIZE, columns=None):
+    """
+    Per-tract events, customers, duration_sum and duration_n (float64 arrays aligned to `tracts`).
+
+    Events with coordinates are located with `index` (a TractIndex); the rest, and any that
+    fall outside every polygon, are summed per county and spread over that county's tracts
+    in proportion to tract population.
+    """
+    counties = tracts['county'].astype('category').cat.categories
+    tract_county = pd.Categorical(tracts['county'], categories=counties).codes
+    position = None if index is None else pd.Index(tracts['geoid']).get_indexer(index.geoid)
+    located = np.zeros((len(TRACT_MEASURES), len(tracts)))
+    by_county = np.zeros((len(TRACT_MEASURES), len(counties)))
+    for chunk in read_eaglei_chunks(path, chunksize, columns):
+        duration = chunk['duration'].to_numpy(dtype='float64')
+        weights = [np.ones(len(chunk)), chunk['customers'].to_numpy(dtype='float64'), np.nan_to_num(duration), np.isfinite(duration).astype('float64')]
+        tract = np.full(len(chunk), -1, dtype='int64')
+        if position is not None and 'latitude' in chunk:
+            hit = locate(index, chunk['longitude'], chunk['latitude'])
+            tract[hit >= 0] = position[hit[hit >= 0]]
+        county = pd.Categorical(chunk['county'], categories=counties).codes
+        rest = (tract < 0) & (county >= 0)
+        for m, w in enumerate(weights):
+            located[m] += np.bincount(tract[tract >= 0], weights=w[tract >= 0], minlength=len(tracts))
+            by_county[m] += np.bincount(county[rest], weights=w[rest], minlength=len(counties))
+
+    population = tracts['population'].to_numpy(dtype='float64')
+    county_pop = np.bincount(tract_county[tract_county >= 0], weights=population[tract_county >= 0], minlength=len(counties))
+    share = np.where(tract_county >= 0, population / np.where(county_pop > 0, county_pop, np.inf)[tract_county], 0)
+    totals = located + by_county[:, tract_county] * share
+    return pd.DataFrame(dict(zip(TRACT_MEASURES, totals)), index=tracts.index)
+
+
+def tract_ej(tracts, outages):
+    """Tract EJ frame with event_count, total_customers, avg_duration and outage_rate (per 1,000 residents)."""
+    ej = tracts.copy()
+    ej['event_count'] = outages['events']
+    ej['total_customers'] = outages['customers']
+    with np.errstate(divide='ignore', invalid='ignore'):
+        ej['avg_duration'] = (outages['duration_sum'] / outages['duration_n']).round(2)
+        ej['outage_rate'] = (ej['event_count'] / ej['population'] * 1000).where(ej['population'] > 0)
+    return ej
+
+
+def county_indicators(tracts, columns=('ces_score', 'svi_score', 'poverty_rate', 'pm25')):
+    """Population-weighted county means of tract indicators (county-indexed)."""
+    columns = list(columns)
+    values = tracts[columns].to_numpy(dtype='float64')
+    weight = np.where(np.isnan(values), 0, tracts['population'].to_numpy(dtype='float64')[:, None])
+    sums = pd.DataFrame(np.nan_to_num(values) * weight, columns=columns).groupby(tracts['county'].to_numpy()).sum()
+    counts = pd.DataFrame(weight, columns=columns).groupby(tracts['county'].to_numpy()).sum()
+    return sums / counts.where(counts > 0)
@@ -0,0 +1,43 @@
+"""
+Streamlit UI of the EAGLE-I EJ Analyzer.
+
+eagle_i_ej_analyzer_v3_complete.py only configures the page and the sidebar,
+then imports the module of the selected page and calls its render(). A page
+module imports just what that page draws with (Plotly Express, SciPy,
+shapely, ...), so a session loads each of them the first time a page needs it,
+not on startup. The cached loaders shared by every page live in eaglei.ui.data.
+
+ADMIN_PAGES are only listed for a session opened with ?admin=<token>, where
+the token is the EAGLEI_ADMIN_TOKEN environment variable. Without that
+variable they are never shown. The same check (is_admin) gates the controls
+that change shared data, such as appending EAGLE-I batches.
+"""
+
+import hmac
+import os
+
+# Sidebar label -> page module
+PAGES = {
+    "🏠 Home": 'eaglei.ui.pages.home',
+    "📊 EAGLE-I Outages": 'eaglei.ui.pages.outages',
+    "🔍 Query & Explore": 'eaglei.ui.pages.query',
+    "📈 Sector & Events": 'eaglei.ui.pages.sectors',
+    "🗓️ DOE-417 Timeline": 'eaglei.ui.pages.timeline',
+    "⚖️ Environmental Justice": 'eaglei.ui.pages.ej',
+    "🔗 EJ Correlation": 'eaglei.ui.pages.ej_correlation',
+    "🎲 Scenarios": 'eaglei.ui.pages.scenarios',
+    "📉 Data Quality": 'eaglei.ui.pages.quality',
+    "📋 Report": 'eaglei.ui.pages.report',
+    "📥 Sources": 'eaglei.ui.pages.sources',
+}
+
+ADMIN_PAGES = {
+    "⏱️ Performance": 'eaglei.ui.pages.performance',
+}
+
+
+def is_admin():
+    """True when this session was opened with ?admin=<EAGLEI_ADMIN_TOKEN> (never when the variable is unset)."""
+    import streamlit as st
+    token = os.environ.get('EAGLEI_ADMIN_TOKEN')
+    return bool(token) and hmac.compare_digest(st.query_params.get('admin', '').encode(), token.encode())
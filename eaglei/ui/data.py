@@ -0,0 +1,365 @@
+"""
+Cached loaders shared by the pages: st.cache_data tables, st.cache_resource
+shared objects (the live aggregates, cube, event store, tile pyramid) and the
+payload LRU.
+
+Each wraps a Streamlit-free engine from the eaglei package. The cache
+decorators are instrumented: every call is timed (stage "cache"), cache misses
+are timed again around the actual computation (stage "load") and both are
+counted per loader in eaglei.metrics. eaglei.spatial
+(SciPy) is imported inside the hotspot loaders, so it only loads when a map's
+hotspot layer is first switched on; eaglei.scenarios likewise loads with the
+first simulation.
+"""
+
+import functools
+import glob
+import os
+import threading
+
+import pandas as pd
+import streamlit as st
+
+from eaglei.cache import cached_table, frame_fingerprint
+from eaglei.cube import cube_with_delta
+from eaglei.datasets import DATA_DIR, county_table, eaglei_aggregates, ej_table, outage_base, outage_cube, snapshot_episodes, source_path
+from eaglei.doe417 import doe417_events, doe417_overlaps, doe417_timeline, outage_intervals, read_doe417
+from eaglei.eia import read_eia861, sector_mix
+from eaglei.embedded import county_attributes, embedded_yearly
+from eaglei.episodes import episode_events
+from eaglei.events import build_event_store, eaglei_event_parts, encode_events
+from eaglei.ingest import yearly_summary
+from eaglei.live import apply_batch, open_live
+from eaglei.metrics import count, set_gauge, timed
+from eaglei.payloads import cached_payload, payload_cache, payload_key
+from eaglei.quality import SOURCE_PROFILES, profile_source
+from eaglei.stats import correlation_tests
+from eaglei.tiles import build_pyramid, combine_cells, read_point_cells
+from eaglei.tracts import build_tract_index, read_ces4, read_svi, read_tract_polygons, tract_ej, tract_outages, tract_table
+
+EAGLEI_CSV = source_path('eaglei', DATA_DIR)
+DOE417_CSV = source_path('doe417', DATA_DIR)
+EIA861_CSV = source_path('eia861', DATA_DIR)
+SHARES_CSV = source_path('shares', DATA_DIR)
+CES4_CSV = source_path('ces4', DATA_DIR)
+SVI_CSV = source_path('svi', DATA_DIR)
+TRACTS_GEOJSON = source_path('tracts', DATA_DIR)
+
+
+def _instrumented(cache):
+    # st.cache_data / st.cache_resource that also counts and times calls and misses per loader.
+    # The inner function only runs on a miss; functools.wraps keeps the loader's name,
+    # signature and source, which Streamlit uses for the cache key and for _-prefixed args.
+    def decorate(fn):
+        name = fn.__name__
+
+        @functools.wraps(fn)
+        def compute(*args, **kwargs):
+            count('cache_misses', cache=name)
+            with timed('load', name):
+                return fn(*args, **kwargs)
+
+        cached = cache(compute)
+
+        @functools.wraps(fn)
+        def call(*args, **kwargs):
+            count('cache_calls', cache=name)
+            with timed('cache', name):
+                return cached(*args, **kwargs)
+
+        call.clear = cached.clear
+        return call
+    return decorate
+
+
+cache_data = _instrumented(st.cache_data)
+cache_resource = _instrumented(st.cache_resource)
+
+
+@cache_data
+def load_eaglei_aggregates():
+    """County x year x month x event-type aggregates from snapshot episodes or eaglei_transformed.csv, or None if neither exists"""
+    return eaglei_aggregates(DATA_DIR, load_episodes())
+
+
+@cache_data
+def load_episodes():
+    """Outage episodes reconstructed from raw EAGLE-I 15-minute snapshot files (eaglei_outages_<year>.csv), or None if absent"""
+    return snapshot_episodes(DATA_DIR)
+
+
+@cache_data
+def load_doe417():
+    return cached_table(DOE417_CSV, read_doe417)
+
+
+@cache_data
+def load_eia861():
+    return cached_table(EIA861_CSV, read_eia861, version=2)
+
+
+@cache_data
+def load_sector_mix():
+    """Residential/commercial/industrial customer shares per county and year from the allocated EIA-861 customers"""
+    return sector_mix(load_county_customers())
+
+
+@cache_resource
+def load_crosswalk():
+    """Sparse utility x county allocation matrices per EIA-861 year (utility_county_shares.csv shares if present, else population)"""
+    from eaglei.crosswalk import build_crosswalk
+    shares = pd.read_csv(SHARES_CSV) if os.path.exists(SHARES_CSV) else None
+    return build_crosswalk(load_eia861(), load_counties()['population'], shares)
+
+
+@cache_data
+def load_county_customers():
+    """EIA-861 customers by sector allocated to counties for every year (each utility counted once)"""
+    from eaglei.crosswalk import allocate_customers
+    return allocate_customers(load_crosswalk())
+
+
+@cache_data
+def load_counties():
+    """County attribute table (latitude, longitude, population, region) indexed by county"""
+    return county_attributes()
+
+
+@cache_resource
+def load_live_store():
+    """
+    The current live aggregates and outage cube shared by every session, plus the lock
+    append_eaglei_batch swaps new ones in under. Neither is modified once stored, so a
+    reader holding one keeps a consistent snapshot.
+    """
+    return {'lock': threading.Lock(), 'live': open_live(outage_base(load_eaglei_aggregates())), 'cube': None}
+
+
+def load_live():
+    """Outage aggregates (eaglei_transformed.csv, else the embedded summary spread over years) plus every appended batch"""
+    return load_live_store()['live']
+
+
+def append_eaglei_batch(path):
+    """Fold a new EAGLE-I batch into new live aggregates and a new cube, swap them in, then refresh the derived tables"""
+    store = load_live_store()
+    with store['lock']:
+        live, delta = apply_batch(store['live'], path)
+        cube = store['cube']
+        if len(delta) and cube is not None:
+            # A delta outside the cube's years needs a full rebuild from the new aggregates
+            cube = cube_with_delta(cube, delta) or outage_cube(county_table(live.tables['agg'], load_sector_mix()), live.tables['agg'], load_sector_mix())
+        store.update(live=live, cube=cube)
+        if len(delta):
+            for loader in (load_data, load_yearly, load_ej, load_outage_table, load_point_tiles):
+                loader.clear()
+    return delta
+
+
+@cache_data
+def load_data():
+    # Outage columns come from the live aggregates (real event file and appended batches)
+    return county_table(load_live().tables['agg'], load_sector_mix())
+
+
+@cache_data
+def load_yearly():
+    live = load_live()
+    if load_eaglei_aggregates() is not None:
+        return yearly_summary(live.tables['agg'])
+    yearly = embedded_yearly().set_index('year').add(yearly_summary(live.tables['delta']).set_index('year'), fill_value=0)
+    return yearly.astype('int64').reset_index()
+
+
+def load_cube():
+    """Outage cube (county x year x month x event type x sector) read by the Outages, Sector & Events and Report pages"""
+    store = load_live_store()
+    if store['cube'] is None:
+        with store['lock']:
+            if store['cube'] is None:
+                count('cache_misses', cache='load_cube')
+                with timed('load', 'load_cube'):
+                    store['cube'] = outage_cube(load_data(), store['live'].tables['agg'], load_sector_mix())
+    return store['cube']
+
+
+@cache_data
+def load_forecasts(version):
+    """Per county x event-type forecast models of the cube, refitted only when the outage version (or the on-disk fingerprint) changes"""
+    from eaglei.forecast import cached_forecasts
+    return cached_forecasts(load_cube())
+
+
+@cache_data
+def load_reliability(version, level='county'):
+    """SAIDI/SAIFI/CAIDI prefix arrays per 'county', 'region' or 'utility' (EIA-861 Utility_Number), per outage version"""
+    from eaglei.reliability import county_reliability, group_reliability, utility_reliability
+    cube = load_cube()
+    if level == 'utility':
+        return utility_reliability(cube, load_crosswalk())
+    counties = county_reliability(cube, load_county_customers())
+    return counties if level == 'county' else group_reliability(counties, cube.groups[level][1], level)
+
+
+@cache_data
+def load_outage_table():
+    """load_data() plus yearly-average saidi, saifi and caidi per county, for the Outages map and the query engine"""
+    from eaglei.reliability import annual
+    df = load_data()
+    indices = annual(load_reliability(outage_version())).set_index('county').reindex(df['county'])
+    return df.assign(**{c: indices[c].round(2).to_numpy() for c in ('saidi', 'saifi', 'caidi')})
+
+
+@cache_resource
+def load_event_store():
+    """Time-sorted, indexed EAGLE-I + DOE-417 event store (one shared read-only copy for all sessions)"""
+    attrs = load_counties()
+    counties = list(attrs.index)
+    episodes = load_episodes()
+    if episodes is not None:
+        parts = [encode_events(episode_events(episodes), counties, source=0)]
+    else:
+        parts = list(eaglei_event_parts(EAGLEI_CSV, counties, source=0)) if os.path.exists(EAGLEI_CSV) else []
+    parts.append(encode_events(doe417_events(load_doe417(), counties), counties, source=1))
+    return build_event_store(parts, attrs)
+
+
+@cache_data
+def load_doe417_timeline():
+    """DOE-417 reports with parsed start/restoration timestamps and durations"""
+    return doe417_timeline(load_doe417())
+
+
+@cache_resource
+def load_outage_intervals():
+    """Sorted interval index over the EAGLE-I outages of the event store, grouped by county"""
+    return outage_intervals(load_event_store())
+
+
+@cache_data
+def load_doe417_overlaps():
+    """(report row, county, event-store row) of every EAGLE-I outage overlapping a DOE-417 report in a county it names"""
+    return doe417_overlaps(load_doe417_timeline(), load_doe417()['Area_Affected'], load_outage_intervals(), load_event_store().counties)
+
+
+@cache_resource
+def load_point_tiles():
+    """Tile pyramid of the EAGLE-I events with coordinates plus appended batches' (cells cached on disk, one shared copy), or None without coordinates"""
+    parts = [load_live().tables['cells']]
+    if os.path.exists(EAGLEI_CSV):
+        parts.append(cached_table(EAGLEI_CSV, read_point_cells, name='eaglei_cells'))
+    cells = combine_cells(parts)
+    return build_pyramid(cells) if len(cells) else None
+
+
+@cache_data
+def load_tracts():
+    """CalEnviroScreen 4.0 + CDC SVI tract table, or None when the tract files are absent"""
+    if not (os.path.exists(CES4_CSV) and os.path.exists(SVI_CSV)):
+        return None
+    return tract_table(cached_table(CES4_CSV, read_ces4), cached_table(SVI_CSV, read_svi))
+
+
+@cache_resource
+def load_tract_index():
+    """STRtree over census-tract polygons, or None without the tract GeoJSON"""
+    return build_tract_index(*read_tract_polygons(TRACTS_GEOJSON)) if os.path.exists(TRACTS_GEOJSON) else None
+
+
+@cache_data
+def load_tract_ej():
+    """Tract EJ indicators with outages attributed by point-in-polygon (or by population when events lack coordinates)"""
+    tracts = load_tracts()
+    if tracts is None or not os.path.exists(EAGLEI_CSV):
+        return None
+    ej = tract_ej(tracts, tract_outages(EAGLEI_CSV, tracts, load_tract_index()))
+    fire = load_ej().set_index('county')['fire_risk']
+    ej['fire_risk'] = fire.reindex(ej['county'].astype(str)).to_numpy()
+    return ej
+
+
+@cache_data
+def load_ej():
+    return ej_table(load_counties(), load_data(), load_tracts())
+
+
+def source_files(name):
+    """(path, size, mtime) of every file of raw source `name` present in DATA_DIR (the snapshots are one file per year)"""
+    return tuple((p, os.path.getsize(p), os.path.getmtime(p)) for p in sorted(glob.glob(source_path(name, DATA_DIR))))
+
+
+@cache_data
+def load_source_profile(name, files):
+    """Chunked profile of raw source `name` (a SOURCE_PROFILES key) over `files` from source_files(), re-read when any file changes"""
+    profile = profile_source([p for p, _, _ in files], SOURCE_PROFILES[name], workers=min(len(files), os.cpu_count() or 1))
+    # The key hashes are only needed while merging; keep the cached profile small
+    return profile._replace(keys=None)
+
+
+@cache_data
+def load_correlation_tests(fingerprint, _data, B=10_000):
+    """Bootstrap CIs and permutation p-values for every column pair, cached per dataset fingerprint"""
+    return correlation_tests(_data, list(_data.columns), B)
+
+
+@cache_data
+def load_simulation(version, years=10_000, seed=0):
+    """Monte Carlo outage years for the standard stress cases, cached per outage version; runs past 10,000 years use every core"""
+    from eaglei.scenarios import ej_weights, fit_rates, simulate, stress_cases
+    model, ej = fit_rates(load_cube()), load_ej()
+    return simulate(model, stress_cases(model, ej), years, seed, ej_weights(ej, model.counties), workers=1 if years <= 10_000 else None)
+
+
+@cache_resource
+def load_weights(counties, k=6):
+    """Sparse KNN spatial weights over the centroids of `counties` (a tuple), built once per county list"""
+    from eaglei.spatial import knn_weights
+    attrs = load_counties().loc[list(counties)]
+    return knn_weights(attrs['latitude'], attrs['longitude'], k)
+
+
+@cache_data
+def load_hotspots(fingerprint, _df, col, permutations=999):
+    """Global Moran's I plus per-county local Moran and Gi* for one map metric, cached per data fingerprint"""
+    from eaglei.spatial import getis_ord_star, moran_global, moran_local
+    w = load_weights(tuple(_df['county']))
+    x = _df[col].fillna(0).to_numpy(dtype='float64')
+    local = pd.concat([moran_local(x, w, permutations), getis_ord_star(x, w)], axis=1)
+    local.insert(0, 'county', _df['county'].to_numpy())
+    return moran_global(x, w, permutations), local
+
+
+def hotspot_stats(df, col):
+    return load_hotspots(frame_fingerprint(df[['county', col]]), df[['county', col]].reset_index(drop=True), col)
+
+
+@cache_resource
+def load_payload_cache():
+    """Figure/payload LRU shared by every session of this server process"""
+    return payload_cache()
+
+
+def page_payload(page, state, fingerprint, build):
+    """Figures and results of one page view, rebuilt only when the page, its widget state or its data change"""
+    built = []
+
+    def timed_build():
+        built.append(True)
+        with timed('figure', page):
+            return build()
+
+    cache = load_payload_cache()
+    payload = cached_payload(cache, payload_key(page, state, fingerprint), timed_build)
+    label = f'payload:{page}'
+    count('cache_calls', cache=label)
+    if built:
+        count('cache_misses', cache=label)
+    set_gauge('payload_cache_bytes', cache.stats['bytes'])
+    set_gauge('payload_cache_entries', len(cache.entries))
+    return payload
+
+
+def outage_version():
+    """Fingerprint of the outage aggregates: the base data plus every batch appended onto it"""
+    meta = load_live().meta
+    return meta['base'], tuple(meta['batches'])
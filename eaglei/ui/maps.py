@@ -0,0 +1,37 @@
+"""Plotly map figures of county metrics and of the binned outage cells, with their legend statistics."""
+
+import numpy as np
+import plotly.express as px
+import plotly.graph_objects as go
+
+from eaglei.metrics import timed
+from eaglei.tiles import legend_stats, view_cells
+
+HOTSPOT_COLORS = {'Hot spot (99%)': '#b91c1c', 'Hot spot (95%)': '#f87171', 'Cold spot (95%)': '#93c5fd', 'Cold spot (99%)': '#1d4ed8'}
+
+
+@timed('figure', 'create_map_with_legend')
+def create_map_with_legend(df, col, title, hotspots=None):
+    df = df.copy()
+    df['size'] = np.log10(df['population'] + 1) * 5
+    fig = px.scatter_mapbox(df, lat='latitude', lon='longitude', size='size', color=col, hover_name='county', hover_data={col: ':.2f', 'population': ':,', 'size': False, 'latitude': False, 'longitude': False}, zoom=5, center={'lat': 37.5, 'lon': -119.5}, height=480, color_continuous_scale='YlOrRd', title=title)
+    fig.update_layout(mapbox_style='carto-positron', margin=dict(l=0, r=0, t=40, b=0), coloraxis_colorbar=dict(title=col.replace('_', ' ').title(), len=0.7))
+    if hotspots is not None:
+        # Gi* hot/cold spots as an overlay: one trace per class so each gets a legend entry
+        spots = df.merge(hotspots[['county', 'hotspot', 'gi_z']], on='county')
+        for label, color in HOTSPOT_COLORS.items():
+            sel = spots[spots['hotspot'] == label]
+            if len(sel):
+                fig.add_trace(go.Scattermapbox(lat=sel['latitude'], lon=sel['longitude'], mode='markers', name=label, marker=dict(size=sel['size'] + 10, color=color, opacity=0.45), text=sel['county'], customdata=sel['gi_z'], hovertemplate='%{text}<br>Gi* z = %{customdata:.2f}<extra>' + label + '</extra>'))
+        fig.update_layout(legend=dict(orientation='h', y=-0.02))
+    return fig, legend_stats(df[col])
+
+
+@timed('figure', 'create_binned_map')
+def create_binned_map(pyramid, col, title, zoom, center):
+    """Map of the binned outage cells in view; the legend quartiles come from the same cell values that are drawn"""
+    cells = view_cells(pyramid, zoom, center)
+    cells['size'] = np.log10(cells['events'] + 1) * 4 + 4
+    fig = px.scatter_mapbox(cells, lat='latitude', lon='longitude', size='size', size_max=14, color=col, hover_data={'events': ':,', 'customers': ':,', 'avg_duration': ':.2f', 'size': False, 'latitude': False, 'longitude': False}, zoom=zoom, center=center, height=480, color_continuous_scale='YlOrRd', title=f'{title} ({len(cells):,} cells)')
+    fig.update_layout(mapbox_style='carto-positron', margin=dict(l=0, r=0, t=40, b=0), coloraxis_colorbar=dict(title=col.replace('_', ' ').title(), len=0.7))
+    return fig, legend_stats(cells[col])
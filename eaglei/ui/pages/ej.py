@@ -0,0 +1,32 @@
+"""Environmental Justice page: county EJ indicator map with the optional hotspot layer."""
+
+import plotly.express as px
+import streamlit as st
+
+from eaglei.cache import frame_fingerprint
+from eaglei.ui.data import hotspot_stats, load_ej, page_payload
+from eaglei.ui.maps import create_map_with_legend
+from eaglei.ui.widgets import display_legend, display_moran
+
+
+def render():
+    st.markdown('<div class="hero-header"><div class="brand-logo" style="font-size:1.8rem;">⚖️ Environmental Justice</div></div>', unsafe_allow_html=True)
+    ej = load_ej()
+    c1, c2, c3, c4 = st.columns(4)
+    c1.metric("Counties", len(ej))
+    c2.metric("Avg SVI", f"{ej['svi_score'].mean():.3f}")
+    c3.metric("High Risk", len(ej[ej['svi_score'] >= 0.5]))
+    c4.metric("Avg PM2.5", f"{ej['pm25'].mean():.1f}")
+    metric = st.selectbox("EJ Metric", ["composite_ej", "svi_score", "ces_score", "fire_risk", "pm25"])
+    show_hotspots = st.checkbox("🔥 Hotspot layer (Getis-Ord Gi*)", key='ej_hotspots')
+    col1, col2 = st.columns([3, 1])
+    fp = frame_fingerprint(ej)
+    moran, local = hotspot_stats(ej, metric) if show_hotspots else (None, None)
+    fig, stats = page_payload('ej/map', {'metric': metric, 'hotspots': show_hotspots}, fp, lambda: create_map_with_legend(ej, metric, f'{metric.replace("_", " ").title()}', local))
+    col1.plotly_chart(fig, use_container_width=True)
+    with col2:
+        display_legend(stats, metric.replace('_', ' ').title())
+        if moran: display_moran(moran)
+    if show_hotspots:
+        st.dataframe(local[local['hotspot'] != 'Not significant'].sort_values('gi_z', ascending=False), use_container_width=True, hide_index=True)
+    st.plotly_chart(page_payload('ej/correlations', {}, fp, lambda: px.imshow(ej[['svi_score', 'ces_score', 'fire_risk', 'pm25', 'event_count']].corr(), text_auto='.2f', color_continuous_scale='RdBu_r', title='EJ Correlations')), use_container_width=True)
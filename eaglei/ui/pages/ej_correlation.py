@@ -0,0 +1,47 @@
+"""EJ Correlation page: SVI/EJ x outage correlations with bootstrap CIs and permutation p-values."""
+
+import plotly.express as px
+import streamlit as st
+
+from eaglei.cache import frame_fingerprint
+from eaglei.ui.data import load_correlation_tests, load_county_customers, load_ej, load_tract_ej, page_payload
+
+
+def render():
+    st.markdown('<div class="hero-header"><div class="brand-logo" style="font-size:1.8rem;">🔗 EJ × Outage Correlation</div></div>', unsafe_allow_html=True)
+    tracts_ej = load_tract_ej()
+    level = st.radio("Resolution", ["County", "Census tract"], horizontal=True) if tracts_ej is not None else "County"
+    if level == "County":
+        ej = load_ej()
+        customers = load_county_customers()
+        customers = customers[customers['Year'] == customers['Year'].max()].set_index('county')['customers'] if len(customers) else None
+        per = st.radio("Outage rate per 1,000", ["Utility customers", "Residents"], horizontal=True, help="Utility customers: EIA-861 customers allocated to counties through the utility x county crosswalk (latest year)") if customers is not None else "Residents"
+        if per == "Residents":
+            ej['outage_rate'] = (ej['event_count'] / ej['population']) * 1000
+        else:
+            ej['eia_customers'] = customers.reindex(ej['county']).to_numpy()
+            ej['outage_rate'] = (ej['event_count'] / ej['eia_customers'].where(ej['eia_customers'] > 0)) * 1000
+    else:
+        ej = tracts_ej.dropna(subset=['svi_score', 'outage_rate'])
+    cols = ['svi_score', 'ces_score', 'pm25', 'fire_risk', 'outage_rate', 'event_count']
+    tests = load_correlation_tests(frame_fingerprint(ej[cols]), ej[cols])
+    pairs = tests.set_index(['var1', 'var2'])
+    svi, pm = pairs.loc[('svi_score', 'outage_rate')], pairs.loc[('pm25', 'event_count')]
+    corr = svi['r']
+    c1, c2, c3 = st.columns(3)
+    c1.metric("SVI-Outage r", f"{corr:.3f}", f"95% CI {svi['ci_low']:.2f} to {svi['ci_high']:.2f}", delta_color='off')
+    c2.metric("PM2.5-Events r", f"{pm['r']:.3f}", f"95% CI {pm['ci_low']:.2f} to {pm['ci_high']:.2f}", delta_color='off')
+    c3.metric("Total Events", f"{ej['event_count'].sum():,.0f}")
+    evidence = f"r = {corr:.3f}, 95% CI [{svi['ci_low']:.2f}, {svi['ci_high']:.2f}], permutation p = {svi['p_value']:.4f}, n = {int(svi['n']):,}"
+    if corr > 0.15 and svi['ci_low'] > 0 and svi['p_value'] < 0.05: st.markdown(f'<div class="warning-box"><b>⚠️ DISPARITY DETECTED</b><br>{evidence}</div>', unsafe_allow_html=True)
+    elif corr > 0.15: st.markdown(f'<div class="success-box"><b>✓ No statistically significant disparity</b><br>{evidence}</div>', unsafe_allow_html=True)
+    else: st.markdown(f'<div class="success-box"><b>✓ No major disparity</b><br>{evidence}</div>', unsafe_allow_html=True)
+    def correlation_figures():
+        return (px.scatter(ej, x='svi_score', y='outage_rate', size='population', hover_name='county' if level == "County" else 'geoid', hover_data=None if level == "County" else ['county'], trendline='ols', title='SVI vs Outage Rate').update_layout(plot_bgcolor='white'),
+                px.imshow(ej[cols].corr(), text_auto='.2f', color_continuous_scale='RdBu_r', title='Full Correlation Matrix'))
+    fig_scatter, fig_corr = page_payload('ej_correlation/figures', {'level': level, 'per': per if level == "County" else None}, frame_fingerprint(ej), correlation_figures)
+    c1, c2 = st.columns(2)
+    c1.plotly_chart(fig_scatter, use_container_width=True)
+    c2.plotly_chart(fig_corr, use_container_width=True)
+    st.markdown("#### 📐 Significance (10,000 bootstrap resamples / permutations)")
+    st.dataframe(tests.style.format({'r': '{:.3f}', 'ci_low': '{:.3f}', 'ci_high': '{:.3f}', 'p_value': '{:.4f}'}), use_container_width=True, hide_index=True)
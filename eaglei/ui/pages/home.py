@@ -0,0 +1,15 @@
+"""Landing page: headline figures and the research team."""
+
+import streamlit as st
+
+
+def render():
+    st.markdown('<div class="hero-header"><span class="real-data-badge">✅ 159,605 RECORDS</span><div class="brand-logo" style="margin-top:1rem;">⚡ EAGLE-I v3.1</div><div style="color:#e0e1dd;">Enhanced Analytics | California 2014-2023</div></div>', unsafe_allow_html=True)
+    c1, c2, c3, c4, c5 = st.columns(5)
+    c1.markdown('<div class="metric-card"><div class="metric-value">159,605</div><div class="metric-label">Events</div></div>', unsafe_allow_html=True)
+    c2.markdown('<div class="metric-card"><div class="metric-value">329.8M</div><div class="metric-label">Customers</div></div>', unsafe_allow_html=True)
+    c3.markdown('<div class="metric-card"><div class="metric-value">58</div><div class="metric-label">Counties</div></div>', unsafe_allow_html=True)
+    c4.markdown('<div class="metric-card"><div class="metric-value">5</div><div class="metric-label">Event Types</div></div>', unsafe_allow_html=True)
+    c5.markdown('<div class="metric-card"><div class="metric-value">10 yrs</div><div class="metric-label">2014-2023</div></div>', unsafe_allow_html=True)
+    st.markdown("### 🆕 v3.1 Features: Map Legends | Query Function | Sector Analysis | Event Types | Missingness Analysis")
+    st.markdown("### 👥 Research Team\n**Victoria Love Franklin¹²*** | **Dr. Sajid Hussain¹** | **Dr. Lei Qian¹**\n\n*¹Meharry Medical College | ²DoE SRNL*")
@@ -0,0 +1,143 @@
+"""EAGLE-I Outages page: outage trends, the county/binned map and batch appends."""
+
+import os
+import tempfile
+
+import plotly.express as px
+import streamlit as st
+
+from eaglei.cube import rollup
+from eaglei.forecast import forecast
+from eaglei.live import watermark_time
+from eaglei.report import forecast_bar
+from eaglei.reliability import group_reliability, rolling, window
+from eaglei.ui import is_admin
+from eaglei.ui.data import append_eaglei_batch, hotspot_stats, load_counties, load_cube, load_eia861, load_forecasts, load_live, load_outage_table, load_point_tiles, load_reliability, outage_version, page_payload
+from eaglei.ui.maps import create_binned_map, create_map_with_legend
+from eaglei.ui.widgets import display_legend, display_moran, export_download
+
+
+# Map metric -> tile pyramid cell measure
+CELL_METRICS = {'event_count': 'events', 'total_customers': 'customers', 'avg_duration': 'avg_duration'}
+
+RELIABILITY_LEVELS = {"County": 'county', "Region": 'region', "Utility": 'utility'}
+
+
+def reliability_tab(version):
+    rel = load_reliability(version)
+    months = [str(p) for p in rel.periods]
+    if not months:
+        st.info("No outage months to compute reliability over")
+        return
+    c1, c2 = st.columns([3, 1])
+    start, end = c1.select_slider("Months", months, value=(months[max(0, len(months) - 12)], months[-1]))
+    level = c2.radio("Level", list(RELIABILITY_LEVELS), horizontal=True)
+    rel = load_reliability(version, RELIABILITY_LEVELS[level])
+    table = window(rel, start, end)
+    if level == "Utility":
+        names = load_eia861().drop_duplicates('Utility_Number', keep='last').set_index('Utility_Number')['Utility_Name_x']
+        table.insert(1, 'utility_name', names.reindex(table['utility']).to_numpy())
+    state = window(group_reliability(rel, ['California'] * len(rel.labels), 'state'), start, end).iloc[0]
+    c1, c2, c3, c4 = st.columns(4)
+    c1.metric("SAIDI", f"{state['saidi']:,.1f} min")
+    c2.metric("SAIFI", f"{state['saifi']:.2f}")
+    c3.metric("CAIDI", f"{state['caidi']:,.1f} min")
+    c4.metric("Customer-Minutes", f"{state['cmi']/1e6:,.1f}M")
+    def rolling_figure():
+        county = load_reliability(version)
+        statewide = rolling(group_reliability(county, ['California'] * len(county.labels), 'state'), 12)
+        by_region = rolling(load_reliability(version, 'region'), 12)
+        frame = by_region.join(statewide).reset_index().melt(id_vars='end', var_name='area', value_name='saidi')
+        frame['end'] = frame['end'].astype('datetime64[ns]')
+        return px.line(frame, x='end', y='saidi', color='area', title='Rolling 12-Month SAIDI (minutes)').update_layout(plot_bgcolor='white')
+    st.plotly_chart(page_payload('outages/reliability', {}, version, rolling_figure), use_container_width=True)
+    st.dataframe(table.sort_values('saidi', ascending=False).style.format({'events': '{:,.0f}', 'customers_interrupted': '{:,.0f}', 'cmi': '{:,.0f}', 'customers_served': '{:,.0f}', 'saidi': '{:.1f}', 'saifi': '{:.3f}', 'caidi': '{:.1f}'}),
+                 use_container_width=True, hide_index=True, height=360)
+    st.caption("Customer-minutes are customers × mean duration per county, month and event type; customers served are EIA-861 customers allocated to counties. Utilities get their customer share of each county's interruptions.")
+
+
+def render():
+    st.markdown('<div class="hero-header"><span class="real-data-badge">✅ REAL DATA</span><div class="brand-logo" style="font-size:1.8rem;">📊 EAGLE-I Outages</div></div>', unsafe_allow_html=True)
+    df, cube, version = load_outage_table(), load_cube(), outage_version()
+    c1, c2, c3, c4 = st.columns(4)
+    c1.metric("Events", f"{rollup(cube, 'events'):,.0f}")
+    c2.metric("Customers", f"{rollup(cube, 'customers')/1e6:.1f}M")
+    c3.metric("Avg Duration", f"{df['avg_duration'].mean():.1f} hrs")
+    c4.metric("Counties", len(df))
+    tab1, tab2, tab3 = st.tabs(["📈 Trends", "🗺️ Map", "⏱️ Reliability"])
+    with tab1:
+        horizon = st.select_slider("Forecast years", [0, 1, 2, 3], value=3, help="Quasi-Poisson trend fitted to every county x event-type series (recent years weighted most); 90% bands")
+        def trend_figures():
+            yearly = rollup(cube, 'events', 'year').round().astype(int).reset_index()
+            top = rollup(cube, 'events', 'county').nlargest(10).round().astype(int).rename('event_count').reset_index()
+            fig_yearly = px.bar(yearly, x='year', y='events', title='Outages by Year', text='events', color_discrete_sequence=['#00d4ff']).update_layout(plot_bgcolor='white')
+            if horizon:
+                fig_yearly.add_trace(forecast_bar(forecast(load_forecasts(version), horizon), 'events'))
+            return (fig_yearly,
+                    px.bar(top, x='event_count', y='county', orientation='h', title='Top 10 Counties', color_discrete_sequence=['#8b5cf6']).update_layout(yaxis={'categoryorder': 'total ascending'}, plot_bgcolor='white'))
+        fig_yearly, fig_top = page_payload('outages/trends', {'horizon': horizon}, version, trend_figures)
+        c1, c2 = st.columns(2)
+        c1.plotly_chart(fig_yearly, use_container_width=True)
+        c2.plotly_chart(fig_top, use_container_width=True)
+    with tab2:
+        metric = st.selectbox("Map Metric", ['event_count', 'total_customers', 'avg_duration', 'saidi', 'saifi', 'caidi'], help="SAIDI/SAIFI are yearly averages per EIA-861 customer served; CAIDI is minutes per customer interrupted")
+        tiles = load_point_tiles()
+        # Reliability indices need customers served, which only exist per county
+        layer = st.radio("Map Layer", ["Counties", "Outage points (binned)"], horizontal=True) if tiles and metric in CELL_METRICS else "Counties"
+        view = {'metric': metric, 'layer': layer}
+        if layer == "Counties":
+            show_hotspots = st.checkbox("🔥 Hotspot layer (Getis-Ord Gi*)", key='outage_hotspots')
+            view['hotspots'] = show_hotspots
+        else:
+            # Points are pre-binned per zoom level; only the cells inside the chosen view are sent
+            counties = load_counties()
+            f1, f2 = st.columns(2)
+            focus = f1.selectbox("Focus", ["All California"] + sorted(counties['region'].unique()) + list(counties.index))
+            zoom = f2.slider("Zoom", 5, 12, 5 if focus == "All California" else 7 if focus in set(counties['region']) else 9)
+            area = counties if focus == "All California" else counties[(counties['region'] == focus) | (counties.index == focus)]
+            center = {'lat': 37.5, 'lon': -119.5} if focus == "All California" else {'lat': area['latitude'].mean(), 'lon': area['longitude'].mean()}
+            show_hotspots = False
+            view.update(focus=focus, zoom=zoom)
+        col1, col2 = st.columns([3, 1])
+        moran, local = hotspot_stats(df, metric) if show_hotspots else (None, None)
+        if layer == "Counties":
+            fig, stats = page_payload('outages/map', view, version, lambda: create_map_with_legend(df, metric, f'{metric.replace("_", " ").title()}', local))
+        else:
+            cell_metric = CELL_METRICS[metric]
+            fig, stats = page_payload('outages/map', view, version, lambda: create_binned_map(tiles, cell_metric, f'{metric.replace("_", " ").title()} per map cell', zoom, center))
+        col1.plotly_chart(fig, use_container_width=True)
+        with col2:
+            display_legend(stats, metric.replace('_', ' ').title())
+            if moran: display_moran(moran)
+    with tab3:
+        reliability_tab(version)
+    export_download("📥 Download Data", df, "eagle_i_data", 'outages/export', {}, version)
+    if is_admin():
+        append_expander()
+
+
+def append_expander():
+    # Appends change the shared live aggregates of every session, so only admin sessions see this
+    with st.expander("➕ Append EAGLE-I Batch"):
+        live = load_live()
+        wm = watermark_time(live)
+        st.caption(f"{len(live.meta['batches'])} batches appended" + (f" | data through {wm:%Y-%m-%d %H:%M}" if wm is not None else ""))
+        if 'append_message' in st.session_state:
+            st.success(st.session_state.pop('append_message'))
+        upload = st.file_uploader("New eaglei_transformed.csv rows", type='csv')
+        if upload is not None and upload.file_id != st.session_state.get('appended_upload'):
+            # One temp file per upload, so concurrent sessions never share (or delete) each other's input
+            os.makedirs(live.cache_dir, exist_ok=True)
+            with tempfile.NamedTemporaryFile(dir=live.cache_dir, suffix='.csv', delete=False) as f:
+                f.write(upload.getbuffer())
+            try:
+                delta = append_eaglei_batch(f.name)
+            except (KeyError, TypeError, ValueError) as e:
+                # Missing canonical columns, unparseable values, ...; nothing was applied
+                st.error(f"Could not append this batch: {e}")
+                return
+            finally:
+                os.remove(f.name)
+            st.session_state['appended_upload'] = upload.file_id
+            st.session_state['append_message'] = f"Appended {int(delta['events'].sum()):,} new events" if len(delta) else "Nothing new in this batch (already applied)"
+            st.rerun()
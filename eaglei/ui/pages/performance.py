@@ -0,0 +1,72 @@
+"""Performance page (admin only): stage timings, cache hit rates and memory from eaglei.metrics."""
+
+import time
+
+import pandas as pd
+import streamlit as st
+
+from eaglei.metrics import BUCKETS, METRICS_FILE, peak_rss_bytes, prometheus_text, reset, rss_bytes, snapshot
+
+
+def _quantile_bound(row, q):
+    # Upper bound of the histogram bucket holding quantile q (inf in the overflow bucket)
+    target, seen = q * row[0], 0
+    for bound, n in zip(BUCKETS + (float('inf'),), row[3:]):
+        seen += n
+        if seen >= target:
+            return bound
+    return float('inf')
+
+
+def timing_table(timings):
+    """One row per (stage, name): calls, total seconds, mean, p95 bucket bound and max in ms."""
+    rows = [{'stage': stage, 'name': name, 'calls': row[0], 'total_s': row[1], 'mean_ms': row[1] / row[0] * 1e3,
+             'p95_ms_le': _quantile_bound(row, 0.95) * 1e3, 'max_ms': row[2] * 1e3} for (stage, name), row in timings.items() if row[0]]
+    return pd.DataFrame(rows, columns=['stage', 'name', 'calls', 'total_s', 'mean_ms', 'p95_ms_le', 'max_ms']).sort_values('total_s', ascending=False, ignore_index=True)
+
+
+def cache_table(counters):
+    """One row per cache (st.cache_* loaders and payload:<page> entries): calls, misses, hits and hit rate."""
+    calls, misses = {}, {}
+    for (metric, labels), value in counters.items():
+        target = {'cache_calls': calls, 'cache_misses': misses}.get(metric)
+        if target is not None:
+            target[dict(labels)['cache']] = value
+    df = pd.DataFrame({'calls': pd.Series(calls, dtype='int64'), 'misses': pd.Series(misses, dtype='int64')}).fillna(0).astype('int64').rename_axis('cache')
+    df['hits'] = df['calls'] - df['misses']
+    df['hit_rate'] = (df['hits'] / df['calls'].where(df['calls'] > 0)).round(3)
+    return df.sort_values('calls', ascending=False).reset_index()
+
+
+def render():
+    st.markdown('<div class="hero-header"><div class="brand-logo" style="font-size:1.8rem;">⏱️ Performance</div><div style="color:#e0e1dd;">Hot-path timings, cache hit rates and memory of this server process</div></div>', unsafe_allow_html=True)
+    timings, counters, gauges, started = snapshot()
+    timing, caches = timing_table(timings), cache_table(counters)
+    calls = caches['calls'].sum()
+    c1, c2, c3, c4, c5 = st.columns(5)
+    c1.metric("RSS", f"{rss_bytes() / 2 ** 20:,.0f} MB")
+    c2.metric("Peak RSS", f"{peak_rss_bytes() / 2 ** 20:,.0f} MB")
+    c3.metric("Cache Hit Rate", f"{caches['hits'].sum() / calls * 100:.1f}%" if calls else "–")
+    c4.metric("Payload Cache", f"{gauges.get(('payload_cache_bytes', ()), 0) / 2 ** 20:,.1f} MB", f"{gauges.get(('payload_cache_entries', ()), 0)} entries", delta_color='off')
+    c5.metric("Since", time.strftime('%H:%M:%S', time.localtime(started)), f"{(time.time() - started) / 60:,.0f} min", delta_color='off')
+    tab1, tab2, tab3 = st.tabs(["⏱️ Timings", "🗄️ Caches", "📤 Prometheus"])
+    with tab1:
+        stage = st.selectbox("Stage", ["All"] + sorted(timing['stage'].unique()), help="cache: cached loader calls (hits included) | load: loader work on a miss | query | figure | render: whole page")
+        shown = timing if stage == "All" else timing[timing['stage'] == stage]
+        if len(shown):
+            st.bar_chart(shown.head(15).set_index('name')['total_s'], horizontal=True)
+        st.dataframe(shown.style.format({'total_s': '{:.3f}', 'mean_ms': '{:.1f}', 'p95_ms_le': '{:g}', 'max_ms': '{:.1f}'}), use_container_width=True, hide_index=True)
+    with tab2:
+        st.dataframe(caches, use_container_width=True, hide_index=True)
+        pages = {labels: v for (m, labels), v in gauges.items() if m == 'page_rss_bytes'}
+        if pages:
+            st.markdown("#### 🧠 RSS after the last render of each page")
+            st.dataframe(pd.DataFrame([{'page': dict(k)['page'], 'rss_mb': v / 2 ** 20} for k, v in pages.items()]).round(1), use_container_width=True, hide_index=True)
+    with tab3:
+        text = prometheus_text()
+        st.caption(f"Written to `{METRICS_FILE}` after every page render (set `EAGLEI_METRICS_FILE` to move it)")
+        st.download_button("📥 Download metrics.prom", text, "metrics.prom", mime="text/plain")
+        st.code(text, language=None)
+    if st.button("🔄 Reset Metrics"):
+        reset()
+        st.rerun()
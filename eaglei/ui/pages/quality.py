@@ -0,0 +1,55 @@
+"""Data Quality page: column profiles of the outage and EJ tables and of the raw source files."""
+
+import plotly.express as px
+import streamlit as st
+
+from eaglei.cache import frame_fingerprint
+from eaglei.quality import SOURCE_PROFILES, analyze_missingness, profile_report
+from eaglei.ui.data import load_data, load_ej, load_source_profile, page_payload, source_files
+
+
+def completeness_chart(report):
+    return px.bar(report.sort_values('Completeness'), x='Completeness', y='Column', orientation='h', title='Column Completeness', color='Completeness', color_continuous_scale=['#ef4444', '#f59e0b', '#22c55e']).update_layout(plot_bgcolor='white')
+
+
+def missingness_payload(df):
+    report, score = analyze_missingness(df)
+    return report, score, completeness_chart(report)
+
+
+def render():
+    st.markdown('<div class="hero-header"><div class="brand-logo" style="font-size:1.8rem;">📉 Data Quality & Missingness</div></div>', unsafe_allow_html=True)
+    df, ej = load_data(), load_ej()
+    tab1, tab2, tab3 = st.tabs(["Outage Data", "EJ Data", "Raw Sources"])
+    with tab1:
+        report, score, fig = page_payload('quality/outage', {}, frame_fingerprint(df), lambda: missingness_payload(df))
+        c1, c2, c3 = st.columns(3)
+        c1.metric("Completeness", f"{score:.1f}%")
+        c2.metric("Columns", len(df.columns))
+        c3.metric("Records", len(df))
+        st.plotly_chart(fig, use_container_width=True)
+        st.dataframe(report, use_container_width=True)
+    with tab2:
+        report, score, fig = page_payload('quality/ej', {}, frame_fingerprint(ej), lambda: missingness_payload(ej))
+        c1, c2, c3 = st.columns(3)
+        c1.metric("Completeness", f"{score:.1f}%")
+        c2.metric("Columns", len(ej.columns))
+        c3.metric("Records", len(ej))
+        st.plotly_chart(fig, use_container_width=True)
+        st.dataframe(report, use_container_width=True)
+    with tab3:
+        present = {name: files for name, files in ((name, source_files(name)) for name in SOURCE_PROFILES) if files}
+        if not present:
+            st.info("No raw source files found next to the app")
+            return
+        name = st.selectbox("Source", list(present), help="Profiled in chunks straight from the CSV files, so memory stays bounded at any size")
+        files = present[name]
+        profile = load_source_profile(name, files)
+        report, score = profile_report(profile)
+        c1, c2, c3, c4 = st.columns(4)
+        c1.metric("Completeness", f"{score:.1f}%", help="Share of cells neither null nor a sentinel value")
+        c2.metric("Records", f"{profile.rows:,}")
+        c3.metric("Duplicate Keys", f"{profile.duplicates:,}", help="Rows repeating " + " + ".join(SOURCE_PROFILES[name]['key']))
+        c4.metric("Files", len(files), f"{sum(size for _, size, _ in files) / 2 ** 20:,.1f} MB", delta_color='off')
+        st.plotly_chart(completeness_chart(report), use_container_width=True)
+        st.dataframe(report, use_container_width=True, hide_index=True)
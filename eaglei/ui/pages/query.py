@@ -0,0 +1,109 @@
+"""Query & Explore page: natural-language queries over the county, EJ and event data."""
+
+import numpy as np
+import streamlit as st
+
+from eaglei.events import event_plan, query_events
+from eaglei.exports import plan_key
+from eaglei.query import query_data, query_ej_data, query_plan
+from eaglei.ui.data import load_ej, load_event_store, load_outage_table, outage_version
+from eaglei.ui.maps import create_map_with_legend
+from eaglei.ui.widgets import display_legend, export_download
+
+
+def render():
+    st.markdown('<div class="hero-header"><div class="brand-logo" style="font-size:1.8rem;">🔍 Query & Explore</div><div style="color:#e0e1dd;">Natural Language Data Query Engine</div></div>', unsafe_allow_html=True)
+    df = load_outage_table()
+    ej = load_ej()
+    
+    st.markdown("""
+    <div style="background:linear-gradient(135deg,#f0f9ff,#e0f2fe);border:2px solid #0ea5e9;border-radius:15px;padding:1.5rem;margin-bottom:1rem;">
+    <h4 style="margin:0 0 1rem 0;">💡 Query Examples</h4>
+    <table style="width:100%;font-size:0.9rem;">
+    <tr><td><b>📊 Rankings:</b></td><td><code>top 10 by events</code> | <code>bottom 5 by duration</code> | <code>top 15 PSPS</code></td></tr>
+    <tr><td><b>🔢 Comparisons:</b></td><td><code>more than 5000 events</code> | <code>less than 3 hours duration</code> | <code>between 1000 and 5000 events</code></td></tr>
+    <tr><td><b>🗺️ Regions:</b></td><td><code>Bay Area</code> | <code>Central Valley</code> | <code>Southern California</code> | <code>Sierra</code></td></tr>
+    <tr><td><b>⚡ Event Types:</b></td><td><code>top 10 weather events</code> | <code>top 5 equipment failures</code> | <code>PSPS counties</code></td></tr>
+    <tr><td><b>🏭 Sectors:</b></td><td><code>high industrial</code> | <code>rural counties</code> | <code>urban counties</code></td></tr>
+    <tr><td><b>📍 Counties:</b></td><td><code>Los Angeles</code> | <code>show Fresno</code> | <code>compare Riverside vs San Diego</code></td></tr>
+    <tr><td><b>⏱️ Reliability:</b></td><td><code>top 10 by saidi</code> | <code>Sierra with saifi more than 2</code> | <code>lowest caidi</code></td></tr>
+    <tr><td><b>📈 Statistics:</b></td><td><code>summary</code> | <code>total events</code> | <code>average duration</code></td></tr>
+    <tr><td><b>⏱️ Outage Events:</b></td><td><code>PSPS events in Butte longer than 12 hours in 2019</code> | <code>top 20 weather events by customers since 2018</code></td></tr>
+    </table>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    col1, col2 = st.columns([3, 1])
+    with col1:
+        query = st.text_input("🔎 Enter your query:", placeholder="e.g., top 10 counties with more than 3000 PSPS events")
+    with col2:
+        data_source = st.selectbox("Data Source", ["Outage Data", "EJ Data", "Outage Events"])
+    
+    if query:
+        if data_source == "Outage Events":
+            store = load_event_store()
+            plan = event_plan(store, query)
+            results, explanation = query_events(store, query, plan)
+        elif data_source == "EJ Data":
+            plan = query_plan(ej, query)
+            results, explanation = query_ej_data(ej, query, plan)
+        else:
+            plan = query_plan(df, query)
+            results, explanation = query_data(df, query, plan)
+        
+        st.markdown(f'<div class="success-box"><b>📊 {explanation}</b> — {len(results)} result(s)</div>', unsafe_allow_html=True)
+        
+        # Show results
+        if len(results) > 0:
+            # Display statistics for the results
+            if 'event_count' in results.columns and len(results) > 1:
+                c1, c2, c3, c4 = st.columns(4)
+                c1.metric("Total Events", f"{results['event_count'].sum():,}")
+                c2.metric("Avg Duration", f"{results['avg_duration'].mean():.2f} hrs")
+                c3.metric("Counties", len(results))
+                if 'population' in results.columns:
+                    c4.metric("Total Population", f"{results['population'].sum():,}")
+            elif 'duration_hours' in results.columns and len(results) > 1:
+                c1, c2, c3, c4 = st.columns(4)
+                c1.metric("Events", f"{len(results):,}")
+                c2.metric("Customers", f"{results['customers'].sum():,}")
+                c3.metric("Avg Duration", f"{results['duration_hours'].mean():.2f} hrs")
+                c4.metric("Counties", results['county'].nunique())
+            
+            # Data table
+            st.dataframe(results, use_container_width=True, height=350)
+            
+            # Map visualization for geographic results
+            if len(results) <= 30 and 'latitude' in results.columns:
+                st.markdown("### 🗺️ Query Results Map")
+                color_col = next((c for c in ['event_count', 'customers'] if c in results.columns), results.select_dtypes(include=[np.number]).columns[0])
+                fig, stats = create_map_with_legend(results, color_col, f"Map: {explanation}")
+                col1, col2 = st.columns([3, 1])
+                col1.plotly_chart(fig, use_container_width=True)
+                with col2:
+                    display_legend(stats, color_col.replace('_', ' ').title())
+            
+            # Download button
+            export_download("📥 Download Query Results", results, "query_results", 'query/export', {'source': data_source, 'plan': plan_key(plan)}, outage_version())
+        else:
+            st.warning("⚠️ No results found. Try a different query or check spelling.")
+    
+    # Quick query buttons
+    st.markdown("### ⚡ Quick Queries")
+    qc1, qc2, qc3, qc4 = st.columns(4)
+    with qc1:
+        if st.button("🔝 Top 10 Events"):
+            st.session_state['quick_query'] = "top 10 by events"
+            st.rerun()
+    with qc2:
+        if st.button("🔥 PSPS Leaders"):
+            st.session_state['quick_query'] = "top 10 PSPS"
+            st.rerun()
+    with qc3:
+        if st.button("🏙️ Bay Area"):
+            st.session_state['quick_query'] = "Bay Area"
+            st.rerun()
+    with qc4:
+        if st.button("🏭 High Industrial"):
+            st.session_state['quick_query'] = "high industrial"
+            st.rerun()
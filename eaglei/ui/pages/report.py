@@ -0,0 +1,22 @@
+"""Report page: the plain-text outage report for any scope."""
+
+import streamlit as st
+
+from eaglei.report import Scope, report_text, scope_slug
+from eaglei.ui.data import load_cube, load_forecasts, load_reliability, outage_version
+
+
+def render():
+    st.markdown('<div class="hero-header"><div class="brand-logo" style="font-size:1.8rem;">📋 AI Report</div></div>', unsafe_allow_html=True)
+    cube = load_cube()
+    c1, c2 = st.columns(2)
+    place = c1.selectbox("Scope", ["California"] + sorted(set(cube.groups['region'][1])) + list(cube.dims['county']))
+    year = c2.selectbox("Year", ['All years'] + cube.dims['year'].tolist(), key='report_year')
+    kind = 'state' if place == "California" else 'region' if place in set(cube.groups['region'][1]) else 'county'
+    scope = Scope(kind, None if kind == 'state' else place, None if year == 'All years' else year)
+    if st.button("🤖 Generate Report", type="primary"):
+        version = outage_version()
+        report = report_text(cube, scope, forecasts=load_forecasts(version), reliability=load_reliability(version))
+        st.code(report)
+        st.download_button("📥 Download", report, f"EAGLE_I_Report_{scope_slug(scope)}.txt")
+    st.caption("Reports for every region, county and year: `python -m eaglei.batch --out reports`")
@@ -0,0 +1,49 @@
+"""Scenarios page: simulated annual outage impacts under PSPS, wildfire and heat-storm stress cases."""
+
+import numpy as np
+import pandas as pd
+import plotly.express as px
+import streamlit as st
+
+from eaglei.scenarios import DURATION_SIGMA, HIGH_FIRE_RISK, impact_summary
+from eaglei.ui.data import load_simulation, outage_version, page_payload
+
+
+def distribution_frame(sim, measure, bins=60):
+    """Share of simulated years per bin of an annual measure, every scenario over the same bins."""
+    values = getattr(sim, measure)
+    edges = np.histogram_bin_edges(values, bins)
+    centers = (edges[:-1] + edges[1:]) / 2
+    shares = [np.histogram(v, edges)[0] / len(v) for v in values]
+    return pd.DataFrame({'scenario': np.repeat(sim.scenarios, len(centers)), measure: np.tile(centers, len(sim.scenarios)), 'share': np.concatenate(shares)})
+
+
+def render():
+    st.markdown('<div class="hero-header"><div class="brand-logo" style="font-size:1.8rem;">🎲 Resilience Scenarios</div><div style="color:#e0e1dd;">Monte Carlo outage years under stress cases</div></div>', unsafe_allow_html=True)
+    c1, c2 = st.columns(2)
+    years = c1.select_slider("Simulated years", [1_000, 10_000, 50_000, 100_000], value=10_000)
+    measure = c2.radio("Impact", ["customer_hours", "ej_customer_hours"], horizontal=True, format_func=lambda m: {'customer_hours': 'Customer-hours', 'ej_customer_hours': 'EJ-weighted customer-hours'}[m])
+    version = outage_version()
+    sim = load_simulation(version, years)
+    summary = impact_summary(sim)
+    base = summary.iloc[0]
+    cols = st.columns(len(summary))
+    for col, (_, row) in zip(cols, summary.iterrows()):
+        col.metric(row['scenario'], f"{row[measure]/1e6:,.1f}M", None if row['scenario'] == base['scenario'] else f"{(row[measure] / base[measure] - 1) * 100:+.1f}%")
+    st.caption(f"Per-county, per-type Poisson event rates and mean durations fitted from the outage cube; durations lognormal (σ = {DURATION_SIGMA}). "
+               f"High fire risk: fire_risk ≥ {HIGH_FIRE_RISK}. EJ weights are composite_ej scaled to mean 1.")
+
+    def scenario_figures():
+        dist = px.line(distribution_frame(sim, measure), x=measure, y='share', color='scenario', title=f'Annual {measure.replace("_", " ")} ({years:,} simulated years)').update_layout(plot_bgcolor='white')
+        added = pd.DataFrame(sim.county_customer_hours[1:] - sim.county_customer_hours[0], index=sim.scenarios[1:], columns=sim.counties)
+        top = added.T.sum(axis=1).nlargest(15).index
+        added = added[top].stack().rename('added_customer_hours').rename_axis(['scenario', 'county']).reset_index()
+        counties = px.bar(added, x='added_customer_hours', y='county', color='scenario', orientation='h', barmode='group', title='Added Customer-Hours per Year vs Baseline (top 15 counties)').update_layout(yaxis={'categoryorder': 'total ascending'}, plot_bgcolor='white', height=520)
+        return dist, counties
+
+    fig_dist, fig_counties = page_payload('scenarios/figures', {'years': years, 'measure': measure}, version, scenario_figures)
+    st.plotly_chart(fig_dist, use_container_width=True)
+    st.plotly_chart(fig_counties, use_container_width=True)
+    st.markdown("#### 📊 Annual Impact Distribution")
+    st.dataframe(summary.style.format({c: '{:,.0f}' for c in summary.columns if c != 'scenario'}), use_container_width=True, hide_index=True)
+    st.caption(f"Larger runs from the command line: `python -m eaglei.scenarios --years {years * 10} --workers 8`")
@@ -0,0 +1,58 @@
+"""Sector & Events page: customer sector mix and event-type breakdowns from the cube."""
+
+import pandas as pd
+import plotly.express as px
+import streamlit as st
+
+from eaglei.cube import SECTORS, rollup
+from eaglei.ui.data import load_cube, outage_version, page_payload
+
+
+def render():
+    st.markdown('<div class="hero-header"><div class="brand-logo" style="font-size:1.8rem;">📈 Sector & Event Analysis</div></div>', unsafe_allow_html=True)
+    cube = load_cube()
+    tab1, tab2 = st.tabs(["🏭 Sectors", "⚡ Event Types"])
+    with tab1:
+        year = st.selectbox("Year", ['All years'] + cube.dims['year'].tolist())
+        def sector_payload():
+            by_sector = rollup(cube, 'customers', ('county', 'sector'), {} if year == 'All years' else {'year': year})
+            res, com, ind = by_sector[SECTORS].sum()
+            industrial = (by_sector['industrial'] / by_sector.sum(axis=1)).nlargest(10).rename('industrial').reset_index()
+            return (by_sector.to_numpy().sum(), res, com, ind,
+                    px.pie(pd.DataFrame({'Sector': ['Residential', 'Commercial', 'Industrial'], 'Value': [res, com, ind]}), values='Value', names='Sector', title='Statewide Sector Mix', hole=0.4),
+                    px.bar(industrial, x='industrial', y='county', orientation='h', title='Top 10 Industrial Counties', color_discrete_sequence=['#f59e0b']).update_layout(yaxis={'categoryorder': 'total ascending'}, plot_bgcolor='white'))
+        total, res, com, ind, fig_mix, fig_industrial = page_payload('sectors/sectors', {'year': year}, outage_version(), sector_payload)
+        c1, c2, c3 = st.columns(3)
+        c1.metric("🏠 Residential", f"{res/1e6:.1f}M", f"{res/total*100:.1f}%")
+        c2.metric("🏢 Commercial", f"{com/1e6:.1f}M", f"{com/total*100:.1f}%")
+        c3.metric("🏭 Industrial", f"{ind/1e6:.1f}M", f"{ind/total*100:.1f}%")
+        c1, c2 = st.columns(2)
+        c1.plotly_chart(fig_mix, use_container_width=True)
+        c2.plotly_chart(fig_industrial, use_container_width=True)
+    with tab2:
+        def event_payload():
+            by_type = rollup(cube, 'events', 'event_type').round().astype(int)
+            events = {'Weather': by_type['weather'], 'Equipment': by_type['equipment'], 'PSPS': by_type['psps'], 'Vegetation': by_type['vegetation'], 'Unknown': by_type['unknown']}
+            psps = rollup(cube, 'events', 'county', {'event_type': 'psps'}).nlargest(10).round().astype(int).rename('psps').reset_index()
+            monthly = rollup(cube, 'events', ('month', 'event_type'), {'month': list(range(1, 13))})
+            fig_monthly = None
+            if monthly.to_numpy().sum() > 0:
+                monthly = monthly.stack().rename('events').reset_index()
+                fig_monthly = px.bar(monthly, x='month', y='events', color='event_type', title='Events by Month', color_discrete_sequence=['#3b82f6', '#22c55e', '#ef4444', '#8b5cf6', '#64748b']).update_layout(plot_bgcolor='white')
+            return (events,
+                    px.pie(pd.DataFrame([{'Type': k, 'Count': v} for k, v in events.items()]), values='Count', names='Type', title='Event Types', hole=0.4, color_discrete_sequence=['#3b82f6', '#22c55e', '#ef4444', '#8b5cf6', '#64748b']),
+                    px.bar(psps, x='psps', y='county', orientation='h', title='Top 10 PSPS Counties', color_discrete_sequence=['#ef4444']).update_layout(yaxis={'categoryorder': 'total ascending'}, plot_bgcolor='white'),
+                    fig_monthly)
+        events, fig_types, fig_psps, fig_monthly = page_payload('sectors/events', {}, outage_version(), event_payload)
+        total_ev = sum(events.values())
+        c1, c2, c3, c4, c5 = st.columns(5)
+        c1.metric("🌧️ Weather", f"{events['Weather']:,}", f"{events['Weather']/total_ev*100:.0f}%")
+        c2.metric("⚙️ Equipment", f"{events['Equipment']:,}", f"{events['Equipment']/total_ev*100:.0f}%")
+        c3.metric("🔥 PSPS", f"{events['PSPS']:,}", f"{events['PSPS']/total_ev*100:.0f}%")
+        c4.metric("🌲 Vegetation", f"{events['Vegetation']:,}", f"{events['Vegetation']/total_ev*100:.0f}%")
+        c5.metric("❓ Unknown", f"{events['Unknown']:,}", f"{events['Unknown']/total_ev*100:.0f}%")
+        c1, c2 = st.columns(2)
+        c1.plotly_chart(fig_types, use_container_width=True)
+        c2.plotly_chart(fig_psps, use_container_width=True)
+        if fig_monthly is not None:
+            st.plotly_chart(fig_monthly, use_container_width=True)
@@ -0,0 +1,8 @@
+"""Sources page: links to the upstream datasets."""
+
+import streamlit as st
+
+
+def render():
+    st.markdown('<div class="hero-header"><div class="brand-logo" style="font-size:1.8rem;">📥 Data Sources</div></div>', unsafe_allow_html=True)
+    st.markdown("### ⚡ Power: [EAGLE-I](https://eagle-i.doe.gov/) | [DOE-417](https://www.oe.netl.doe.gov/) | [EIA-861](https://www.eia.gov/electricity/data/eia861/)\n### ⚖️ EJ: [CalEnviroScreen](https://oehha.ca.gov/calenviroscreen) | [EPA EJScreen](https://www.epa.gov/ejscreen) | [CDC SVI](https://www.atsdr.cdc.gov/placeandhealth/svi/)\n### 🌫️ Air: [EPA AQS](https://aqs.epa.gov/aqsweb/documents/data_api.html) | [AirNow](https://www.airnow.gov/)")
@@ -0,0 +1,55 @@
+"""DOE-417 Timeline page: major disturbance reports over time and the EAGLE-I outages overlapping them."""
+
+import numpy as np
+import pandas as pd
+import plotly.express as px
+import streamlit as st
+
+from eaglei.cache import frame_fingerprint
+from eaglei.doe417 import OPEN_EVENT_HOURS, overlap_summary
+from eaglei.events import event_frame
+from eaglei.ui.data import load_doe417_overlaps, load_doe417_timeline, load_event_store, page_payload
+
+RESTORATION_COLORS = {'reported': '#22c55e', 'inferred': '#3b82f6', 'open': '#ef4444'}
+
+
+def timeline_figure(events):
+    # Plotly cannot serialize pd.NA, so the nullable customer counts go in as floats
+    shown = events.assign(until=events['end'].fillna(events['start'] + pd.Timedelta(hours=OPEN_EVENT_HOURS)), customers=events['customers'].astype('float64'))
+    return px.timeline(shown, x_start='start', x_end='until', y='event_type', color='restoration', color_discrete_map=RESTORATION_COLORS,
+                       hover_data={'Event_ID': True, 'Event_Type': True, 'Area_Affected': True, 'duration_hours': ':.1f', 'customers': True, 'outages': True, 'until': False},
+                       title='DOE-417 Reports (open-ended reports drawn for %d h)' % OPEN_EVENT_HOURS).update_layout(plot_bgcolor='white', height=420)
+
+
+def render():
+    st.markdown('<div class="hero-header"><div class="brand-logo" style="font-size:1.8rem;">🗓️ DOE-417 Timeline</div><div style="color:#e0e1dd;">Major electric disturbances and the county outages overlapping them</div></div>', unsafe_allow_html=True)
+    timeline, pairs, store = load_doe417_timeline(), load_doe417_overlaps(), load_event_store()
+    summary = overlap_summary(timeline, pairs, store)
+    years = summary['start'].dt.year.dropna().astype(int)
+    if not len(years):
+        st.info("No DOE-417 reports with a parseable start time")
+        return
+    c1, c2 = st.columns([2, 3])
+    lo, hi = c1.slider("Years", int(years.min()), int(years.max()), (int(years.min()), int(years.max())))
+    types = c2.multiselect("Event types", list(summary['event_type'].cat.categories), default=list(summary['event_type'].cat.categories))
+    events = summary[summary['start'].dt.year.between(lo, hi) & summary['event_type'].isin(types)]
+    c1, c2, c3, c4, c5 = st.columns(5)
+    c1.metric("Reports", f"{len(events):,}")
+    c2.metric("Restoration Inferred", f"{(events['restoration'] == 'inferred').sum():,}", help="Restoration time given without a date: taken as its first occurrence after the start")
+    c3.metric("Open-Ended", f"{(events['restoration'] == 'open').sum():,}")
+    c4.metric("Median Duration", f"{events['duration_hours'].median():.1f} hrs" if events['duration_hours'].notna().any() else "–")
+    c5.metric("Overlapping Outages", f"{events['outages'].sum():,}")
+    if not len(events):
+        return
+    fig = page_payload('timeline/timeline', {'years': (lo, hi), 'types': tuple(types)}, frame_fingerprint(summary), lambda: timeline_figure(events))
+    st.plotly_chart(fig, use_container_width=True)
+
+    st.markdown("### ⚡ EAGLE-I Outages Overlapping Each Report")
+    st.dataframe(events[['Event_ID', 'start', 'end', 'duration_hours', 'restoration', 'Event_Type', 'Area_Affected', 'customers', 'counties', 'outages', 'outage_customers']],
+                 use_container_width=True, hide_index=True, height=300)
+    matched = events[events['outages'] > 0]
+    if len(matched):
+        event_id = st.selectbox("Report", matched['Event_ID'].tolist(), format_func=lambda i: f"#{i} · {matched.loc[matched['Event_ID'] == i, 'Event_Type'].iloc[0]} · {matched.loc[matched['Event_ID'] == i, 'start'].iloc[0]:%Y-%m-%d}")
+        row = matched.index[matched['Event_ID'] == event_id][0]
+        outages = event_frame(store, np.sort(pairs.loc[pairs['row'] == row, 'event'].to_numpy()))
+        st.dataframe(outages.drop(columns=['latitude', 'longitude', 'population']), use_container_width=True, hide_index=True)
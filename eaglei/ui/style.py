@@ -0,0 +1,17 @@
+"""Page CSS and the shared footer markup."""
+
+CSS = """<style>
+@import url('https://fonts.googleapis.com/css2?family=Orbitron:wght@700&family=Inter:wght@400;600&display=swap');
+.hero-header{background:linear-gradient(135deg,#0a1628 0%,#1b263b 40%,#415a77 100%);padding:2rem;border-radius:20px;color:white;margin-bottom:2rem}
+.brand-logo{font-family:'Orbitron',monospace;font-size:2rem;font-weight:700;background:linear-gradient(90deg,#00d4ff,#00ff88,#ffd700);-webkit-background-clip:text;-webkit-text-fill-color:transparent}
+.real-data-badge{background:linear-gradient(90deg,#22c55e,#16a34a);color:white;padding:0.4rem 1rem;border-radius:20px;font-size:0.8rem;font-weight:700}
+.metric-card{background:white;padding:1rem;border-radius:12px;box-shadow:0 4px 15px rgba(0,0,0,0.08);text-align:center;border-top:4px solid #00d4ff}
+.metric-value{font-family:'Orbitron',monospace;font-size:1.4rem;font-weight:700;color:#1b263b}
+.metric-label{font-size:0.75rem;color:#64748b}
+.legend-box{background:white;padding:1rem;border-radius:10px;box-shadow:0 2px 10px rgba(0,0,0,0.1);margin-top:0.5rem}
+.success-box{background:linear-gradient(135deg,#dcfce7,#bbf7d0);border-left:5px solid #22c55e;padding:1rem;margin:1rem 0;border-radius:0 12px 12px 0}
+.warning-box{background:linear-gradient(135deg,#fef3c7,#fde68a);border-left:5px solid #f59e0b;padding:1rem;margin:1rem 0;border-radius:0 12px 12px 0}
+.footer{background:linear-gradient(135deg,#0a1628,#1b263b);color:white;padding:1.5rem;border-radius:15px;margin-top:2rem;text-align:center}
+</style>"""
+
+FOOTER = '<div class="footer"><div style="font-family:Orbitron;font-size:1.3rem;color:#00d4ff;">⚡ EAGLE-I v3.1</div><p>Victoria Love Franklin | Dr. Sajid Hussain | Dr. Lei Qian<br>Meharry Medical College | DoE SRNL | © 2025</p></div>'
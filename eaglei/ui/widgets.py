@@ -0,0 +1,36 @@
+"""Legend and statistics boxes drawn beside the maps, and the table download control."""
+
+import streamlit as st
+
+from eaglei.exports import EXPORT_FORMATS, FORMAT_LABELS, export_bytes
+from eaglei.ui.data import page_payload
+
+
+def display_moran(moran):
+    I, expected, p = moran
+    st.markdown(f"""<div class="legend-box"><b>🧭 Spatial Autocorrelation</b><br>
+    Moran's I: {I:.3f} (E[I] = {expected:.3f})<br>
+    Permutation p: {p:.3f}{' ✅ clustered' if p < 0.05 and I > expected else ''}</div>""", unsafe_allow_html=True)
+
+
+def display_legend(stats, name):
+    st.markdown(f"""<div class="legend-box"><b>📊 {name}</b><br>
+    🟡 Low: {stats['min']:.1f} - {stats['q25']:.1f}<br>
+    🟠 Moderate: {stats['q25']:.1f} - {stats['median']:.1f}<br>
+    🔴 High: {stats['median']:.1f} - {stats['q75']:.1f}<br>
+    ⬛ Very High: {stats['q75']:.1f} - {stats['max']:.1f}<br>
+    <b>Mean: {stats['mean']:.2f}</b></div>""", unsafe_allow_html=True)
+
+
+def export_download(label, df, stem, page, state, fingerprint):
+    """
+    Format picker and a download button for `df`.
+
+    The button gets a callable, so the file is only encoded when clicked, and the
+    bytes are cached in the payload LRU under `page`, `state` plus the format and `fingerprint`.
+    """
+    c1, c2 = st.columns([1, 3])
+    fmt = c1.selectbox("Format", list(EXPORT_FORMATS), format_func=FORMAT_LABELS.get, key=f'{page}/format', label_visibility='collapsed')
+    ext, mime = EXPORT_FORMATS[fmt]
+    encode = lambda: page_payload(page, {**state, 'format': fmt}, fingerprint, lambda: export_bytes(df, fmt))
+    c2.download_button(f"{label} ({FORMAT_LABELS[fmt]})", encode, f"{stem}.{ext}", mime=mime, on_click='ignore')
@@ -0,0 +1,14 @@
+"""Episode reconstruction from EAGLE-I snapshots."""
+
+import pandas as pd
+
+from eaglei.episodes import EPISODE_COLUMNS, detect_episodes
+
+
+def test_no_snapshot_over_threshold_gives_empty_episodes():
+    snap = pd.DataFrame({'county': pd.Categorical(['Butte', 'Fresno']),
+                         'time': pd.to_datetime(['2023-01-01 00:00', '2023-01-01 00:15']),
+                         'customers_out': pd.Series([0, 0], dtype='int32')})
+    episodes = detect_episodes(snap, workers=1)
+    assert list(episodes.columns) == EPISODE_COLUMNS
+    assert episodes.empty
@@ -0,0 +1,27 @@
+"""High/low quartile filters of the query engine."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from eaglei.query import query_data
+
+
+def _counties(n=58):
+    # Most counties share one utility's mix, so the industrial shares are heavily tied
+    rng = np.random.default_rng(0)
+    industrial = np.where(np.arange(n) < 40, 0.016, rng.choice([0.011, 0.013, 0.02, 0.025], n))
+    return pd.DataFrame({'county': [f'County {i}' for i in range(n)], 'industrial': industrial,
+                         'event_count': rng.integers(0, 50, n), 'avg_duration': rng.uniform(1, 10, n).round(1)})
+
+
+@pytest.mark.parametrize('query, column', [('high industrial', 'industrial'), ('low industrial', 'industrial'),
+                                           ('high events', 'event_count'), ('low duration', 'avg_duration')])
+def test_quartile_filters_never_split_ties(query, column):
+    df = _counties()
+    results, _ = query_data(df, query)
+    kept = df[column].isin(results[column])
+    # Every county sharing a value with a selected county is selected too
+    assert set(results['county']) == set(df.loc[kept, 'county'])
+    # ... whatever the row order
+    assert set(query_data(df.iloc[::-1].reset_index(drop=True), query)[0]['county']) == set(results['county'])